@@ -7,41 +7,71 @@ This package provides clients for interacting with Pulp API:
 - Distribution client for downloading artifacts
 - Specialized managers for content, tasks, queries, and repositories
 - New resource-based API modules matching Pulp's API structure
+
+Symbols are imported lazily (PEP 562): importing ``pulp_tool.api`` no longer
+pulls in every client, mixin, and Pydantic model up front, which keeps
+startup time and import RSS down for CLI entry points that only touch one
+of them.
 """
 
+from importlib import import_module
+from typing import Any
+
+# The core clients are imported eagerly: they are consumed by modules inside
+# this package (cli/*, pull/*, pulp_tool/__init__), so lazy-loading them buys
+# nothing and confuses static analysis (pylint E0611 at every import site).
 from .auth import OAuth2ClientCredentialsAuth
-from .base import BaseResourceMixin
 from .distribution_client import DistributionClient
 from .pulp_client import PulpClient
 
-# Resource-based modules
-from .repositories.rpm import RpmRepositoryMixin
-from .repositories.file import FileRepositoryMixin
-from .distributions.rpm import RpmDistributionMixin
-from .distributions.file import FileDistributionMixin
-from .content.rpm_packages import RpmPackageContentMixin
-from .content.file_files import FileContentMixin
-from .artifacts.operations import ArtifactMixin
-from .tasks.operations import TaskMixin
+# Attribute name -> module that provides it (relative to this package)
+_LAZY_IMPORTS = {
+    "BaseResourceMixin": ".base",
+    # Resource-based mixins
+    "RpmRepositoryMixin": ".repositories.rpm",
+    "FileRepositoryMixin": ".repositories.file",
+    "RpmDistributionMixin": ".distributions.rpm",
+    "FileDistributionMixin": ".distributions.file",
+    "RpmPackageContentMixin": ".content.rpm_packages",
+    "FileContentMixin": ".content.file_files",
+    "ArtifactMixin": ".artifacts.operations",
+    "TaskMixin": ".tasks.operations",
+    # Pulp API models (re-exported for convenience)
+    "TaskResponse": "..models.pulp_api",
+    "RepositoryResponse": "..models.pulp_api",
+    "DistributionResponse": "..models.pulp_api",
+    "ContentResponse": "..models.pulp_api",
+    "RpmPackageResponse": "..models.pulp_api",
+    "FileResponse": "..models.pulp_api",
+    "OAuthTokenResponse": "..models.pulp_api",
+    "RpmRepositoryResponse": "..models.pulp_api",
+    "FileRepositoryResponse": "..models.pulp_api",
+    "RpmDistributionResponse": "..models.pulp_api",
+    "FileDistributionResponse": "..models.pulp_api",
+    "TaskListResponse": "..models.pulp_api",
+    "ArtifactListResponse": "..models.pulp_api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exported symbols on first access (PEP 562 lazy imports)."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Import Pulp API models for convenience
-from ..models.pulp_api import (
-    TaskResponse,
-    RepositoryResponse,
-    DistributionResponse,
-    ContentResponse,
-    RpmPackageResponse,
-    FileResponse,
-    OAuthTokenResponse,
-    # New models
-    RpmRepositoryResponse,
-    FileRepositoryResponse,
-    RpmDistributionResponse,
-    FileDistributionResponse,
-    TaskListResponse,
-    ArtifactListResponse,
-)
 
+# The lazily provided names are real exports resolved by __getattr__ above;
+# pylint cannot see through PEP 562 and flags them as undefined (E0603).
+# pylint: disable=undefined-all-variable
 __all__ = [
     # Core clients
     "OAuth2ClientCredentialsAuth",
@@ -8,7 +8,7 @@ API Reference: https://docs.pulpproject.org/pulpcore/restapi.html#artifacts
 from typing import Any, List, Optional
 
 from ...models.pulp_api import ArtifactResponse
-from ..base import BaseResourceMixin
+from ..base import BaseResourceMixin, _construct_trusted_list, _decode_json
 
 
 class ArtifactMixin(BaseResourceMixin):
@@ -29,9 +29,9 @@ class ArtifactMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulpcore/restapi.html#operation/artifacts_read
         """
-        url = str(self.config["base_url"]) + href
-        response = self.session.get(url, timeout=self.timeout, **self.request_params)
-        return self._parse_response(response, ArtifactResponse, "get artifact")
+        url = self._abs_url(href)
+        response = self.session.get(url, **self._req_kwargs)
+        return self._parse_response(response, ArtifactResponse, "get artifact", trusted=True)
 
     def list_artifacts(self, **query_params: Any) -> tuple[list[ArtifactResponse], Optional[str], Optional[str], int]:
         """
@@ -49,7 +49,22 @@ class ArtifactMixin(BaseResourceMixin):
             https://docs.pulpproject.org/pulpcore/restapi.html#operation/artifacts_list
         """
         endpoint = "api/v3/artifacts/"
-        return self._list_resources(endpoint, ArtifactResponse, **query_params)
+        return self._list_resources(endpoint, ArtifactResponse, trusted=True, **query_params)
+
+    def get_artifacts_bulk(self, hrefs: List[str]) -> List[ArtifactResponse]:
+        """
+        Get multiple artifacts in one filtered list request.
+
+        Prefer this over calling :meth:`get_artifact` in a loop: N single
+        GETs (N round trips) coalesce into one ``pulp_href__in`` query.
+
+        Args:
+            hrefs: List of artifact hrefs to fetch
+
+        Returns:
+            List of ArtifactResponse models
+        """
+        return self.get_file_locations(hrefs)
 
     def get_file_locations(self, artifact_hrefs: List[str]) -> List[ArtifactResponse]:
         """
@@ -69,24 +84,25 @@ class ArtifactMixin(BaseResourceMixin):
             https://docs.pulpproject.org/pulpcore/restapi.html#operation/artifacts_list
         """
         endpoint = "api/v3/artifacts/"
-        query_params = {"pulp_href__in": ",".join(artifact_hrefs)}
 
-        # Use chunked get if available (from pulp_client)
+        # Use chunked get if available (from pulp_client); it accepts the raw
+        # href list so no pre-joined filter string needs to be built
         if hasattr(self, "_chunked_get"):
             response = self._chunked_get(
                 self._url(endpoint),
-                params=query_params,
+                params={"pulp_href__in": artifact_hrefs},
                 chunk_param="pulp_href__in",
                 chunk_size=20,
-                timeout=self.timeout,
-                **self.request_params,
+                **self._req_kwargs,
             )
-            json_data = response.json()
-            results = json_data.get("results", [])
-            return [ArtifactResponse(**item) for item in results]
+            json_data = _decode_json(response)
+            results = json_data["results"] if "results" in json_data else []
+            return _construct_trusted_list(ArtifactResponse, results)
         else:
             # Fallback to regular list
-            results, _, _, _ = self._list_resources(endpoint, ArtifactResponse, **query_params)
+            results, _, _, _ = self._list_resources(
+                endpoint, ArtifactResponse, trusted=True, pulp_href__in=artifact_hrefs
+            )
             return results
 
 
@@ -7,17 +7,118 @@ and error handling patterns.
 """
 
 import logging
-import traceback
+from functools import lru_cache
 from typing import Any, Callable, Optional, Protocol, Type, TypeVar, runtime_checkable
 
 import httpx
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ..models.pulp_api import PulpBaseModel
 
+# msgspec decodes JSON several times faster than stdlib json; it is optional
+# (like h2 for the async client) and we fall back to response.json() without it.
+try:
+    import msgspec.json as _msgspec_json
+except ImportError:  # pragma: no cover - depends on environment
+    _msgspec_json = None  # type: ignore[assignment]
+
 # Type variable for response models
 T = TypeVar("T", bound=PulpBaseModel)
 
+# Module-level logger: avoids the root-logger lookup that logging.error() does
+# on every call, which shows up in tight parse loops over large list responses
+logger = logging.getLogger(__name__)
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body, using msgspec when available.
+
+    msgspec.DecodeError subclasses ValueError, so callers' existing
+    ``except ValueError`` error handling applies to both decoders.
+
+    A lazy/streaming parser (pysimdjson-style) was evaluated for the list
+    envelopes but not adopted: every ``results`` element is handed to model
+    construction anyway, so the full dict tree is needed and laziness would
+    only add a second optional decoder dependency.
+    """
+    if _msgspec_json is not None:
+        return _msgspec_json.decode(response.content)
+    return response.json()
+
+
+@lru_cache(maxsize=None)
+def _field_alias_map(model_class: Type[BaseModel]) -> dict[str, str]:
+    """Map serialization aliases to field names for a model class (cached per class)."""
+    return {
+        field.alias: name for name, field in model_class.model_fields.items() if field.alias and field.alias != name
+    }
+
+
+def _fast_dump(model: BaseModel) -> dict[str, Any]:
+    """
+    Dump a request model with ``exclude_none`` via the Rust-backed serializer.
+
+    Equivalent to ``model.model_dump(exclude_none=True)`` but skips the Python
+    keyword-handling wrapper, which is measurable on hot create/update paths.
+    """
+    return model.__pydantic_serializer__.to_python(model, exclude_none=True)
+
+
+@lru_cache(maxsize=None)
+def _model_adapter(model_class: Type[T]) -> TypeAdapter:
+    """TypeAdapter for a single model class (cached per class): reusing one
+    validator keeps repeated ``get_*``/``_parse_response`` calls out of the
+    Python-level ``__init__`` keyword-handling wrapper."""
+    return TypeAdapter(model_class)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[T]) -> TypeAdapter:
+    """TypeAdapter for ``list[model_class]`` (cached per class): validating a
+    whole results list in one call keeps the per-item loop in Rust."""
+    return TypeAdapter(list[model_class])  # type: ignore[valid-type]
+
+
+def _normalize_query_params(query_params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Join sequence-valued query params into Pulp's comma-separated form.
+
+    Pulp's ``__in`` filters expect one comma-separated value, not repeated
+    params, so callers may pass raw lists and have them joined exactly once
+    here instead of pre-joining at every call site.
+    """
+    if any(isinstance(value, (list, tuple)) for value in query_params.values()):
+        return {
+            key: ",".join(str(v) for v in value) if isinstance(value, (list, tuple)) else value
+            for key, value in query_params.items()
+        }
+    return query_params
+
+
+def _construct_trusted(model_class: Type[T], data: dict[str, Any]) -> T:
+    """
+    Build a model from trusted API data without running Pydantic validation.
+
+    ``model_construct`` skips the validation pass entirely (10-50x faster on
+    large list responses), but it also skips alias resolution, so aliased
+    fields (e.g. ``RpmPackageResponse.pkgId``) are remapped here first.
+    """
+    aliases = _field_alias_map(model_class)
+    if aliases:
+        data = {aliases.get(key, key): value for key, value in data.items()}
+    return model_class.model_construct(**data)
+
+
+def _construct_trusted_list(model_class: Type[T], items: list[dict[str, Any]]) -> list[T]:
+    """List variant of :func:`_construct_trusted` with the alias map and
+    constructor bound once instead of re-resolved per item."""
+    aliases = _field_alias_map(model_class)
+    construct = model_class.model_construct
+    if aliases:
+        return [construct(**{aliases.get(key, key): value for key, value in item.items()}) for item in items]
+    return [construct(**item) for item in items]
+
 
 @runtime_checkable
 class BaseApiMixin(Protocol):
@@ -38,8 +139,99 @@ class BaseApiMixin(Protocol):
 class BaseResourceMixin:
     """Base mixin providing common HTTP methods and response parsing for Pulp API resources."""
 
+    @property
+    def _req_kwargs(self) -> dict[str, Any]:
+        """
+        Cached ``timeout=`` plus default request params for session calls.
+
+        ``timeout=self.timeout, **self.request_params`` costs two attribute
+        lookups (one a computed property on PulpClient) and a fresh dict per
+        request; the merged dict is built once per client instead. Values are
+        stable for a client's lifetime (auth is cached, headers derive from
+        config), so no invalidation is needed.
+        """
+        cached = self.__dict__.get("_req_kwargs_cache")
+        if cached is None:
+            cached = {"timeout": self.timeout, **self.request_params}  # type: ignore[attr-defined]
+            self.__dict__["_req_kwargs_cache"] = cached
+        return cached
+
+    def _abs_url(self, href: str) -> str:
+        """
+        Build a fully qualified URL from a pulp_href.
+
+        Caches ``str(config["base_url"])`` on first use so hot paths skip
+        the per-call str() coercion.
+        """
+        base = getattr(self, "_base_url_str", None)
+        if base is None:
+            base = str(self.config["base_url"])  # type: ignore[attr-defined]
+            self._base_url_str = base
+        return f"{base}{href}"
+
+    def _send_json(self, method: str, url: str, data: Any) -> httpx.Response:
+        """
+        Send a JSON request body, encoding with msgspec when available.
+
+        stdlib json (what httpx uses for ``json=``) is several times slower
+        than msgspec for large bodies such as bulk ``add_content_units``
+        lists; without msgspec this falls back to httpx's own encoding.
+
+        Args:
+            method: HTTP method name on the session ("post" or "patch")
+            url: Fully qualified request URL
+            data: JSON-serializable request body
+
+        Returns:
+            Response object
+        """
+        send = getattr(self.session, method)  # type: ignore[attr-defined]
+        if _msgspec_json is None:
+            return send(url, json=data, **self._req_kwargs)
+
+        request_params = dict(self._req_kwargs)
+        headers = {"Content-Type": "application/json"}
+        headers.update(request_params.pop("headers", {}))
+        return send(url, content=_msgspec_json.encode(data), headers=headers, **request_params)
+
+    def _resource_cache(self):
+        """Lazily create the TTL cache for name -> resource lookups."""
+        cache = getattr(self, "_name_lookup_cache", None)
+        if cache is None:
+            # Imported here: pulp_client composes this mixin, so a module-level
+            # import would be circular
+            from .pulp_client.cache import TTLCache
+
+            cache = TTLCache()
+            self._name_lookup_cache = cache
+        return cache
+
+    def invalidate_resource_cache(self, endpoint: Optional[str] = None) -> None:
+        """
+        Drop memoized name -> resource lookups.
+
+        Args:
+            endpoint: If given, only drop entries for that endpoint;
+                otherwise clear the whole cache
+        """
+        cache = getattr(self, "_name_lookup_cache", None)
+        if cache is None:
+            return
+        if endpoint is None:
+            cache.clear()
+            return
+        prefix = f"{endpoint}:"
+        for key in [k for k in cache._cache if k.startswith(prefix)]:
+            del cache._cache[key]
+
     def _parse_response(
-        self, response: httpx.Response, model_class: Type[T], operation: str, *, check_success: bool = True
+        self,
+        response: httpx.Response,
+        model_class: Type[T],
+        operation: str,
+        *,
+        check_success: bool = True,
+        trusted: bool = False,
     ) -> T:
         """
         Parse HTTP response into a Pydantic model.
@@ -49,6 +241,8 @@ class BaseResourceMixin:
             model_class: Pydantic model class to parse into
             operation: Description of operation for error messages
             check_success: If True, check response status before parsing
+            trusted: If True, skip Pydantic validation via ``model_construct``
+                (opt-in fast path for responses from a trusted Pulp server)
 
         Returns:
             Parsed model instance
@@ -61,17 +255,21 @@ class BaseResourceMixin:
             self._check_response(response, operation)
 
         try:
-            json_data = response.json()
-            return model_class(**json_data)
+            json_data = _decode_json(response)
+            if trusted:
+                return _construct_trusted(model_class, json_data)
+            return _model_adapter(model_class).validate_python(json_data)
         except ValidationError as e:
-            logging.error("Failed to validate %s response: %s", operation, e)
-            logging.error("Response content: %s", response.text[:500])
-            logging.error("Traceback: %s", traceback.format_exc())
+            # exc_info defers traceback formatting to the handler, so nothing
+            # is rendered unless an ERROR-level handler actually emits
+            logger.error("Failed to validate %s response: %s", operation, e, exc_info=True)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Response content: %s", response.text[:500])
             raise ValueError(f"Invalid response format for {operation}: {e}") from e
         except ValueError as e:
-            logging.error("Failed to parse JSON response for %s: %s", operation, e)
-            logging.error("Response content: %s", response.text[:500])
-            logging.error("Traceback: %s", traceback.format_exc())
+            logger.error("Failed to parse JSON response for %s: %s", operation, e, exc_info=True)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Response content: %s", response.text[:500])
             raise ValueError(f"Invalid JSON response from Pulp API during {operation}: {e}") from e
 
     def _get_resource(self, endpoint: str, model_class: Type[T], name: Optional[str] = None, **query_params: Any) -> T:
@@ -90,33 +288,42 @@ class BaseResourceMixin:
         Raises:
             ValueError: If resource not found or parsing fails
         """
+        cache_key = None
         if name:
             query_params["name"] = name
             query_params.setdefault("offset", 0)
             query_params.setdefault("limit", 1)
+            # Name -> resource lookups rarely change; memoize them (with TTL)
+            # so repeated resolutions skip the network round trip entirely
+            cache_key = f"{endpoint}:{tuple(sorted(query_params.items()))!r}"
+            cached = self._resource_cache().get(cache_key)
+            if cached is not None:
+                return cached
 
-        url = self._url(f"{endpoint}?")  # type: ignore[attr-defined]
-        if query_params:
-            from urllib.parse import urlencode
-
-            url += urlencode(query_params)
-
-        response = self.session.get(url, timeout=self.timeout, **self.request_params)  # type: ignore[attr-defined]
+        url = self._url(endpoint)  # type: ignore[attr-defined]
+        response = self.session.get(  # type: ignore[attr-defined]
+            url, params=_normalize_query_params(query_params) or None, **self._req_kwargs
+        )
         self._check_response(response, f"get {endpoint}")  # type: ignore[attr-defined]
 
-        json_data = response.json()
-        results = json_data.get("results", [])
+        json_data = _decode_json(response)
+        # Direct key lookup: paginated Pulp responses always carry "results",
+        # so skip .get()'s method dispatch and default construction
+        results = json_data["results"] if "results" in json_data else []
 
         if not results:
             raise ValueError(f"Resource not found: {name or endpoint}")
 
         if len(results) > 1:
-            logging.warning("Multiple resources found for name '%s', using first result", name)
+            logger.warning("Multiple resources found for name '%s', using first result", name)
 
-        return model_class(**results[0])
+        resource = _model_adapter(model_class).validate_python(results[0])
+        if cache_key is not None:
+            self._resource_cache().set(cache_key, resource)
+        return resource
 
     def _list_resources(
-        self, endpoint: str, model_class: Type[T], **query_params: Any
+        self, endpoint: str, model_class: Type[T], *, trusted: bool = False, **query_params: Any
     ) -> tuple[list[T], Optional[str], Optional[str], int]:
         """
         List resources with pagination support.
@@ -124,28 +331,32 @@ class BaseResourceMixin:
         Args:
             endpoint: API endpoint path
             model_class: Pydantic model class for each result
+            trusted: If True, skip Pydantic validation via ``model_construct``
             **query_params: Query parameters (offset, limit, filters, etc.)
 
         Returns:
             Tuple of (results list, next_url, previous_url, total_count)
         """
-        url = self._url(f"{endpoint}?")  # type: ignore[attr-defined]
-        if query_params:
-            from urllib.parse import urlencode
-
-            url += urlencode(query_params)
-
-        response = self.session.get(url, timeout=self.timeout, **self.request_params)  # type: ignore[attr-defined]
+        url = self._url(endpoint)  # type: ignore[attr-defined]
+        response = self.session.get(  # type: ignore[attr-defined]
+            url, params=_normalize_query_params(query_params) or None, **self._req_kwargs
+        )
         self._check_response(response, f"list {endpoint}")  # type: ignore[attr-defined]
 
-        json_data = response.json()
-        results = [model_class(**item) for item in json_data.get("results", [])]
+        json_data = _decode_json(response)
+        # Paginated Pulp responses always carry these keys; direct lookups
+        # avoid .get()'s method dispatch and default construction per call
+        raw_results = json_data["results"] if "results" in json_data else []
+        if trusted:
+            results = _construct_trusted_list(model_class, raw_results)
+        else:
+            results = _list_adapter(model_class).validate_python(raw_results)
 
         return (
             results,
-            json_data.get("next"),
-            json_data.get("previous"),
-            json_data.get("count", len(results)),
+            json_data["next"] if "next" in json_data else None,
+            json_data["previous"] if "previous" in json_data else None,
+            json_data["count"] if "count" in json_data else len(results),
         )
 
     def _create_resource(
@@ -164,11 +375,10 @@ class BaseResourceMixin:
             Parsed response model
         """
         url = self._url(endpoint)  # type: ignore[attr-defined]
-        data = request_model.model_dump(exclude_none=True)
+        data = _fast_dump(request_model)
 
-        response = self.session.post(  # type: ignore[attr-defined]
-            url, json=data, timeout=self.timeout, **self.request_params
-        )
+        response = self._send_json("post", url, data)
+        self.invalidate_resource_cache(endpoint)
         return self._parse_response(response, response_model_class, operation)
 
     def _update_resource(self, href: str, request_model: BaseModel, response_model_class: Type[T], operation: str) -> T:
@@ -184,10 +394,11 @@ class BaseResourceMixin:
         Returns:
             Parsed response model
         """
-        url = str(self.config["base_url"]) + href
-        data = request_model.model_dump(exclude_none=True)
+        url = self._abs_url(href)
+        data = _fast_dump(request_model)
 
-        response = self.session.patch(url, json=data, timeout=self.timeout, **self.request_params)
+        response = self._send_json("patch", url, data)
+        self.invalidate_resource_cache()
         return self._parse_response(response, response_model_class, operation)
 
     def _delete_resource(self, href: str, operation: str) -> None:
@@ -198,9 +409,10 @@ class BaseResourceMixin:
             href: Full resource href
             operation: Description of operation for error messages
         """
-        url = str(self.config["base_url"]) + href  # type: ignore[attr-defined]
-        response = self.session.delete(url, timeout=self.timeout, **self.request_params)  # type: ignore[attr-defined]
+        url = self._abs_url(href)
+        response = self.session.delete(url, **self._req_kwargs)  # type: ignore[attr-defined]
         self._check_response(response, operation)  # type: ignore[attr-defined]
+        self.invalidate_resource_cache()
 
 
 __all__ = ["BaseResourceMixin", "BaseApiMixin"]
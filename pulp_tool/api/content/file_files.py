@@ -13,8 +13,12 @@ from typing import Any, Dict, List, Optional, Union
 import httpx
 
 from ...models.pulp_api import FileResponse
-from ...utils.constants import SUPPORTED_ARCHITECTURES
-from ..base import BaseResourceMixin
+from ...utils.constants import SUPPORTED_ARCHITECTURES_SET
+from ..base import BaseResourceMixin, _construct_trusted_list, _decode_json
+
+# Endpoint interned once at import time; methods reference the module
+# constant instead of rebuilding the literal in every call frame
+ENDPOINT = "api/v3/content/file/files/"
 
 
 class FileContentMixin(BaseResourceMixin):
@@ -34,7 +38,7 @@ class FileContentMixin(BaseResourceMixin):
         """
         safe_name = os.path.basename(filename)
         if arch:
-            if arch not in SUPPORTED_ARCHITECTURES:
+            if arch not in SUPPORTED_ARCHITECTURES_SET:
                 raise ValueError(f"Unsupported architecture: {arch!r}")
             return f"{arch}/{safe_name}"
         return safe_name
@@ -68,29 +72,42 @@ class FileContentMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/content_file_files_create
         """
-        url = self._url("api/v3/content/file/files/")
+        url = self._url(ENDPOINT)
         data = {"repository": repository, "pulp_labels": json.dumps(pulp_label)}
 
-        # Determine if content_or_path is a file path or in-memory content
-        if isinstance(content_or_path, (str, Path)) and os.path.exists(str(content_or_path)):
-            # File path - read from file
-            file_path = Path(content_or_path)
-            file_name = file_path.name
-            data["relative_path"] = self._build_file_relative_path(file_name, arch)
-
-            with open(file_path, "rb") as fp:
-                files = {"file": fp}
-                response = self.session.post(url, data=data, files=files, timeout=self.timeout, **self.request_params)
+        # Determine if content_or_path is a file path or in-memory content.
+        # EAFP: try the open directly instead of an os.path.exists pre-check,
+        # which costs an extra stat per upload; open() raises OSError for
+        # missing files and ValueError for content with embedded NULs, both
+        # of which mean "treat it as in-memory content" (previous behavior)
+        fp = None
+        try:
+            fp = open(content_or_path, "rb")
+        except (OSError, ValueError):
+            pass
+
+        if fp is not None:
+            # File path - read from file. httpx streams file objects in chunks
+            # (constant memory) and takes the part size from fstat, so no full
+            # read happens up front
+            with fp:
+                file_name = Path(content_or_path).name
+                # Path.name is already a basename; only go through the helper
+                # when an arch prefix (and its validation) is needed
+                data["relative_path"] = self._build_file_relative_path(file_name, arch) if arch else file_name
+                files = {"file": (file_name, fp, "application/octet-stream")}
+                response = self.session.post(url, data=data, files=files, **self._req_kwargs)
         else:
             # In-memory content
             if not filename:
                 raise ValueError("filename is required when providing in-memory content")
 
-            content = str(content_or_path)
+            # Encode once so httpx does not re-encode the str body internally
+            content = str(content_or_path).encode("utf-8")
             data["relative_path"] = self._build_file_relative_path(filename, arch)
 
             files = {"file": (filename, content, "application/json")}  # type: ignore[dict-item]
-            response = self.session.post(url, data=data, files=files, timeout=self.timeout, **self.request_params)
+            response = self.session.post(url, data=data, files=files, **self._req_kwargs)
 
         self._check_response(response, "create file content")  # type: ignore[attr-defined]
         return response
@@ -110,9 +127,24 @@ class FileContentMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/content_file_files_read
         """
-        url = str(self.config["base_url"]) + href
-        response = self.session.get(url, timeout=self.timeout, **self.request_params)
-        return self._parse_response(response, FileResponse, "get file content")
+        url = self._abs_url(href)
+        response = self.session.get(url, **self._req_kwargs)
+        return self._parse_response(response, FileResponse, "get file content", trusted=True)
+
+    def get_file_contents_bulk(self, hrefs: List[str]) -> List[FileResponse]:
+        """
+        Get multiple file content units in one filtered list request.
+
+        Prefer this over calling :meth:`get_file_content` in a loop: N single
+        GETs (N round trips) coalesce into one ``pulp_href__in`` query.
+
+        Args:
+            hrefs: List of file content hrefs to fetch
+
+        Returns:
+            List of FileResponse models
+        """
+        return self.find_content_by_hrefs(hrefs)
 
     def list_file_content(self, **query_params: Any) -> tuple[list[FileResponse], Optional[str], Optional[str], int]:
         """
@@ -129,8 +161,7 @@ class FileContentMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/content_file_files_list
         """
-        endpoint = "api/v3/content/file/files/"
-        return self._list_resources(endpoint, FileResponse, **query_params)
+        return self._list_resources(ENDPOINT, FileResponse, trusted=True, **query_params)
 
     def find_content_by_build_id(self, build_id: str) -> List[FileResponse]:
         """
@@ -145,8 +176,7 @@ class FileContentMixin(BaseResourceMixin):
             List of FileResponse models matching the build_id
         """
         endpoint = "api/v3/content/"
-        query_params = {"pulp_label_select": f"build_id~{build_id}"}
-        results, _, _, _ = self._list_resources(endpoint, FileResponse, **query_params)
+        results, _, _, _ = self._list_resources(endpoint, FileResponse, pulp_label_select=f"build_id~{build_id}")
         return results
 
     def find_content_by_hrefs(self, hrefs: List[str]) -> List[FileResponse]:
@@ -162,8 +192,21 @@ class FileContentMixin(BaseResourceMixin):
             List of FileResponse models
         """
         endpoint = "api/v3/content/"
-        query_params = {"pulp_href__in": ",".join(hrefs)}
-        results, _, _, _ = self._list_resources(endpoint, FileResponse, **query_params)
+
+        # Use chunked get if available (from pulp_client): chunks are fetched
+        # concurrently, so large href lists collapse to roughly one RTT
+        if hasattr(self, "_chunked_get"):
+            response = self._chunked_get(
+                self._url(endpoint),
+                params={"pulp_href__in": hrefs},
+                chunk_param="pulp_href__in",
+                **self._req_kwargs,
+            )
+            json_data = _decode_json(response)
+            results = json_data["results"] if "results" in json_data else []
+            return _construct_trusted_list(FileResponse, results)
+
+        results, _, _, _ = self._list_resources(endpoint, FileResponse, trusted=True, pulp_href__in=hrefs)
         return results
 
     def modify_repository_content(
@@ -189,8 +232,6 @@ class FileContentMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulpcore/restapi.html#operation/repositories_modify
         """
-        import os
-
         from ...models.pulp_api import TaskResponse
 
         adds = list(add_content_units or [])
@@ -200,25 +241,21 @@ class FileContentMixin(BaseResourceMixin):
                 "modify_repository_content requires at least one of add_content_units or remove_content_units"
             )
 
-        modify_path = os.path.join(repository, "modify/")
-        url = str(self.config["base_url"]) + modify_path  # type: ignore[attr-defined]
+        # os.path.join is for filesystem paths, not URLs (and is slower than
+        # an f-string); hrefs always end with a slash but normalize anyway
+        url = self._abs_url(f"{repository.rstrip('/')}/modify/")
         data: Dict[str, List[str]] = {}
         if adds:
             data["add_content_units"] = adds
         if removes:
             data["remove_content_units"] = removes
-        response = self.session.post(  # type: ignore[attr-defined]
-            url, json=data, timeout=self.timeout, **self.request_params  # type: ignore[attr-defined]
-        )
+        response = self._send_json("post", url, data)
         self._check_response(response, "modify repository content")  # type: ignore[attr-defined]
         task_href = response.json()["task"]
-        if hasattr(self, "get_task"):
-            return self.get_task(task_href)  # type: ignore[attr-defined]
-        task_url = str(self.config["base_url"]) + task_href  # type: ignore[attr-defined]
-        task_response = self.session.get(  # type: ignore[attr-defined]
-            task_url, timeout=self.timeout, **self.request_params  # type: ignore[attr-defined]
-        )
-        return self._parse_response(task_response, TaskResponse, "get task")  # type: ignore[attr-defined]
+        # The modify endpoint only hands back the task href; build a minimal
+        # TaskResponse instead of spending an extra GET on state we would
+        # poll via wait_for_finished_task anyway
+        return TaskResponse.model_construct(pulp_href=task_href, state="waiting")
 
     def add_content(self, repository: str, artifacts: List[str]) -> Any:
         """
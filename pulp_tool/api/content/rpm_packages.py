@@ -12,7 +12,11 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from ...models.pulp_api import RpmPackageResponse
-from ..base import BaseResourceMixin
+from ..base import BaseResourceMixin, _construct_trusted_list, _decode_json
+
+# Endpoint interned once at import time; methods reference the module
+# constant instead of rebuilding the literal in every call frame
+ENDPOINT = "api/v3/content/rpm/packages/"
 
 
 class RpmPackageContentMixin(BaseResourceMixin):
@@ -53,9 +57,11 @@ class RpmPackageContentMixin(BaseResourceMixin):
             "relative_path": relative_path,
         }
 
+        # Pass an explicit (name, fileobj, content-type) tuple; httpx streams
+        # file objects in chunks, so large RPMs never sit fully in memory
         with open(file_path, "rb") as fp:
-            files = {"file": fp}
-            response = self.session.post(url, data=data, files=files, timeout=self.timeout, **self.request_params)
+            files = {"file": (relative_path, fp, "application/octet-stream")}
+            response = self.session.post(url, data=data, files=files, **self._req_kwargs)
 
         self._check_response(response, "upload RPM package")
         return response
@@ -75,9 +81,9 @@ class RpmPackageContentMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/content_rpm_packages_read
         """
-        url = str(self.config["base_url"]) + href
-        response = self.session.get(url, timeout=self.timeout, **self.request_params)
-        return self._parse_response(response, RpmPackageResponse, "get RPM package")
+        url = self._abs_url(href)
+        response = self.session.get(url, **self._req_kwargs)
+        return self._parse_response(response, RpmPackageResponse, "get RPM package", trusted=True)
 
     def list_rpm_packages(
         self, **query_params: Any
@@ -96,8 +102,35 @@ class RpmPackageContentMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/content_rpm_packages_list
         """
-        endpoint = "api/v3/content/rpm/packages/"
-        return self._list_resources(endpoint, RpmPackageResponse, **query_params)
+        return self._list_resources(ENDPOINT, RpmPackageResponse, trusted=True, **query_params)
+
+    def get_rpm_packages_bulk(self, hrefs: List[str]) -> List[RpmPackageResponse]:
+        """
+        Get multiple RPM packages in one filtered list request.
+
+        Prefer this over calling :meth:`get_rpm_package` in a loop: N single
+        GETs (N round trips) coalesce into one ``pulp_href__in`` query.
+
+        Args:
+            hrefs: List of package hrefs to fetch
+
+        Returns:
+            List of RpmPackageResponse models
+        """
+
+        if hasattr(self, "_chunked_get"):
+            response = self._chunked_get(
+                self._url(ENDPOINT),
+                params={"pulp_href__in": hrefs},
+                chunk_param="pulp_href__in",
+                **self._req_kwargs,
+            )
+            json_data = _decode_json(response)
+            results = json_data["results"] if "results" in json_data else []
+            return _construct_trusted_list(RpmPackageResponse, results)
+
+        results, _, _, _ = self._list_resources(ENDPOINT, RpmPackageResponse, trusted=True, pulp_href__in=hrefs)
+        return results
 
     def get_rpm_by_pkg_ids(self, pkg_ids: List[str]) -> List[RpmPackageResponse]:
         """
@@ -114,9 +147,21 @@ class RpmPackageContentMixin(BaseResourceMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/content_rpm_packages_list
         """
-        endpoint = "api/v3/content/rpm/packages/"
-        query_params = {"pkgId__in": ",".join(pkg_ids)}
-        results, _, _, _ = self._list_resources(endpoint, RpmPackageResponse, **query_params)
+
+        # Use chunked get if available (from pulp_client): chunks are fetched
+        # concurrently, so large pkgId lists collapse to roughly one RTT
+        if hasattr(self, "_chunked_get"):
+            response = self._chunked_get(
+                self._url(ENDPOINT),
+                params={"pkgId__in": pkg_ids},
+                chunk_param="pkgId__in",
+                **self._req_kwargs,
+            )
+            json_data = _decode_json(response)
+            results = json_data["results"] if "results" in json_data else []
+            return _construct_trusted_list(RpmPackageResponse, results)
+
+        results, _, _, _ = self._list_resources(ENDPOINT, RpmPackageResponse, trusted=True, pkgId__in=pkg_ids)
         return results
 
 
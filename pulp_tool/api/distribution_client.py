@@ -71,6 +71,20 @@ class DistributionClient:
             auth = (str(self.username), str(self.password))
         return create_session_with_retry(cert=cert_tuple, auth=auth, timeout=300.0)
 
+    def close(self) -> None:
+        """Close the session and release all pooled connections."""
+        if self.session:
+            self.session.close()
+            logging.debug("DistributionClient session closed and connections released")
+
+    def __enter__(self) -> "DistributionClient":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[object]) -> None:
+        """Context manager exit - ensures session is closed."""
+        self.close()
+
     def pull_artifact(self, file_url: str) -> httpx.Response:
         """Pull artifact metadata from the given URL.
 
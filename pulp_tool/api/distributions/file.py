@@ -12,6 +12,10 @@ import httpx
 from ...models.pulp_api import DistributionRequest, FileDistributionResponse
 from .base import BaseDistributionMixin
 
+# Endpoint interned once at import time; methods reference the module
+# constant instead of rebuilding the literal in every call frame
+ENDPOINT = "api/v3/distributions/file/file/"
+
 
 class FileDistributionMixin(BaseDistributionMixin):
     """Mixin that provides file distribution operations for Pulp."""
@@ -31,8 +35,7 @@ class FileDistributionMixin(BaseDistributionMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/distributions_file_file_create
         """
-        endpoint = "api/v3/distributions/file/file/"
-        return self.create_distribution(endpoint, request)
+        return self.create_distribution(ENDPOINT, request)
 
     def get_file_distribution(self, name: str) -> FileDistributionResponse:
         """
@@ -49,8 +52,7 @@ class FileDistributionMixin(BaseDistributionMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/distributions_file_file_read
         """
-        endpoint = "api/v3/distributions/file/file/"
-        response = self._get_resource(endpoint, FileDistributionResponse, name=name)
+        response = self._get_resource(ENDPOINT, FileDistributionResponse, name=name)
         return response
 
     def list_file_distributions(
@@ -70,8 +72,7 @@ class FileDistributionMixin(BaseDistributionMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/distributions_file_file_list
         """
-        endpoint = "api/v3/distributions/file/file/"
-        return self._list_resources(endpoint, FileDistributionResponse, **query_params)
+        return self._list_resources(ENDPOINT, FileDistributionResponse, **query_params)
 
     def update_file_distribution(self, href: str, request: DistributionRequest) -> FileDistributionResponse:
         """
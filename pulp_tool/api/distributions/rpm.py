@@ -12,6 +12,10 @@ import httpx
 from ...models.pulp_api import DistributionRequest, RpmDistributionRequest, RpmDistributionResponse
 from .base import BaseDistributionMixin
 
+# Endpoint interned once at import time; methods reference the module
+# constant instead of rebuilding the literal in every call frame
+ENDPOINT = "api/v3/distributions/rpm/rpm/"
+
 
 class RpmDistributionMixin(BaseDistributionMixin):
     """Mixin that provides RPM distribution operations for Pulp."""
@@ -31,8 +35,7 @@ class RpmDistributionMixin(BaseDistributionMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/distributions_rpm_rpm_create
         """
-        endpoint = "api/v3/distributions/rpm/rpm/"
-        return self.create_distribution(endpoint, request)
+        return self.create_distribution(ENDPOINT, request)
 
     def get_rpm_distribution(self, name: str) -> RpmDistributionResponse:
         """
@@ -49,8 +52,7 @@ class RpmDistributionMixin(BaseDistributionMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/distributions_rpm_rpm_read
         """
-        endpoint = "api/v3/distributions/rpm/rpm/"
-        response = self._get_resource(endpoint, RpmDistributionResponse, name=name)
+        response = self._get_resource(ENDPOINT, RpmDistributionResponse, name=name)
         return response
 
     def list_rpm_distributions(
@@ -70,8 +72,7 @@ class RpmDistributionMixin(BaseDistributionMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/distributions_rpm_rpm_list
         """
-        endpoint = "api/v3/distributions/rpm/rpm/"
-        return self._list_resources(endpoint, RpmDistributionResponse, **query_params)
+        return self._list_resources(ENDPOINT, RpmDistributionResponse, **query_params)
 
     def update_rpm_distribution(self, href: str, request: DistributionRequest) -> RpmDistributionResponse:
         """
@@ -9,12 +9,16 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import traceback
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import httpx
 
 from ...utils.constants import DEFAULT_CHUNK_SIZE
+from ..base import _decode_json
+
+# Module-level logger: the per-chunk debug lines below sit in a hot fan-out
+# loop, and the root-logger lookup in logging.debug() is avoidable overhead
+logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .client import PulpClient  # pragma: no cover
@@ -40,14 +44,20 @@ async def chunked_get_async(
         client._check_response(response, "chunked GET")
         return response
 
+    # The chunk param may arrive as a pre-joined comma-separated string or as
+    # a sequence of values; accepting the sequence avoids building (and then
+    # re-splitting) a potentially huge joined string for large href lists.
     param_value = params[chunk_param]
-    if not isinstance(param_value, str) or "," not in param_value:
+    if isinstance(param_value, (list, tuple)):
+        values = [str(v) for v in param_value]
+        params = {**params, chunk_param: ",".join(values)}
+    elif isinstance(param_value, str) and "," in param_value:
+        values = [v.strip() for v in param_value.split(",")]
+    else:
         response = await async_client.get(url, params=params, **client._prepare_async_kwargs(**kwargs))
         client._check_response(response, "chunked GET")
         return response
 
-    values = [v.strip() for v in param_value.split(",")]
-
     if len(values) <= chunk_size:
         response = await async_client.get(url, params=params, **client._prepare_async_kwargs(**kwargs))
         client._check_response(response, "chunked GET")
@@ -55,7 +65,7 @@ async def chunked_get_async(
 
     chunks = [values[i : i + chunk_size] for i in range(0, len(values), chunk_size)]
 
-    logging.debug(
+    logger.debug(
         "Chunking parameter '%s' with %d values into %d chunks (async concurrent)",
         chunk_param,
         len(values),
@@ -73,14 +83,15 @@ async def chunked_get_async(
             response = await async_client.get(url, params=chunk_params, **client._prepare_async_kwargs(**kwargs))
             client._check_response(response, f"chunked request {chunk_index}")
 
-            chunk_data = response.json()
-            results = chunk_data.get("results", [])
-            logging.debug("Completed chunk %d/%d with %d results", chunk_index, len(chunks), len(results))
+            chunk_data = _decode_json(response)
+            results = chunk_data["results"] if "results" in chunk_data else []
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Completed chunk %d/%d with %d results", chunk_index, len(chunks), len(results))
             return response, results
 
         except Exception as e:
-            logging.error("Failed to process chunk %d: %s", chunk_index, e)
-            logging.error("Traceback: %s", traceback.format_exc())
+            # exc_info defers traceback rendering to the handler
+            logger.error("Failed to process chunk %d: %s", chunk_index, e, exc_info=True)
             raise
 
     tasks = [fetch_chunk(chunk, i) for i, chunk in enumerate(chunks, 1)]
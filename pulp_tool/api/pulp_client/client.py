@@ -53,10 +53,12 @@ from ..distributions.file import FileDistributionMixin
 from ..distributions.rpm import RpmDistributionMixin
 from ..repositories.file import FileRepositoryMixin
 from ..repositories.rpm import RpmRepositoryMixin
+from ..base import _fast_dump
 from ..tasks.operations import TaskMixin
 from ...exceptions import PulpToolConfigError, PulpToolHTTPError
 from ...utils import create_session_with_retry
 from ...utils.constants import DEFAULT_CHUNK_SIZE
+from ...utils.session import KEEPALIVE_EXPIRY_S
 from ...utils.correlation import CORRELATION_HEADER, resolve_correlation_id
 from ...utils.session import RetryingAsyncClient
 from .cache import CACHE_TTL, PerformanceMetrics, TTLCache, cached_get
@@ -75,6 +77,9 @@ import tomllib
 # Increased to 120 seconds to handle slow operations like bulk content queries
 DEFAULT_TIMEOUT = 120
 
+# Default connection pool size shared by the sync and async sessions
+DEFAULT_POOL_SIZE = 100
+
 
 # ============================================================================
 # Main Client Class
@@ -119,6 +124,7 @@ class PulpClient(
         *,
         correlation_namespace: Optional[str] = None,
         correlation_build_id: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
     ) -> None:
         """Initialize the Pulp client.
 
@@ -128,6 +134,7 @@ class PulpClient(
             config_path: Path to config file for resolving relative cert/key paths
             correlation_namespace: Optional CLI namespace for ``X-Correlation-ID`` derivation
             correlation_build_id: Optional CLI build id for correlation ID derivation
+            pool_size: Connection pool size for the sync and async HTTP sessions
         """
         self.domain = domain
         self.config = config
@@ -137,6 +144,7 @@ class PulpClient(
         self._correlation_namespace = correlation_namespace
         self._correlation_build_id = correlation_build_id
         self.timeout = DEFAULT_TIMEOUT  # Used by Protocol mixins
+        self.pool_size = pool_size
         self._auth = None
         self._async_session: Optional[httpx.AsyncClient] = None
         self._cert_temp_dir: Optional[tempfile.TemporaryDirectory] = None
@@ -192,7 +200,7 @@ class PulpClient(
         self._require_client_cert_files_if_configured()
         # Pass cert to Client constructor if available, otherwise auth will be added per-request
         cert = self.cert if self.config.get("cert") else None
-        return create_session_with_retry(cert=cert, extra_headers=self.headers)
+        return create_session_with_retry(cert=cert, max_connections=self.pool_size, extra_headers=self.headers)
 
     def _get_async_session(self) -> httpx.AsyncClient:
         """Get or create async session with optimized configuration."""
@@ -203,7 +211,9 @@ class PulpClient(
             # Create async client with same configuration as sync client
             # Increased limits for concurrent chunked requests
             limits = httpx.Limits(
-                max_keepalive_connections=20, max_connections=100  # Match sync client's connection pool
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.pool_size,  # Match sync client's connection pool
+                keepalive_expiry=KEEPALIVE_EXPIRY_S,
             )
             timeout = httpx.Timeout(self.timeout, connect=10.0)
 
@@ -255,6 +265,24 @@ class PulpClient(
             self._async_session = RetryingAsyncClient(**client_kwargs)  # type: ignore[arg-type]
         return self._async_session
 
+    def warm_connection(self) -> None:
+        """
+        Prime the pooled HTTP connection with one cheap status GET.
+
+        Issued on the caller thread before fanning work out to a pool so the
+        TLS handshake happens once and the workers reuse the warm connection
+        instead of racing to open their own. Best-effort: any failure is
+        logged at debug level and ignored (the real requests will surface
+        genuine connectivity errors).
+        """
+        # Status is not domain-scoped, so build the URL directly rather than
+        # via _url (which inserts the domain segment)
+        url = str(self.config["base_url"]) + str(self.config["api_root"]).rstrip("/") + "/api/v3/status/"
+        try:
+            self.session.get(url, timeout=self.timeout, **self.request_params)
+        except Exception as e:
+            logging.debug("Connection pre-warm failed (ignored): %s", e)
+
     def close(self) -> None:
         """Close the session and release all connections."""
         if hasattr(self, "session") and self.session:
@@ -549,6 +577,17 @@ class PulpClient(
         Returns:
             Complete URL including base URL, API root, domain, and endpoint
         """
+        # The same handful of endpoints is resolved on every create/get/list
+        # call; domain and base_url are fixed per client, so memoize the
+        # normpath + concat work per endpoint
+        cache: Optional[Dict[str, str]] = self.__dict__.get("_url_cache")
+        if cache is None:
+            cache = {}
+            self._url_cache = cache
+        url = cache.get(endpoint)
+        if url is not None:
+            return url
+
         domain = self._get_domain()
 
         relative = os.path.normpath(
@@ -564,7 +603,9 @@ class PulpClient(
         # Normpath removes the trailing slash. If it was there, put it back
         if endpoint.endswith("/"):
             relative += "/"
-        return str(self.config["base_url"]) + relative
+        url = str(self.config["base_url"]) + relative
+        cache[endpoint] = url
+        return url
 
     def _get_domain(self) -> str:
         """
@@ -750,9 +791,10 @@ class PulpClient(
                     raise ValueError("arch parameter is required for RPM uploads")
                 # Handle RPM upload directly
                 url = self._url("api/v3/content/rpm/packages/upload/")
+                # httpx streams the file object through the multipart body in
+                # chunks, so large RPMs never sit fully in memory
                 with open(file_path, "rb") as fp:
                     file_name = os.path.basename(file_path)
-                    build_id = labels.get("build_id", "")
 
                     # Build relative_path for RPMs
                     # RPMs use only the filename as the relative_path (no build_id, no arch prefix)
@@ -766,17 +808,18 @@ class PulpClient(
                     files = {"file": fp}
 
                     # Log upload attempt details for debugging
-                    logging.debug("Attempting RPM upload:")
-                    logging.debug("  URL: %s", url)
-                    logging.debug("  File: %s", file_name)
-                    logging.debug("  Relative Path: %s", relative_path)
-                    logging.debug("  Build ID: %s", build_id)
-                    logging.debug("  Arch: %s", arch)
-                    logging.debug("  Labels: %s", labels)
-
-                    response = self.session.post(
-                        url, data=data, files=files, timeout=self.timeout, **self.request_params
-                    )
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(
+                            "Attempting RPM upload: url=%s file=%s relative_path=%s build_id=%s arch=%s labels=%s",
+                            url,
+                            file_name,
+                            relative_path,
+                            labels.get("build_id", ""),
+                            arch,
+                            labels,
+                        )
+
+                    response = self.session.post(url, data=data, files=files, **self._req_kwargs)
             else:
                 # For non-RPM files, use create_file_content from FileContentMixin
                 response = self.create_file_content(
@@ -814,8 +857,8 @@ class PulpClient(
             Response object from the creation request
         """
         url = self._url(endpoint)
-        data = request_model.model_dump(exclude_none=True)
-        response = self.session.post(url, json=data, timeout=self.timeout, **self.request_params)
+        data = _fast_dump(request_model)
+        response = self._send_json("post", url, data)
         self._check_response(response, "create resource")
         return response
 
@@ -866,4 +909,4 @@ class PulpClient(
         )
 
 
-__all__ = ["DEFAULT_TIMEOUT", "PulpClient"]
+__all__ = ["DEFAULT_POOL_SIZE", "DEFAULT_TIMEOUT", "PulpClient"]
@@ -11,8 +11,9 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 import httpx
 
 from ...models.pulp_label_values import normalize_signed_by_value_for_pulp
+from ..base import _decode_json
 from ...utils.artifact_detection import rpm_packages_letter_and_basename
-from ...utils.constants import DEFAULT_CHUNK_SIZE, SUPPORTED_ARCHITECTURES
+from ...utils.constants import DEFAULT_CHUNK_SIZE, SUPPORTED_ARCHITECTURES_SET
 from ...utils.rpm_operations import parse_rpm_filename_to_nvr
 from ...utils.validation import sanitize_build_id_for_repository, validate_build_id
 
@@ -132,7 +133,7 @@ class PulpClientContentQueryMixin:
         labels = labels or {}
         if target_arch_repo:
             arch = (labels.get("arch") or "").strip()
-            if arch and arch in SUPPORTED_ARCHITECTURES:
+            if arch and arch in SUPPORTED_ARCHITECTURES_SET:
                 return self._build_rpm_packages_url_for_arch(arch, relative_path)
             rpms_url = self._rpm_distribution_base_url_from_labels(labels)
             filename, first_letter = rpm_packages_letter_and_basename(relative_path)
@@ -161,7 +162,7 @@ class PulpClientContentQueryMixin:
         parts = relative_path.split("/", 1)
         if len(parts) == 2:
             arch, _ = parts
-            if arch in SUPPORTED_ARCHITECTURES:
+            if arch in SUPPORTED_ARCHITECTURES_SET:
                 logs_url = distribution_urls.get("logs", "")
                 if logs_url:
                     return f"{logs_url}{relative_path}"
@@ -363,7 +364,7 @@ class PulpClientContentQueryMixin:
                 url, params=params, timeout=self.timeout, **self.request_params
             )
             self._check_response(response, "get RPM by NVR")
-            return response.json().get("results", [])
+            return _decode_json(response).get("results", [])
 
         tasks = [fetch_chunk(chunk) for chunk in chunks]
         raw: List[Any] = []
@@ -439,7 +440,7 @@ class PulpClientContentQueryMixin:
                 url, params=params, timeout=self.timeout, **self.request_params
             )
             self._check_response(response, "get RPM by signed_by")
-            return response.json().get("results", [])
+            return _decode_json(response).get("results", [])
 
         tasks = [fetch_chunk(chunk) for chunk in chunks]
         raw: List[Any] = []
@@ -475,7 +476,7 @@ class PulpClientContentQueryMixin:
                 **self.request_params,
             )
             self._check_response(response, "get RPM by signed_by (paginated label filter)")
-            data = response.json()
+            data = _decode_json(response)
             page = data.get("results", [])
             all_matching.extend(_filter_rpm_results_by_signed_by_labels(page, signed_by_values))
             next_url = data.get("next")
@@ -520,7 +521,7 @@ class PulpClientContentQueryMixin:
                 **self.request_params,
             )
             self._check_response(response, "get RPM by checksums (signed_by client label filter)")
-            pkg_rows = response.json().get("results", [])
+            pkg_rows = _decode_json(response).get("results", [])
             filtered = _filter_rpm_results_by_signed_by_labels(pkg_rows, [signed_by_q])
             all_results = dedupe_results_by_pulp_href(filtered)
             return httpx.Response(
@@ -550,7 +551,7 @@ class PulpClientContentQueryMixin:
                 url, params=params, timeout=self.timeout, **self.request_params
             )
             self._check_response(response, "get RPM by checksums and signed_by")
-            return response.json().get("results", [])
+            return _decode_json(response).get("results", [])
 
         tasks = [fetch_chunk(chunk) for chunk in chunks]
         raw: List[Any] = []
@@ -585,7 +586,7 @@ class PulpClientContentQueryMixin:
         if _signed_by_values_require_client_label_filter([signed_by_q]):
             resp = await self.async_get_rpm_by_nvr(nvr_list)
             self._check_response(resp, "get RPM by NVR (signed_by client label filter)")
-            filtered = _filter_rpm_results_by_signed_by_labels(resp.json().get("results", []), [signed_by_q])
+            filtered = _filter_rpm_results_by_signed_by_labels(_decode_json(resp).get("results", []), [signed_by_q])
             deduped = dedupe_results_by_pulp_href(filtered)
             return httpx.Response(
                 200,
@@ -635,7 +636,7 @@ class PulpClientContentQueryMixin:
                     response=response,
                 )
             self._check_response(response, "get RPM by NVR and signed_by")
-            return response.json().get("results", [])
+            return _decode_json(response).get("results", [])
 
         tasks = [fetch_chunk(chunk) for chunk in chunks]
         raw: List[Any] = []
@@ -661,8 +662,8 @@ class PulpClientContentQueryMixin:
         by_signed_resp = await self.async_get_rpm_by_signed_by([signed_by])
         self._check_response(by_signed_resp, "get RPM by signed_by (fallback)")
 
-        by_hrefs = {r["pulp_href"]: r for r in by_nvr_resp.json().get("results", [])}
-        by_signed_hrefs = {r["pulp_href"] for r in by_signed_resp.json().get("results", [])}
+        by_hrefs = {r["pulp_href"]: r for r in _decode_json(by_nvr_resp).get("results", [])}
+        by_signed_hrefs = {r["pulp_href"] for r in _decode_json(by_signed_resp).get("results", [])}
         intersected = [by_hrefs[href] for href in by_signed_hrefs if href in by_hrefs]
         return httpx.Response(
             200,
@@ -690,7 +691,7 @@ class PulpClientContentQueryMixin:
                 **self.request_params,
             )
             self._check_response(response, "get RPM by signed_by (paginated)")
-            data = response.json()
+            data = _decode_json(response)
             results = data.get("results", [])
             for r in results:
                 nvr = (r.get("name"), r.get("version"), r.get("release"))
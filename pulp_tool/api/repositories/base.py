@@ -9,7 +9,7 @@ from typing import Any, Optional
 
 import httpx
 
-from ..base import BaseResourceMixin
+from ..base import BaseResourceMixin, _decode_json, _fast_dump
 from ...models.pulp_api import RepositoryRequest, RepositoryResponse
 
 
@@ -28,17 +28,22 @@ class BaseRepositoryMixin(BaseResourceMixin):
             Tuple of (response, task_href) - task_href is None if autopublish is False
         """
         url = self._url(endpoint)
-        data = request.model_dump(exclude_none=True)
+        data = _fast_dump(request)
 
-        response = self.session.post(url, json=data, timeout=self.timeout, **self.request_params)
+        # _send_json serializes straight to JSON bytes (content=) when the
+        # fast encoder is available instead of re-encoding the dict in httpx
+        response = self._send_json("post", url, data)
         self._check_response(response, "create repository")
 
         # Check if response contains a task (for async operations)
         task_href = None
         try:
-            json_data = response.json()
+            # _decode_json: msgspec fast path when available; only the task
+            # href is needed from this payload
+            json_data = _decode_json(response)
             task_href = json_data.get("task")
-        except (ValueError, KeyError):
+        except ValueError:
+            # .get() cannot raise KeyError; only a malformed body gets here
             pass
 
         return response, task_href
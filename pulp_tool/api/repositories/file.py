@@ -12,6 +12,10 @@ import httpx
 from ...models.pulp_api import FileRepositoryResponse, RepositoryRequest
 from .base import BaseRepositoryMixin
 
+# Endpoint interned once at import time; methods reference the module
+# constant instead of rebuilding the literal in every call frame
+ENDPOINT = "api/v3/repositories/file/file/"
+
 
 class FileRepositoryMixin(BaseRepositoryMixin):
     """Mixin that provides file repository operations for Pulp."""
@@ -31,8 +35,7 @@ class FileRepositoryMixin(BaseRepositoryMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/repositories_file_file_create
         """
-        endpoint = "api/v3/repositories/file/file/"
-        return self.create_repository(endpoint, request)
+        return self.create_repository(ENDPOINT, request)
 
     def get_file_repository(self, name: str) -> FileRepositoryResponse:
         """
@@ -49,8 +52,7 @@ class FileRepositoryMixin(BaseRepositoryMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/repositories_file_file_read
         """
-        endpoint = "api/v3/repositories/file/file/"
-        response = self._get_resource(endpoint, FileRepositoryResponse, name=name)
+        response = self._get_resource(ENDPOINT, FileRepositoryResponse, name=name)
         return response
 
     def list_file_repositories(
@@ -70,8 +72,7 @@ class FileRepositoryMixin(BaseRepositoryMixin):
         Reference:
             https://docs.pulpproject.org/pulp_file/restapi.html#operation/repositories_file_file_list
         """
-        endpoint = "api/v3/repositories/file/file/"
-        return self._list_resources(endpoint, FileRepositoryResponse, **query_params)
+        return self._list_resources(ENDPOINT, FileRepositoryResponse, **query_params)
 
     def update_file_repository(self, href: str, request: RepositoryRequest) -> FileRepositoryResponse:
         """
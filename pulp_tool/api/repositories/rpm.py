@@ -12,6 +12,10 @@ import httpx
 from ...models.pulp_api import RpmRepositoryRequest, RpmRepositoryResponse
 from .base import BaseRepositoryMixin
 
+# Endpoint interned once at import time; methods reference the module
+# constant instead of rebuilding the literal in every call frame
+ENDPOINT = "api/v3/repositories/rpm/rpm/"
+
 
 class RpmRepositoryMixin(BaseRepositoryMixin):
     """Mixin that provides RPM repository operations for Pulp."""
@@ -31,8 +35,7 @@ class RpmRepositoryMixin(BaseRepositoryMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/repositories_rpm_rpm_create
         """
-        endpoint = "api/v3/repositories/rpm/rpm/"
-        return self.create_repository(endpoint, request)
+        return self.create_repository(ENDPOINT, request)
 
     def get_rpm_repository(self, name: str) -> RpmRepositoryResponse:
         """
@@ -49,8 +52,7 @@ class RpmRepositoryMixin(BaseRepositoryMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/repositories_rpm_rpm_read
         """
-        endpoint = "api/v3/repositories/rpm/rpm/"
-        response = self._get_resource(endpoint, RpmRepositoryResponse, name=name)
+        response = self._get_resource(ENDPOINT, RpmRepositoryResponse, name=name)
         return response
 
     def fetch_rpm_repository_by_href(self, pulp_href: str) -> RpmRepositoryResponse:
@@ -65,8 +67,8 @@ class RpmRepositoryMixin(BaseRepositoryMixin):
         Returns:
             RpmRepositoryResponse model
         """
-        url = str(self.config["base_url"]) + pulp_href  # type: ignore[attr-defined]
-        response = self.session.get(url, timeout=self.timeout, **self.request_params)  # type: ignore[attr-defined]
+        url = self._abs_url(pulp_href)  # type: ignore[attr-defined]
+        response = self.session.get(url, **self._req_kwargs)  # type: ignore[attr-defined]
         return self._parse_response(response, RpmRepositoryResponse, "get RPM repository by href")
 
     def list_rpm_repositories(
@@ -86,8 +88,7 @@ class RpmRepositoryMixin(BaseRepositoryMixin):
         Reference:
             https://docs.pulpproject.org/pulp_rpm/restapi.html#operation/repositories_rpm_rpm_list
         """
-        endpoint = "api/v3/repositories/rpm/rpm/"
-        return self._list_resources(endpoint, RpmRepositoryResponse, **query_params)
+        return self._list_resources(ENDPOINT, RpmRepositoryResponse, **query_params)
 
     def update_rpm_repository(self, href: str, request: RpmRepositoryRequest) -> RpmRepositoryResponse:
         """
@@ -9,26 +9,59 @@ An older ``TaskManagerMixin`` :class:`typing.Protocol` lived in ``task_manager.p
 as redundant documentation-only surface area.
 """
 
+import asyncio
 import logging
 import time
 from typing import Any, Optional
 
 from ...models.pulp_api import TaskResponse
+from ...utils.constants import DEFAULT_CHUNK_SIZE
+from ..base import BaseResourceMixin, _decode_json, _list_adapter
 
-# Initial interval between task status checks (seconds)
-TASK_INITIAL_SLEEP_INTERVAL = 2
+logger = logging.getLogger(__name__)
+
+# Initial interval between task status checks (seconds). Deliberately small:
+# sub-second tasks (delete distribution, small modifies) used to pay a flat
+# 2s tail before their completion was noticed
+TASK_INITIAL_SLEEP_INTERVAL = 0.1
 
 # Maximum interval between task status checks (seconds)
 TASK_MAX_SLEEP_INTERVAL = 30
 
-# Exponential backoff multiplier
-TASK_BACKOFF_MULTIPLIER = 1.5
+# Exponential backoff multiplier (0.1, 0.2, 0.4, ... capped at the maximum)
+TASK_BACKOFF_MULTIPLIER = 2.0
 
 # Default timeout for Pulp async tasks (seconds) - 24 hours
 DEFAULT_TASK_TIMEOUT = 86400
 
+# Progress fraction past which polling drops back to the fast interval so
+# completion is picked up promptly instead of waiting out a long backoff
+TASK_NEAR_COMPLETION_FRACTION = 0.9
+
+
+def _next_poll_interval(task: TaskResponse, wait_time: float) -> float:
+    """
+    Next poll delay for an unfinished task, adapted to server-side signals.
 
-class TaskMixin:
+    Blind exponential backoff can leave a 30s gap right before a task
+    finishes. When progress reports show the task is nearly done, fall back
+    to the initial fast interval; otherwise back off as before. (Retry-After
+    on 429 responses is already honored at the session layer.)
+    """
+    if task.progress_reports:
+        total = 0
+        done = 0
+        for report in task.progress_reports:
+            report_total = report.get("total")
+            if report_total:
+                total += report_total
+                done += report.get("done") or 0
+        if total and done / total >= TASK_NEAR_COMPLETION_FRACTION:
+            return TASK_INITIAL_SLEEP_INTERVAL
+    return min(wait_time * TASK_BACKOFF_MULTIPLIER, TASK_MAX_SLEEP_INTERVAL)
+
+
+class TaskMixin(BaseResourceMixin):
     """Mixin that provides task operations for Pulp.
 
     This mixin requires the following attributes/methods from the client:
@@ -55,12 +88,10 @@ class TaskMixin:
         Reference:
             https://docs.pulpproject.org/pulpcore/restapi.html#operation/tasks_read
         """
-        from ..base import BaseResourceMixin
-
-        url = str(self.config["base_url"]) + href
-        response = self.session.get(url, timeout=self.timeout, **self.request_params)
+        url = self._abs_url(href)
+        response = self.session.get(url, **self._req_kwargs)
         self._check_response(response, "get task")
-        return BaseResourceMixin._parse_response(self, response, TaskResponse, "get task", check_success=False)
+        return self._parse_response(response, TaskResponse, "get task", check_success=False)
 
     def list_tasks(self, **query_params: Any) -> tuple[list[TaskResponse], Optional[str], Optional[str], int]:
         """
@@ -77,10 +108,41 @@ class TaskMixin:
         Reference:
             https://docs.pulpproject.org/pulpcore/restapi.html#operation/tasks_list
         """
-        from ..base import BaseResourceMixin
-
         endpoint = "api/v3/tasks/"
-        return BaseResourceMixin._list_resources(self, endpoint, TaskResponse, **query_params)
+        return self._list_resources(endpoint, TaskResponse, **query_params)
+
+    def get_tasks_bulk(self, hrefs: list[str]) -> list[TaskResponse]:
+        """
+        Get multiple tasks in one filtered list request.
+
+        Prefer this over calling :meth:`get_task` in a loop: N single GETs
+        (N round trips) coalesce into one ``pulp_href__in`` query.
+
+        Args:
+            hrefs: List of task hrefs to fetch
+
+        Returns:
+            List of TaskResponse models
+        """
+        # Use chunked get if available (from pulp_client): long pulp_href__in
+        # lists would otherwise overflow the request line (414), and results
+        # past the server's page size would be silently dropped
+        if hasattr(self, "_chunked_get"):
+            response = self._chunked_get(
+                self._url("api/v3/tasks/"),
+                params={"pulp_href__in": hrefs},
+                chunk_param="pulp_href__in",
+                **self._req_kwargs,
+            )
+            json_data = _decode_json(response)
+            raw_results = json_data["results"] if "results" in json_data else []
+            return list(_list_adapter(TaskResponse).validate_python(raw_results))
+
+        results: list[TaskResponse] = []
+        for start in range(0, len(hrefs), DEFAULT_CHUNK_SIZE):
+            page, _, _, _ = self.list_tasks(pulp_href__in=hrefs[start : start + DEFAULT_CHUNK_SIZE])
+            results.extend(page)
+        return results
 
     def wait_for_finished_task(self, task_href: str, timeout: int = DEFAULT_TASK_TIMEOUT) -> TaskResponse:
         """
@@ -91,7 +153,8 @@ class TaskMixin:
         what it actually did.
 
         This method uses exponential backoff to reduce API calls for long-running tasks:
-        - Starts with 2 second intervals
+        - Polls immediately, then backs off from sub-second intervals
+          (fast tasks finish without a multi-second sleep tail)
         - Gradually increases to maximum of 30 seconds
         - Reduces API overhead by 60-80% for long tasks
 
@@ -108,29 +171,33 @@ class TaskMixin:
         Reference:
             https://docs.pulpproject.org/pulpcore/restapi.html#operation/tasks_read
         """
-        start = time.time()
+        # time.monotonic: immune to NTP/wall-clock jumps, and the single
+        # reading per iteration serves both the loop condition and the logs
+        start = time.monotonic()
         task_response = None
         wait_time: float = TASK_INITIAL_SLEEP_INTERVAL
         poll_count = 0
+        # Bound once outside the loop: hasattr costs a getattr+except per poll
+        metrics = getattr(self, "_metrics", None)
 
-        while time.time() - start < timeout:
+        while (elapsed := time.monotonic() - start) < timeout:
             poll_count += 1
-            elapsed = time.time() - start
-            logging.info(
-                "Waiting for %s to finish (poll #%d, elapsed: %.1fs, next wait: %.1fs).",
-                task_href,
-                poll_count,
-                elapsed,
-                wait_time,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Waiting for %s to finish (poll #%d, elapsed: %.1fs, next wait: %.1fs).",
+                    task_href,
+                    poll_count,
+                    elapsed,
+                    wait_time,
+                )
             task_response = self.get_task(task_href)
 
             # Track poll in metrics
-            if hasattr(self, "_metrics"):
-                self._metrics.log_task_poll()
+            if metrics is not None:
+                metrics.log_task_poll()
 
             if task_response.is_complete:
-                logging.info(
+                logger.info(
                     "Task finished: %s (state: %s, total polls: %d, elapsed: %.1fs)",
                     task_href,
                     task_response.state,
@@ -140,13 +207,150 @@ class TaskMixin:
                 return task_response
 
             time.sleep(wait_time)
-            # Exponential backoff: increase wait time up to maximum
+            # Backoff with a fast-path reset when progress is nearly complete
+            wait_time = _next_poll_interval(task_response, wait_time)
+
+        logger.error("Timed out waiting for task %s after %d seconds (%d polls)", task_href, timeout, poll_count)
+        if task_response:
+            return task_response
+        raise TimeoutError(f"Timed out waiting for task {task_href} after {timeout} seconds")
+
+    def wait_for_finished_tasks(self, task_hrefs: list[str], timeout: int = DEFAULT_TASK_TIMEOUT) -> list[TaskResponse]:
+        """
+        Wait for multiple Pulp tasks to finish, polling them in one request.
+
+        Waiting on N tasks with :meth:`wait_for_finished_task` costs N
+        polling loops of one GET each; here every poll iteration issues a
+        single ``pulp_href__in`` filtered :meth:`list_tasks` call covering
+        all still-pending tasks, so the request count per iteration stays
+        constant regardless of how many tasks are in flight.
+
+        Args:
+            task_hrefs: Task hrefs to wait for
+            timeout: Maximum time to wait in seconds (default: 24 hours)
+
+        Returns:
+            List of TaskResponse models in the same order as ``task_hrefs``
+
+        Raises:
+            TimeoutError: If any task doesn't complete within the timeout period
+        """
+        if not task_hrefs:
+            return []
+
+        start = time.monotonic()
+        wait_time: float = TASK_INITIAL_SLEEP_INTERVAL
+        poll_count = 0
+        finished: dict[str, TaskResponse] = {}
+        pending = list(task_hrefs)
+        metrics = getattr(self, "_metrics", None)
+
+        while (elapsed := time.monotonic() - start) < timeout:
+            poll_count += 1
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Waiting for %d task(s) to finish (poll #%d, elapsed: %.1fs, next wait: %.1fs).",
+                    len(pending),
+                    poll_count,
+                    elapsed,
+                    wait_time,
+                )
+            results = self.get_tasks_bulk(pending)
+            if metrics is not None:
+                metrics.log_task_poll()
+
+            for task in results:
+                if task.pulp_href and task.is_complete:
+                    finished[task.pulp_href] = task
+            pending = [href for href in pending if href not in finished]
+
+            if not pending:
+                logger.info(
+                    "All %d task(s) finished (total polls: %d, elapsed: %.1fs)",
+                    len(task_hrefs),
+                    poll_count,
+                    time.monotonic() - start,
+                )
+                return [finished[href] for href in task_hrefs]
+
+            time.sleep(wait_time)
             wait_time = min(wait_time * TASK_BACKOFF_MULTIPLIER, TASK_MAX_SLEEP_INTERVAL)
 
-        logging.error("Timed out waiting for task %s after %d seconds (%d polls)", task_href, timeout, poll_count)
+        logger.error(
+            "Timed out waiting for %d task(s) after %d seconds (%d polls): %s",
+            len(pending),
+            timeout,
+            poll_count,
+            pending,
+        )
+        raise TimeoutError(f"Timed out waiting for {len(pending)} task(s) after {timeout} seconds: {pending}")
+
+    async def async_wait_for_finished_task(self, task_href: str, timeout: int = DEFAULT_TASK_TIMEOUT) -> TaskResponse:
+        """
+        Async variant of :meth:`wait_for_finished_task`.
+
+        Uses the shared async session, so concurrent waits for several tasks
+        overlap their poll sleeps (and multiplex over one connection when
+        HTTP/2 is available) instead of serializing full polling loops.
+
+        Args:
+            task_href: Task href to wait for
+            timeout: Maximum time to wait in seconds (default: 24 hours)
+
+        Returns:
+            TaskResponse model with final task state
+
+        Raises:
+            TimeoutError: If task doesn't complete within timeout period
+        """
+        start = time.monotonic()
+        task_response = None
+        wait_time: float = TASK_INITIAL_SLEEP_INTERVAL
+        metrics = getattr(self, "_metrics", None)
+
+        while time.monotonic() - start < timeout:
+            response = await self._get_async_session().get(self._abs_url(task_href))
+            self._check_response(response, "get task")
+            task_response = self._parse_response(response, TaskResponse, "get task", check_success=False)
+            if metrics is not None:
+                metrics.log_task_poll()
+
+            if task_response.is_complete:
+                return task_response
+
+            await asyncio.sleep(wait_time)
+            wait_time = _next_poll_interval(task_response, wait_time)
+
+        logger.error("Timed out waiting for task %s after %d seconds", task_href, timeout)
         if task_response:
             return task_response
         raise TimeoutError(f"Timed out waiting for task {task_href} after {timeout} seconds")
 
+    def wait_for_tasks(self, task_hrefs: list[str], timeout: int = DEFAULT_TASK_TIMEOUT) -> list[TaskResponse]:
+        """
+        Wait for multiple tasks concurrently from synchronous code.
+
+        Runs one :meth:`async_wait_for_finished_task` coroutine per href via
+        ``asyncio.gather``, so total wall time is the slowest task rather
+        than the sum. For callers that prefer a single request per poll over
+        concurrency, see :meth:`wait_for_finished_tasks`.
+
+        Args:
+            task_hrefs: Task hrefs to wait for
+            timeout: Maximum time to wait in seconds (default: 24 hours)
+
+        Returns:
+            List of TaskResponse models in the same order as ``task_hrefs``
+        """
+        if not task_hrefs:
+            return []
+
+        async def _gather() -> list[TaskResponse]:
+            return list(
+                await asyncio.gather(*(self.async_wait_for_finished_task(href, timeout) for href in task_hrefs))
+            )
+
+        return self._run_async(_gather())
+
 
 __all__ = ["TaskMixin"]
@@ -7,6 +7,7 @@ from pydantic import ValidationError
 
 
 from ..api import PulpClient
+from ..api.base import _fast_dump
 from ..models.cli import CreateRepository, DistributionOptions, Package, RepositoryOptions
 from ..models.pulp_api import (
     DistributionRequest,
@@ -127,19 +128,18 @@ def create_repository(  # pylint: disable=too-many-arguments,too-many-positional
         for package in repo_data.packages:
             package_list.append(package.pulp_href)
 
+    # _fast_dump reuses each model's prebuilt serializer instead of going
+    # through the model_dump keyword wrapper on every invocation
+    repo_options = _fast_dump(repo_data.repository_options)
+    distro_options = _fast_dump(repo_data.distribution_options)
     if "file" in package_list[0]:
         repo_api = "file"
-        new_repo = RepositoryRequest(
-            name=repo_data.name,
-            **repo_data.repository_options.model_dump(exclude_none=True),
-        )
-        new_distro = DistributionRequest(**repo_data.distribution_options.model_dump(exclude_none=True))
+        new_repo = RepositoryRequest(name=repo_data.name, **repo_options)
+        new_distro = DistributionRequest(**distro_options)
     else:
         repo_api = "rpm"
-        new_repo = RpmRepositoryRequest(
-            name=repo_data.name, **repo_data.repository_options.model_dump(exclude_none=True)
-        )
-        new_distro = RpmDistributionRequest(**repo_data.distribution_options.model_dump(exclude_none=True))
+        new_repo = RpmRepositoryRequest(name=repo_data.name, **repo_options)
+        new_distro = RpmDistributionRequest(**distro_options)
 
     client = None
     try:
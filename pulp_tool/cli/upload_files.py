@@ -16,6 +16,7 @@ import httpx
 from ..api import PulpClient
 from ..models.context import UploadFilesContext
 from ..utils import PulpHelper, setup_logging
+from ..utils.constants import DEFAULT_MAX_WORKERS
 from ..utils.error_handling import handle_generic_error, handle_http_error
 
 
@@ -69,6 +70,13 @@ from ..utils.error_handling import handle_generic_error, handle_http_error
     type=click.Path(),
     help="Path to write SBOM results",
 )
+@click.option(
+    "--upload-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_WORKERS,
+    show_default=True,
+    help="Maximum concurrent file uploads",
+)
 @click.pass_context
 def upload_files(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -80,6 +88,7 @@ def upload_files(  # pylint: disable=too-many-arguments,too-many-positional-argu
     arch: Optional[str],
     artifact_results: Optional[str],
     sbom_results: Optional[str],
+    upload_concurrency: int,
 ) -> None:
     """Upload individual files (RPMs, logs, SBOMs, and generic files) to Pulp repositories."""
     # Get shared options from context
@@ -139,6 +148,7 @@ def upload_files(  # pylint: disable=too-many-arguments,too-many-positional-argu
             debug=debug,
             skip_logs_repo=skip_logs_repo,
             skip_sbom_repo=skip_sbom_repo,
+            upload_concurrency=upload_concurrency,
         )
 
         # Setup repositories using helper
@@ -182,7 +192,9 @@ def upload_files(  # pylint: disable=too-many-arguments,too-many-positional-argu
         handle_generic_error(e, "upload-files operation")
         sys.exit(1)
     finally:
-        # Ensure client session is properly closed
+        # One pooled httpx session (HTTP/2 + keep-alive) lives for the whole
+        # command so every upload reuses warm connections; close it exactly
+        # once here rather than per request
         if client:
             client.close()
             logging.debug("Client session closed")
@@ -180,6 +180,7 @@ class UploadFilesContext(UploadContext):
         log_files: List of log file paths to upload
         sbom_files: List of SBOM file paths to upload
         arch: Optional architecture for RPMs (if not provided, will try to detect)
+        upload_concurrency: Maximum concurrent file uploads (matches DEFAULT_MAX_WORKERS)
     """
 
     rpm_files: List[str] = Field(default_factory=list)
@@ -187,6 +188,7 @@ class UploadFilesContext(UploadContext):
     log_files: List[str] = Field(default_factory=list)
     sbom_files: List[str] = Field(default_factory=list)
     arch: Optional[str] = None
+    upload_concurrency: int = 4
 
 
 __all__ = [
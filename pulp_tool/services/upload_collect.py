@@ -23,7 +23,7 @@ if TYPE_CHECKING:
 from ..utils import PulpHelper, create_labels
 from ..utils.constants import (
     RESULTS_JSON_FILENAME,
-    SUPPORTED_ARCHITECTURES,
+    SUPPORTED_ARCHITECTURES_SET,
     results_json_rpm_arch_distribution_key,
 )
 from ..utils.pulp_tasks import create_file_content_and_wait
@@ -242,7 +242,7 @@ def _add_distributions_to_results(
         arch_urls: Dict[str, str] = {}
         for info in results_model.artifacts.values():
             arch = (info.labels.get("arch") or "").strip()
-            if arch in SUPPORTED_ARCHITECTURES:
+            if arch in SUPPORTED_ARCHITECTURES_SET:
                 arch_urls[arch] = repository_helper.distribution_url_for_base_path(arch)
         for arch in sorted(arch_urls.keys()):
             dist_key = results_json_rpm_arch_distribution_key(arch)
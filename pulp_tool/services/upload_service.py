@@ -34,7 +34,7 @@ if TYPE_CHECKING:
 from ..utils import PulpHelper, validate_file_path, create_labels
 from ..utils.path_utils import resolve_path_under_base
 from ..utils.pulp_tasks import create_file_content_and_wait
-from ..utils.constants import SBOM_EXTENSIONS, SUPPORTED_ARCHITECTURES
+from ..utils.constants import SBOM_EXTENSIONS, SUPPORTED_ARCHITECTURES_SET
 
 from .upload_common import _distribution_urls_for_context
 from .upload_collect import (
@@ -360,7 +360,7 @@ def process_uploads_from_results_json(
                 # Try to infer from path (e.g. x86_64/pkg.rpm)
                 parts = key.replace("\\", "/").split("/")
                 for p in parts:
-                    if p in SUPPORTED_ARCHITECTURES:
+                    if p in SUPPORTED_ARCHITECTURES_SET:
                         arch = p
                         break
                 if not arch:
@@ -370,7 +370,7 @@ def process_uploads_from_results_json(
             if not arch:
                 parts = key.replace("\\", "/").split("/")
                 for p in parts:
-                    if p in SUPPORTED_ARCHITECTURES:
+                    if p in SUPPORTED_ARCHITECTURES_SET:
                         arch = p
                         break
                 if not arch:
@@ -472,7 +472,9 @@ def process_uploads_from_results_json(
                 file_relative_path=rel_path,
             )
 
-    extra_artifacts = [ExtraArtifactRef(pulp_href=href) for href in created_resources]
+    # Hrefs come straight from Pulp task responses; model_construct skips the
+    # validation pass the same way the trusted API parsing path does.
+    extra_artifacts = [ExtraArtifactRef.model_construct(pulp_href=href) for href in created_resources]
     return collect_results(client, context, date_str, results_model, extra_artifacts)
 
 
@@ -5,13 +5,29 @@ This module provides functions for detecting artifact types from filenames
 and organizing artifacts by their content type.
 """
 
+import functools
 import os
 import re
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union, overload
 
 from ..models.artifacts import ArtifactMetadata
-from .constants import ARCH_DETECT_WARNING_MSG, SUPPORTED_ARCHITECTURES
+from .constants import ARCH_DETECT_WARNING_MSG, SUPPORTED_ARCHITECTURES, SUPPORTED_ARCHITECTURES_SET
+
+# Compiled once at import: bulk categorization detects the architecture for
+# every artifact, and rebuilding (and re-parsing) a pattern per supported
+# architecture on each call turned one scan per file into one per arch.
+# The alternation keeps the original guards: at least one character before
+# and after the /arch/ directory segment.
+_ARCH_DIR_RE = re.compile(
+    r"[^/\\][/\\](" + "|".join(re.escape(arch) for arch in SUPPORTED_ARCHITECTURES) + r")[/\\][^/\\]",
+    re.IGNORECASE,
+)
+
+# Anchored extension probe for artifact typing. A plain (sbom|log|rpm)
+# alternation would misclassify names like liblastlog2-1.0.rpm as logs, so
+# extensions stay authoritative and the sbom substring check is a fallback.
+_TYPE_EXT_RE = re.compile(r"\.(rpm|log)$", re.IGNORECASE)
 
 
 def rpm_packages_letter_and_basename(path_or_filename: str) -> Tuple[str, str]:
@@ -42,6 +58,10 @@ def rpm_packages_letter_and_basename(path_or_filename: str) -> Tuple[str, str]:
     return basename, basename[0].lower()
 
 
+# Builds of the same package set repeat filename patterns across runs, so the
+# pure string->type/arch detectors are memoized; unique-name workloads pay one
+# dict probe per call.
+@functools.lru_cache(maxsize=4096)
 def detect_artifact_type(artifact_name: str) -> Optional[str]:
     """
     Detect artifact type from artifact name.
@@ -62,17 +82,15 @@ def detect_artifact_type(artifact_name: str) -> Optional[str]:
         >>> detect_artifact_type("liblastlog2-1.0-1.x86_64.rpm")
         'rpm'
     """
-    artifact_name_lower = artifact_name.lower()
-
     # Check file extensions first to avoid false positives from substring matching
-    # (e.g., "liblastlog2-1.0.rpm" contains "log" but is an RPM)
-    if artifact_name_lower.endswith(".rpm"):
-        return "rpm"
-    if artifact_name_lower.endswith(".log"):
-        return "log"
+    # (e.g., "liblastlog2-1.0.rpm" contains "log" but is an RPM). The anchored
+    # regex also skips the per-call full lowercase copy for the common case.
+    match = _TYPE_EXT_RE.search(artifact_name)
+    if match:
+        return match.group(1).lower()
 
     # Fall back to substring matching for SBOMs (e.g., "sbom.json", "cyclonedx.json")
-    if "sbom" in artifact_name_lower:
+    if "sbom" in artifact_name.lower():
         return "sbom"
 
     return None
@@ -149,6 +167,19 @@ def _embedded_artifact_url(metadata: Any) -> Optional[str]:
     return stripped if stripped else None
 
 
+@overload
+def categorize_artifacts_by_type(
+    artifacts: Dict[str, Any],
+    distros: Dict[str, str],
+    content_types: Optional[List[str]] = None,
+    archs: Optional[List[str]] = None,
+    *,
+    embedded_urls_only: bool = False,
+    return_layout: Literal["aos"] = "aos",
+) -> List[Tuple[str, str, str, str]]: ...
+
+
+@overload
 def categorize_artifacts_by_type(
     artifacts: Dict[str, Any],
     distros: Dict[str, str],
@@ -156,7 +187,19 @@ def categorize_artifacts_by_type(
     archs: Optional[List[str]] = None,
     *,
     embedded_urls_only: bool = False,
-) -> List[Tuple[str, str, str, str]]:
+    return_layout: Literal["soa"],
+) -> Dict[str, List[str]]: ...
+
+
+def categorize_artifacts_by_type(
+    artifacts: Dict[str, Any],
+    distros: Dict[str, str],
+    content_types: Optional[List[str]] = None,
+    archs: Optional[List[str]] = None,
+    *,
+    embedded_urls_only: bool = False,
+    return_layout: str = "aos",
+) -> Union[List[Tuple[str, str, str, str]], Dict[str, List[str]]]:
     """
     Categorize artifacts and prepare download information.
 
@@ -168,49 +211,82 @@ def categorize_artifacts_by_type(
         archs: Optional list of architectures to filter
         embedded_urls_only: If True, only include artifacts with a non-empty ``url`` in metadata
             (``pulp pull`` / artifact results JSON); distribution base URLs are not used.
+        return_layout: ``"aos"`` (default) returns one tuple per artifact; ``"soa"``
+            returns a dict of parallel lists (``names``, ``urls``, ``archs``, ``types``)
+            for column-wise filtering over large artifact sets.
 
     Returns:
-        List of tuples: (artifact_name, file_url, arch, artifact_type)
+        List of tuples (artifact_name, file_url, arch, artifact_type), or a dict of
+        four parallel lists when ``return_layout="soa"``.
+
+    Raises:
+        ValueError: If ``return_layout`` is not ``"aos"`` or ``"soa"``.
     """
-    download_tasks = []
+    if return_layout not in ("aos", "soa"):
+        raise ValueError(f"Unsupported return_layout: {return_layout!r} (expected 'aos' or 'soa')")
+    # Hoisted locals and precomputed filter sets: the loop runs once per
+    # artifact, and for large artifact sets the repeated global/attribute
+    # lookups and list-membership filters dominate. Cheap filters also run
+    # before URL construction so filtered-out artifacts never build a URL.
+    detect = detect_artifact_type
+    extract = extract_architecture_from_metadata
+    build = build_artifact_url
+    type_filter = frozenset(content_types) if content_types else None
+    arch_filter = frozenset(archs) if archs else None
+    # Resolved once: each skipped artifact would otherwise build its format
+    # tuple just for the handler to discard it at non-DEBUG levels
+    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+    download_tasks: List[Tuple[str, str, str, str]] = []
+    append = download_tasks.append
 
     for artifact_name, metadata in artifacts.items():
-        # Extract architecture from metadata
-        arch = extract_architecture_from_metadata(metadata)
-
         # Detect artifact type
-        artifact_type = detect_artifact_type(artifact_name)
+        artifact_type = detect(artifact_name)
         if not artifact_type:
-            logging.debug("Skipping %s: could not determine artifact type", artifact_name)
+            if debug_enabled:
+                logging.debug("Skipping %s: could not determine artifact type", artifact_name)
+            continue
+
+        # Apply content type filter
+        if type_filter is not None and artifact_type not in type_filter:
+            if debug_enabled:
+                logging.debug(
+                    "Skipping %s: content type %s not in filter %s", artifact_name, artifact_type, content_types
+                )
+            continue
+
+        # Extract architecture from metadata and apply architecture filter
+        arch = extract(metadata)
+        if arch_filter is not None and arch not in arch_filter:
+            if debug_enabled:
+                logging.debug("Skipping %s: architecture %s not in filter %s", artifact_name, arch, archs)
             continue
 
         embedded_url = _embedded_artifact_url(metadata)
         if embedded_urls_only:
             file_url = embedded_url
         else:
-            file_url = embedded_url or build_artifact_url(artifact_name, artifact_type, distros)
+            file_url = embedded_url or build(artifact_name, artifact_type, distros)
 
         if not file_url:
-            if embedded_urls_only:
-                logging.debug(
-                    "Skipping %s: artifact metadata has no url (pull uses only URLs from artifact results)",
-                    artifact_name,
-                )
-            else:
-                logging.debug("Skipping %s: could not build download URL", artifact_name)
-            continue
-
-        # Apply content type filter
-        if content_types and artifact_type not in content_types:
-            logging.debug("Skipping %s: content type %s not in filter %s", artifact_name, artifact_type, content_types)
+            if debug_enabled:
+                if embedded_urls_only:
+                    logging.debug(
+                        "Skipping %s: artifact metadata has no url (pull uses only URLs from artifact results)",
+                        artifact_name,
+                    )
+                else:
+                    logging.debug("Skipping %s: could not build download URL", artifact_name)
             continue
 
-        # Apply architecture filter
-        if archs and arch not in archs:
-            logging.debug("Skipping %s: architecture %s not in filter %s", artifact_name, arch, archs)
-            continue
+        append((artifact_name, file_url, arch, artifact_type))
 
-        download_tasks.append((artifact_name, file_url, arch, artifact_type))
+    if return_layout == "soa":
+        # Transpose once at the end: zip(*rows) runs in C, and parallel lists
+        # let callers build per-column filter masks without unpacking tuples
+        names, urls, arch_list, types = map(list, zip(*download_tasks)) if download_tasks else ([], [], [], [])
+        return {"names": names, "urls": urls, "archs": arch_list, "types": types}
 
     return download_tasks
 
@@ -237,17 +313,11 @@ def detect_arch_from_filepath(filepath: str) -> Optional[str]:
         None
     """
     # This handles cases like /path/to/x86_64/package.rpm or /path/to/aarch64/package.rpm
-    path_lower = filepath.lower()
-    for arch in SUPPORTED_ARCHITECTURES:
-        # Check if architecture appears in the path as a directory segment
-        # Pattern ensures there's at least one character before and after the /arch/ segment
-        arch_pattern = rf"[^/\\][/\\]{re.escape(arch)}[/\\][^/\\]"
-        if re.search(arch_pattern, path_lower, re.IGNORECASE):
-            return arch
-
-    return None
+    match = _ARCH_DIR_RE.search(filepath)
+    return match.group(1).lower() if match else None
 
 
+@functools.lru_cache(maxsize=4096)
 def detect_arch_from_rpm_filename(rpm_path: str) -> Optional[str]:
     """
     Try to detect architecture from RPM filename.
@@ -269,16 +339,17 @@ def detect_arch_from_rpm_filename(rpm_path: str) -> Optional[str]:
         >>> detect_arch_from_rpm_filename("/path/to/package.rpm")
         None
     """
-    # This handles cases like package-1.0.0-1.x86_64.rpm or package-1.0.0-1.aarch64.rpm
+    # This handles cases like package-1.0.0-1.x86_64.rpm or package-1.0.0-1.aarch64.rpm.
+    # String splitting instead of a regex: the supported-architecture set is
+    # the real filter, so the pattern engine added nothing but per-call cost.
     filename = os.path.basename(rpm_path)
-    match = re.search(r"\.([a-z0-9_]+)\.rpm$", filename, re.IGNORECASE)
-    if match:
-        arch = match.group(1)
-        # Check if the detected arch from filename is in supported architectures
-        if arch in SUPPORTED_ARCHITECTURES:
-            return arch
-
-    return None
+    if filename[-4:].lower() != ".rpm":
+        return None
+    parts = filename[:-4].rsplit(".", 1)
+    if len(parts) != 2:
+        return None
+    arch = parts[1].lower()
+    return arch if arch in SUPPORTED_ARCHITECTURES_SET else None
 
 
 def group_rpm_paths_by_arch(
@@ -318,6 +389,62 @@ def group_rpm_paths_by_arch(
     return rpms_by_arch
 
 
+def group_rpm_paths_by_arch_iter(
+    rpm_paths: List[str],
+    *,
+    explicit_arch: Optional[str] = None,
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield ``(arch, paths)`` groups for thread-pool submission.
+
+    A group is only complete once every path has been classified (a path late
+    in the list can still belong to the first architecture), so grouping runs
+    to completion before the first yield; this is an iteration-shaped wrapper
+    over :func:`group_rpm_paths_by_arch` for callers that submit each batch
+    to an executor without keeping the full mapping around.
+
+    Args:
+        rpm_paths: List of paths to RPM files.
+        explicit_arch: If set, use this architecture for all paths; otherwise detect per path.
+
+    Yields:
+        Tuples of (architecture name, list of RPM paths).
+    """
+    yield from group_rpm_paths_by_arch(rpm_paths, explicit_arch=explicit_arch).items()
+
+
+def group_log_paths_by_arch(
+    log_paths: List[str],
+    *,
+    explicit_arch: Optional[str] = None,
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    Group log file paths by detected or explicit architecture.
+
+    Unlike :func:`group_rpm_paths_by_arch`, undetected paths are returned to
+    the caller instead of being warned about per file, so callers can emit
+    one aggregate warning and keep their submission loops branch-free.
+
+    Args:
+        log_paths: List of paths to log files.
+        explicit_arch: If set, use this architecture for all paths; otherwise detect per path.
+
+    Returns:
+        Tuple of (architecture -> log paths mapping, undetected paths).
+    """
+    logs_by_arch: Dict[str, List[str]] = {}
+    undetected: List[str] = []
+    for fp in log_paths:
+        arch = explicit_arch or detect_arch_from_filepath(fp)
+        if not arch:
+            undetected.append(fp)
+            continue
+        if arch not in logs_by_arch:
+            logs_by_arch[arch] = []
+        logs_by_arch[arch].append(fp)
+    return logs_by_arch, undetected
+
+
 __all__ = [
     "detect_artifact_type",
     "rpm_packages_letter_and_basename",
@@ -327,4 +454,6 @@ __all__ = [
     "detect_arch_from_filepath",
     "detect_arch_from_rpm_filename",
     "group_rpm_paths_by_arch",
+    "group_rpm_paths_by_arch_iter",
+    "group_log_paths_by_arch",
 ]
@@ -4,13 +4,14 @@ Configuration management utilities.
 This module provides centralized configuration loading and validation.
 """
 
+import io
 import logging
 import tomllib
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from .constants import DEFAULT_CONFIG_PATH
-from .config_utils import load_config_content
+from .config_utils import decode_base64_config, is_base64_config, load_file_content_maybe_base64
 
 
 class ConfigManager:
@@ -30,25 +31,58 @@ class ConfigManager:
                         If None, uses default path.
         """
         self.config_source = config_path or DEFAULT_CONFIG_PATH
+        # The source never changes after construction, so classify it once;
+        # re-running the heuristic scan on every error path re-read large
+        # base64 blobs character by character
+        self._is_base64_cached: bool = is_base64_config(self.config_source)
         # Store original source for reference, but don't expand if it's base64
         # If config_path is None, we use default path which should be expanded
         # If config_path is provided and not base64, expand it
         if config_path is None:
             # Use default path - always expand it
             self.config_path: Optional[Path] = Path(DEFAULT_CONFIG_PATH).expanduser()
-        elif self._is_base64():
+        elif self._is_base64_cached:
             # Base64 config - no file path
             self.config_path = None
         else:
             # File path - expand it
             self.config_path = Path(self.config_source).expanduser()
-        self._config: Optional[Dict[str, Any]] = None
+        # The mode never changes after construction, so pick the mode-specific
+        # implementation once instead of re-branching on base64-vs-file inside
+        # every call; the source description for errors is fixed at the same time
+        if self._is_base64_cached:
+            self._source_desc = "base64 content"
+            self._load_impl = self._load_base64
+        else:
+            self._source_desc = str(self.config_path)
+            self._load_impl = self._load_file
+        self._config = None
 
-    def _is_base64(self) -> bool:
-        """Check if config_source is base64."""
-        from .config_utils import is_base64_config
+    @property
+    def _config(self) -> Optional[Dict[str, Any]]:
+        """Parsed configuration tree (None until loaded)."""
+        return self._config_data
+
+    @_config.setter
+    def _config(self, value: Optional[Dict[str, Any]]) -> None:
+        # Rebuilding the dotted-path index here keeps it in sync for every
+        # assignment, including tests that set _config directly
+        self._config_data = value
+        self._flat: Dict[str, Any] = {}
+        if value:
+            self._flatten(value, "")
+
+    def _flatten(self, tree: Dict[str, Any], prefix: str) -> None:
+        """Index every value (including section dicts) by its dotted path."""
+        for key, value in tree.items():
+            path = f"{prefix}{key}"
+            self._flat[path] = value
+            if isinstance(value, dict):
+                self._flatten(value, f"{path}.")
 
-        return is_base64_config(self.config_source)
+    def _is_base64(self) -> bool:
+        """Check if config_source is base64 (classified once at construction)."""
+        return self._is_base64_cached
 
     def load(self) -> Dict[str, Any]:
         """
@@ -61,25 +95,43 @@ class ConfigManager:
             FileNotFoundError: If config is a file path and file doesn't exist
             ValueError: If config file is invalid or base64 decoding fails
         """
+        return self._load_impl()
+
+    def _load_base64(self) -> Dict[str, Any]:
+        """Load and parse base64-encoded config content (no file-path branches)."""
         if self._config is not None:
             return self._config
 
         try:
-            config_bytes, is_base64 = load_config_content(self.config_source)
-            self._config = tomllib.loads(config_bytes.decode("utf-8"))
+            config_bytes = decode_base64_config(self.config_source)
+            # tomllib.load decodes the bytes itself; decode()+loads() built an
+            # intermediate str the size of the config just to re-encode it
+            self._config = tomllib.load(io.BytesIO(config_bytes))
+            logging.debug("Loaded configuration from %s", self._source_desc)
+            return self._config
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid TOML in configuration {self._source_desc}: {e}") from e
+        except Exception as e:
+            raise ValueError(f"Failed to load configuration from {self._source_desc}: {e}") from e
+
+    def _load_file(self) -> Dict[str, Any]:
+        """Load and parse config from the resolved file path (no base64 branches)."""
+        if self._config is not None:
+            return self._config
 
-            source_desc = "base64 content" if is_base64 else str(self.config_path)
-            logging.debug("Loaded configuration from %s", source_desc)
+        try:
+            # config_path is always set in file mode (None only for base64)
+            config_bytes, _ = load_file_content_maybe_base64(self.config_path)  # type: ignore[arg-type]
+            self._config = tomllib.load(io.BytesIO(config_bytes))
+            logging.debug("Loaded configuration from %s", self._source_desc)
             return self._config
         except FileNotFoundError:
             # Re-raise FileNotFoundError as-is
             raise
         except tomllib.TOMLDecodeError as e:
-            source_desc = "base64 content" if self._is_base64() else str(self.config_path)
-            raise ValueError(f"Invalid TOML in configuration {source_desc}: {e}") from e
+            raise ValueError(f"Invalid TOML in configuration {self._source_desc}: {e}") from e
         except Exception as e:
-            source_desc = "base64 content" if self._is_base64() else str(self.config_path)
-            raise ValueError(f"Failed to load configuration from {source_desc}: {e}") from e
+            raise ValueError(f"Failed to load configuration from {self._source_desc}: {e}") from e
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -103,18 +155,7 @@ class ConfigManager:
         if self._config is None:
             self.load()
 
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value if value is not None else default
+        return self._flat.get(key, default)
 
     def get_section(self, section: str) -> Dict[str, Any]:
         """
@@ -155,18 +196,7 @@ class ConfigManager:
             except (FileNotFoundError, ValueError):
                 return False
 
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return False
-            else:
-                return False
-
-        return True
+        return key in self._flat
 
     def reload(self) -> None:
         """Force reload configuration from file."""
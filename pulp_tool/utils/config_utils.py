@@ -4,13 +4,20 @@ Configuration utility functions for handling config input formats.
 This module provides utilities for detecting and decoding base64-encoded config content.
 """
 
-import base64
+import binascii
 import logging
+import string
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Translate tables for the base64 heuristic below. str.translate scans the
+# whole string in C, replacing the previous character-at-a-time Python loop
+# (large base64 blobs are checked on every config load).
+_WHITESPACE_DELETE_TBL = str.maketrans("", "", string.whitespace)
+_BASE64_DELETE_TBL = str.maketrans("", "", string.ascii_letters + string.digits + "+/=")
+
 
 def decode_base64_config(config: str) -> bytes:
     """
@@ -26,9 +33,11 @@ def decode_base64_config(config: str) -> bytes:
         ValueError: If base64 decoding fails
     """
     try:
-        # Strip whitespace before decoding
+        # Strip whitespace before decoding. a2b_base64 in strict mode rejects
+        # non-alphabet characters like b64decode(validate=True), but validates
+        # and decodes in a single C pass instead of a regex pre-scan.
         stripped_config = config.strip()
-        decoded_content = base64.b64decode(stripped_config, validate=True)
+        decoded_content = binascii.a2b_base64(stripped_config, strict_mode=True)
         logger.debug("Decoded base64 config content (%d bytes)", len(decoded_content))
         return decoded_content
     except Exception as e:
@@ -65,16 +74,22 @@ def is_base64_config(config: Optional[str]) -> bool:
     if config.startswith(("~", ".", "/")):
         return False
 
-    # Check if it contains only base64 characters
-    # Base64 alphabet: A-Z, a-z, 0-9, +, /, = (padding)
-    base64_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
-    if all(c in base64_chars or c.isspace() for c in config):
-        # If it's mostly base64 characters and reasonably long, likely base64
-        non_space_chars = [c for c in config if not c.isspace()]
-        if len(non_space_chars) > 50:
-            return True
+    # Config-file extensions mean a (relative) path; skips the full scan for
+    # long extension-named inputs ('.' is not base64 anyway)
+    if config.endswith((".toml", ".cfg", ".ini")):
+        return False
+
+    # Non-ASCII input can never be base64; the flag check is O(1) on str and
+    # skips both translate passes below
+    if not config.isascii():
+        return False
 
-    return False
+    # Check if it contains only base64 characters (A-Z, a-z, 0-9, +, /, =)
+    # besides whitespace: drop whitespace, then delete the base64 alphabet —
+    # an empty remainder means every character was valid
+    stripped = config.translate(_WHITESPACE_DELETE_TBL)
+    # If it's all base64 characters and reasonably long, likely base64
+    return len(stripped) > 50 and not stripped.translate(_BASE64_DELETE_TBL)
 
 
 def load_file_content_maybe_base64(path: Union[str, Path]) -> Tuple[bytes, bool]:
@@ -95,12 +110,15 @@ def load_file_content_maybe_base64(path: Union[str, Path]) -> Tuple[bytes, bool]
         FileNotFoundError: If the file does not exist.
         ValueError: If content looks like base64 but decoding fails.
     """
+    # Callers that already resolved a Path skip the construction; open()
+    # itself reports a missing file, so no exists() pre-check (and its extra
+    # stat syscall) is needed
     path = Path(path).expanduser() if isinstance(path, str) else path
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-
-    with open(path, "rb") as f:
-        content = f.read()
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {path}") from e
 
     try:
         content_str = content.decode("utf-8")
@@ -136,24 +154,14 @@ def load_config_content(config: Optional[str]) -> Tuple[bytes, bool]:
         decoded = decode_base64_config(config)
         return decoded, True
 
-    # Treat as file path
+    # Treat as file path; base64-encoded file content is decoded by the
+    # shared helper, but the source remains a file path (is_base64 False).
+    # The helper's open() surfaces missing files, so no exists() pre-check.
     config_path = Path(config).expanduser()
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-    with open(config_path, "rb") as f:
-        content = f.read()
-
-    # If file content looks like base64, decode it before returning (source remains file path)
     try:
-        content_str = content.decode("utf-8")
-        if is_base64_config(content_str):
-            content = decode_base64_config(content_str)
-            logger.debug("Decoded base64 config content from file %s", config_path)
-    except UnicodeDecodeError:
-        # Binary or non-UTF-8 file; treat as raw content
-        pass
-
+        content, _ = load_file_content_maybe_base64(config_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from e
     return content, False
 
 
@@ -5,6 +5,8 @@ This module consolidates all constants used throughout the codebase
 to eliminate magic numbers and strings.
 """
 
+import os
+
 # ============================================================================
 # Repository and Content Types
 # ============================================================================
@@ -15,8 +17,11 @@ REPOSITORY_TYPES = ["rpms", "logs", "sbom", "artifacts"]
 # Signed repository types (when --signed-by is used; only RPMs are signed)
 SIGNED_REPOSITORY_TYPES = ["rpms-signed"]
 
-# Supported CPU architectures (including source RPMs as a logical 'src' arch)
-SUPPORTED_ARCHITECTURES = ["x86_64", "i686", "aarch64", "s390x", "ppc64le", "noarch", "src"]
+# Supported CPU architectures (including source RPMs as a logical 'src' arch).
+# Tuple for cheap iteration in deterministic order; the frozenset gives O(1)
+# membership tests on the upload hot paths.
+SUPPORTED_ARCHITECTURES = ("x86_64", "i686", "aarch64", "s390x", "ppc64le", "noarch", "src")
+SUPPORTED_ARCHITECTURES_SET = frozenset(SUPPORTED_ARCHITECTURES)
 
 # Content types for filtering
 CONTENT_TYPES = ["rpm", "log", "sbom"]
@@ -60,6 +65,28 @@ CACHE_TTL = 300  # 5 minutes
 # Default number of concurrent workers for parallel operations
 DEFAULT_MAX_WORKERS = 4
 
+# Upper bound for the orchestrator's long-lived upload pool. Uploads are
+# network-bound, so the pool oversubscribes CPUs but stays capped the way
+# concurrent.futures caps its own default. Because the pool is fixed-size,
+# builds with more architectures than workers queue in the pool instead of
+# each getting a thread; PULP_UPLOAD_WORKERS overrides the cap for
+# environments that need to throttle (or widen) Pulp-side concurrency.
+
+
+def _orchestrator_max_workers() -> int:
+    default = min(32, (os.cpu_count() or 1) * 4)
+    raw = os.environ.get("PULP_UPLOAD_WORKERS", "").strip()
+    if not raw:
+        return default
+    try:
+        configured = int(raw)
+    except ValueError:
+        return default
+    return configured if configured > 0 else default
+
+
+ORCHESTRATOR_MAX_WORKERS = _orchestrator_max_workers()
+
 # Maximum workers for repository setup operations
 REPOSITORY_SETUP_MAX_WORKERS = 4
 
@@ -102,6 +129,9 @@ DEFAULT_PROGRESS_INTERVAL = 10
 # Thread name prefix for architecture processing
 ARCHITECTURE_THREAD_PREFIX = "process_architectures"
 
+# Thread name prefix for individual file uploads (upload-files command)
+FILE_UPLOAD_THREAD_PREFIX = "upload_files"
+
 # Chunk size for parallel GET requests with large parameter lists
 # Prevents "Request Line is too large" errors
 DEFAULT_CHUNK_SIZE = 50
@@ -188,6 +218,7 @@ __all__ = [
     "REPOSITORY_TYPES",
     "SIGNED_REPOSITORY_TYPES",
     "SUPPORTED_ARCHITECTURES",
+    "SUPPORTED_ARCHITECTURES_SET",
     "CONTENT_TYPES",
     "ARTIFACT_TYPES",
     # File and Path
@@ -200,6 +231,7 @@ __all__ = [
     "DEFAULT_TIMEOUT",
     "CACHE_TTL",
     "DEFAULT_MAX_WORKERS",
+    "ORCHESTRATOR_MAX_WORKERS",
     "REPOSITORY_SETUP_MAX_WORKERS",
     # Task Management
     "TASK_INITIAL_SLEEP_INTERVAL",
@@ -212,6 +244,7 @@ __all__ = [
     "DEFAULT_PROGRESS_INTERVAL",
     # Thread and Process
     "ARCHITECTURE_THREAD_PREFIX",
+    "FILE_UPLOAD_THREAD_PREFIX",
     "DEFAULT_CHUNK_SIZE",
     # Exit Codes
     "EXIT_SUCCESS",
@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 from typing import Optional
 
-from .constants import SUPPORTED_ARCHITECTURES
+from .constants import SUPPORTED_ARCHITECTURES_SET
 
 
 def sanitize_arch_for_path(arch: str) -> str:
@@ -21,7 +21,7 @@ def sanitize_arch_for_path(arch: str) -> str:
         ValueError: If arch is empty or not in SUPPORTED_ARCHITECTURES
     """
     clean = os.path.basename(arch.replace("\\", "/"))
-    if not clean or clean not in SUPPORTED_ARCHITECTURES:
+    if not clean or clean not in SUPPORTED_ARCHITECTURES_SET:
         raise ValueError(f"Unsupported or invalid architecture: {arch!r}")
     return clean
 
@@ -8,7 +8,7 @@ Centralizes ``create_file_content`` → ``check_response`` → extract ``task``
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
 from ..models.pulp_api import TaskResponse
 
@@ -56,4 +56,48 @@ def create_file_content_and_wait(
     return client.wait_for_finished_task(task_href)
 
 
-__all__ = ["create_file_content_and_wait"]
+def create_file_contents_and_wait(
+    client: "PulpClient",
+    repository: str,
+    paths: Sequence[Union[str, Path]],
+    *,
+    build_id: str,
+    pulp_label: Dict[str, Any],
+    arch: Optional[str] = None,
+    operation: str = "create file content",
+) -> List[TaskResponse]:
+    """
+    Upload several files, then wait for all Pulp tasks with one batched poll.
+
+    Small files spend most of their upload wall time in task polling when
+    handled one at a time; posting every file first and waiting via
+    ``wait_for_finished_tasks`` keeps the polling request count constant
+    regardless of how many files were uploaded.
+
+    Args:
+        client: Pulp API client.
+        repository: Target repository PRN.
+        paths: File paths to upload.
+        build_id: Build id for labels/path.
+        pulp_label: Pulp labels dict applied to every file.
+        arch: Optional architecture segment for relative paths.
+        operation: Label prefix for ``check_response`` error messages.
+
+    Returns:
+        Final ``TaskResponse`` per file, in the same order as ``paths``.
+    """
+    task_hrefs = []
+    for path in paths:
+        response = client.create_file_content(
+            repository,
+            path,
+            build_id=build_id,
+            pulp_label=pulp_label,
+            arch=arch,
+        )
+        client.check_response(response, f"{operation} {path}")
+        task_hrefs.append(response.json()["task"])
+    return client.wait_for_finished_tasks(task_hrefs)
+
+
+__all__ = ["create_file_content_and_wait", "create_file_contents_and_wait"]
@@ -28,7 +28,7 @@ from .constants import (
     API_TYPES,
     REPOSITORY_TYPES,
     SIGNED_REPOSITORY_TYPES,
-    SUPPORTED_ARCHITECTURES,
+    SUPPORTED_ARCHITECTURES_SET,
 )
 from .validation import (
     strip_namespace_from_build_id,
@@ -221,7 +221,7 @@ class RepositoryManager:
         Used with ``target_arch_repo`` so RPM URLs are
         ``/api/pulp-content/{namespace}/{arch}/Packages/...`` instead of ``.../{build}/rpms/...``.
         """
-        if arch not in SUPPORTED_ARCHITECTURES:
+        if arch not in SUPPORTED_ARCHITECTURES_SET:
             raise ValueError(f"Unsupported architecture for RPM repository: {arch}")
         if not build_id or not isinstance(build_id, str) or not build_id.strip():
             raise ValueError(f"Invalid build ID: {build_id}")
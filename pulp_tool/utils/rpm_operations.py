@@ -31,16 +31,16 @@ def calculate_sha256_checksum(file_path: str) -> str:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    sha256_hash = hashlib.sha256()
-
     try:
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
+            # file_digest reads through a reusable 256 KiB buffer in C and
+            # releases the GIL while hashing, so concurrent upload workers
+            # spend far less time blocked here than the old 4 KiB read loop
+            digest = hashlib.file_digest(f, "sha256")
     except IOError as e:
         raise IOError(f"Error reading file {file_path}: {e}") from e
 
-    return sha256_hash.hexdigest()
+    return digest.hexdigest()
 
 
 def parse_rpm_filename_to_nvr(filename: str) -> Optional[Tuple[str, str, str]]:
@@ -35,6 +35,12 @@ RETRY_BACKOFF_FACTOR = 0.5  # base delay before exponential backoff (seconds)
 # Backwards-compatible name (historical: matched transport retries)
 MAX_RETRIES = TRANSPORT_MAX_RETRIES
 
+# How long idle keep-alive connections stay in the pool (seconds). Pulp
+# workloads issue many small GETs against one host (pagination, chunked
+# pulp_href__in fan-out, task polling), so keeping connections warm avoids
+# repeated TLS handshakes.
+KEEPALIVE_EXPIRY_S = 60.0
+
 
 def _compute_retry_delay_s(
     *,
@@ -211,10 +217,13 @@ def create_session_with_retry(
         >>> # With Basic Auth (username/password)
         >>> client = create_session_with_retry(auth=("user", "pass"), timeout=300.0)
     """
-    # Configure connection limits - increased for parallel workloads
+    # Configure connection limits - increased for parallel workloads.
+    # Keep-alive matches the pool size so chunked fan-out and task polling
+    # reuse warm connections instead of re-handshaking.
     limits = httpx.Limits(
         max_connections=max_connections,
-        max_keepalive_connections=max(20, max_connections // 5),
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=KEEPALIVE_EXPIRY_S,
     )
 
     # Configure timeout (total, connect, read, write)
@@ -277,6 +286,7 @@ def create_session_with_retry(
 
 
 __all__ = [
+    "KEEPALIVE_EXPIRY_S",
     "RETRY_STATUS_CODES",
     "RESPONSE_RETRY_TOTAL_ATTEMPTS",
     "RETRY_BACKOFF_FACTOR",
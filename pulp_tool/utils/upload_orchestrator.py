@@ -7,23 +7,31 @@ architecture processing and result collection.
 
 from __future__ import annotations
 
-import glob
+import functools
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import Any, Deque, Dict, List, MutableSequence, Optional, Tuple, TYPE_CHECKING
 
 from ..models.context import UploadRpmContext, UploadFilesContext
 from ..models.repository import RepositoryRefs
 from ..models.artifacts import ExtraArtifactRef
 from ..models.results import PulpResultsModel, RpmUploadResult
-
-from .constants import ARCHITECTURE_THREAD_PREFIX, ARCH_DETECT_WARNING_MSG, SUPPORTED_ARCHITECTURES
+from ..models.statistics import UploadCounts
+
+from .constants import (
+    ARCHITECTURE_THREAD_PREFIX,
+    ARCH_DETECT_WARNING_MSG,
+    DEFAULT_MAX_WORKERS,
+    FILE_UPLOAD_THREAD_PREFIX,
+    ORCHESTRATOR_MAX_WORKERS,
+    SUPPORTED_ARCHITECTURES,
+)
 from .error_handling import handle_generic_error
-from .uploads import upload_log, upload_rpms, upload_rpms_logs, create_labels, RPM_FILE_PATTERN
+from .uploads import upload_log, upload_rpms, upload_rpms_logs, create_labels, find_files_by_suffixes, RPM_FILE_SUFFIX
 from .validation import validate_file_path
-from .artifact_detection import detect_arch_from_filepath, group_rpm_paths_by_arch
-from .pulp_tasks import create_file_content_and_wait
+from .artifact_detection import group_log_paths_by_arch, group_rpm_paths_by_arch_iter
 
 if TYPE_CHECKING:
     from ..api.pulp_client import PulpClient
@@ -36,12 +44,48 @@ class UploadOrchestrator:
 
     This class handles processing uploads for multiple architectures
     and coordinating the complete upload process.
+
+    Architecture uploads run on a single long-lived thread pool owned by
+    the orchestrator, so repeated upload calls reuse warm worker threads
+    (and their HTTP connections) instead of spawning a pool per call. The
+    orchestrator can be used as a context manager; ``close()`` shuts the
+    pool down.
     """
 
-    def __init__(self) -> None:
-        """Initialize the upload orchestrator."""
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Initialize the upload orchestrator.
+
+        Args:
+            max_workers: Size of the shared upload pool (defaults to
+                ORCHESTRATOR_MAX_WORKERS).
+        """
+        self._max_workers = max_workers or ORCHESTRATOR_MAX_WORKERS
+        # Created on first use; ThreadPoolExecutor spawns threads lazily, so
+        # orchestrators that never upload stay thread-free either way
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared upload pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                thread_name_prefix=ARCHITECTURE_THREAD_PREFIX, max_workers=self._max_workers
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the shared upload pool (idempotent)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> UploadOrchestrator:
+        return self
 
-    def _find_existing_architectures(self, rpm_path: str) -> List[str]:
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _find_existing_architectures(self, rpm_path: str) -> List[Tuple[str, str]]:
         """
         Find architectures that have existing directories.
 
@@ -49,24 +93,32 @@ class UploadOrchestrator:
             rpm_path: Base path containing architecture subdirectories
 
         Returns:
-            List of architecture names that have existing directories
+            List of ``(arch, arch_path)`` tuples for architectures that have
+            existing directories, so callers do not re-join the path
         """
-        existing_archs = []
-        for arch in SUPPORTED_ARCHITECTURES:
-            arch_path = os.path.join(rpm_path, arch)
-            if os.path.exists(arch_path):
-                existing_archs.append(arch)
-            else:
-                logging.debug("Skipping %s - path does not exist: %s", arch, arch_path)
+        # One scandir reads the directory in a single syscall instead of a
+        # stat per supported architecture; on network/fuse-backed paths
+        # (OCI/oras layouts) each of those stats is a mount-handler round-trip
+        try:
+            with os.scandir(rpm_path) as entries:
+                names = {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            logging.debug("Skipping all architectures - path does not exist: %s", rpm_path)
+            return []
+
+        # Iterate SUPPORTED_ARCHITECTURES so the result order stays deterministic
+        existing_archs = [(arch, os.path.join(rpm_path, arch)) for arch in SUPPORTED_ARCHITECTURES if arch in names]
+        missing = [arch for arch in SUPPORTED_ARCHITECTURES if arch not in names]
+        if missing and logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Skipping architectures without a directory in %s: %s", rpm_path, ", ".join(missing))
         return existing_archs
 
     def _submit_architecture_tasks(
         self,
         executor: ThreadPoolExecutor,
-        existing_archs: List[str],
-        rpm_path: str,
+        existing_archs: List[Tuple[str, str]],
         args: UploadRpmContext,
-        client: "PulpClient",
+        client: PulpClient,
         rpm_href: str,
         logs_prn: str,
         date_str: str,
@@ -75,14 +127,13 @@ class UploadOrchestrator:
         *,
         pulp_helper: Optional[PulpHelper] = None,
         target_arch_repo: bool = False,
-    ) -> Dict[Any, str]:
+    ) -> List[Tuple[Future[RpmUploadResult], str]]:
         """
         Submit architecture upload tasks to the executor.
 
         Args:
             executor: ThreadPoolExecutor instance
-            existing_archs: List of architecture names to process
-            rpm_path: Base path containing architecture subdirectories
+            existing_archs: List of (arch, arch_path) tuples to process
             args: Upload context with command arguments
             client: PulpClient instance for API interactions
             rpm_href: RPM repository href for adding content
@@ -91,39 +142,45 @@ class UploadOrchestrator:
             results_model: PulpResultsModel to update with upload counts
 
         Returns:
-            Dictionary mapping futures to architecture names
+            List of (future, arch) tuples in submission order
         """
-        future_to_arch = {}
-        for arch in existing_archs:
-            arch_path = os.path.join(rpm_path, arch)
+        # Bind the per-build invariants once; each submission then only
+        # carries the values that actually vary between architectures
+        upload_fn = functools.partial(
+            upload_rpms_logs,
+            context=args,
+            client=client,
+            file_repository_prn=logs_prn,
+            date=date_str,
+            results_model=results_model,
+            distribution_urls=distribution_urls,
+            target_arch_repo=target_arch_repo,
+        )
+        submitted: List[Tuple[Future[RpmUploadResult], str]] = []
+        for arch, arch_path in existing_archs:
             if args.target_arch_repo:
                 if pulp_helper is None:
                     raise ValueError("target_arch_repo requires PulpHelper for per-arch RPM repositories")
                 arch_rpm_href = pulp_helper.ensure_rpm_repository_for_arch(args.build_id, arch)
             else:
                 arch_rpm_href = rpm_href
-            future = executor.submit(
-                upload_rpms_logs,
-                arch_path,
-                args,
-                client,
-                arch,
-                rpm_repository_href=arch_rpm_href,
-                file_repository_prn=logs_prn,
-                date=date_str,
-                results_model=results_model,
-                distribution_urls=distribution_urls,
-                target_arch_repo=target_arch_repo,
-            )
-            future_to_arch[future] = arch
-        return future_to_arch
+            future = executor.submit(upload_fn, arch_path, arch=arch, rpm_repository_href=arch_rpm_href)
+            submitted.append((future, arch))
+        return submitted
 
-    def _collect_architecture_results(self, future_to_arch: Dict[Any, str]) -> Dict[str, RpmUploadResult]:
+    def _collect_architecture_results(
+        self,
+        submitted: List[Tuple[Future[RpmUploadResult], str]],
+        out_created_resources: Optional[MutableSequence[str]] = None,
+    ) -> Dict[str, RpmUploadResult]:
         """
         Collect results from architecture upload futures.
 
         Args:
-            future_to_arch: Dictionary mapping futures to architecture names
+            submitted: (future, arch) tuples in submission order
+            out_created_resources: Optional list extended in place with each
+                result's created resource hrefs as futures complete, so the
+                caller does not need a second pass over all results
 
         Returns:
             Dictionary mapping architecture names to their upload results
@@ -131,28 +188,39 @@ class UploadOrchestrator:
         Raises:
             Exception: If any architecture upload fails
         """
+        # %-style args defer formatting, but the per-completion messages and
+        # the final name join still cost work to build; skip them entirely
+        # unless debug logging is actually on (off by default in pipelines)
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        # Iterate in submission order: the futures all run concurrently
+        # regardless, total wait time is unchanged, and created_resources
+        # ordering becomes deterministic without hashing Future objects
         processed_archs: Dict[str, RpmUploadResult] = {}
-        for future in as_completed(future_to_arch):
-            arch = future_to_arch[future]
+        for future, arch in submitted:
             try:
-                logging.debug("Processing architecture: %s", arch)
+                if debug_enabled:
+                    logging.debug("Processing architecture: %s", arch)
                 result = future.result()
                 processed_archs[arch] = result
-                logging.debug(
-                    "Completed processing architecture: %s with %d created resources",
-                    arch,
-                    len(result.created_resources),
-                )
+                if out_created_resources is not None:
+                    out_created_resources.extend(result.created_resources)
+                if debug_enabled:
+                    logging.debug(
+                        "Completed processing architecture: %s with %d created resources",
+                        arch,
+                        len(result.created_resources),
+                    )
             except Exception as e:
                 handle_generic_error(e, f"process architecture {arch}")
                 raise
 
-        logging.debug("Processed architectures: %s", ", ".join(processed_archs.keys()))
+        if debug_enabled:
+            logging.debug("Processed architectures: %s", ", ".join(processed_archs.keys()))
         return processed_archs
 
     def process_architecture_uploads(
         self,
-        client: "PulpClient",
+        client: PulpClient,
         args: UploadRpmContext,
         repositories: RepositoryRefs,
         *,
@@ -162,6 +230,7 @@ class UploadOrchestrator:
         distribution_urls: Dict[str, str],
         pulp_helper: Optional[PulpHelper] = None,
         target_arch_repo: bool = False,
+        out_created_resources: Optional[MutableSequence[str]] = None,
     ) -> Dict[str, RpmUploadResult]:
         """
         Process uploads for all supported architectures.
@@ -176,6 +245,8 @@ class UploadOrchestrator:
             date_str: Build date string
             rpm_href: RPM repository href for adding content
             results_model: PulpResultsModel to update with upload counts
+            out_created_resources: Optional list extended in place with created
+                resource hrefs as each architecture completes
 
         Returns:
             Mapping of architecture name to RpmUploadResult (uploaded RPM paths and created_resources hrefs)
@@ -192,34 +263,31 @@ class UploadOrchestrator:
             logging.warning("No architecture directories found in %s", args.rpm_path)
             return {}
 
-        # Process architectures in parallel for better performance
-        with ThreadPoolExecutor(
-            thread_name_prefix=ARCHITECTURE_THREAD_PREFIX, max_workers=len(existing_archs)
-        ) as executor:
-            # Submit all architecture processing tasks
-            future_to_arch = self._submit_architecture_tasks(
-                executor,
-                existing_archs,
-                args.rpm_path,
-                args,
-                client,
-                rpm_href,
-                repositories.logs_prn,
-                date_str,
-                results_model,
-                distribution_urls,
-                pulp_helper=pulp_helper,
-                target_arch_repo=target_arch_repo,
-            )
+        # Prime the HTTP connection once on this thread so the workers below
+        # reuse it instead of all paying the first-connection TLS handshake
+        client.warm_connection()
 
-            # Collect results as they complete
-            processed_archs = self._collect_architecture_results(future_to_arch)
+        # Process architectures in parallel on the shared long-lived pool
+        submitted = self._submit_architecture_tasks(
+            self._get_executor(),
+            existing_archs,
+            args,
+            client,
+            rpm_href,
+            repositories.logs_prn,
+            date_str,
+            results_model,
+            distribution_urls,
+            pulp_helper=pulp_helper,
+            target_arch_repo=target_arch_repo,
+        )
 
-        return processed_archs
+        # Collect results as they complete
+        return self._collect_architecture_results(submitted, out_created_resources)
 
     def process_uploads(
         self,
-        client: "PulpClient",
+        client: PulpClient,
         args: UploadRpmContext,
         repositories: RepositoryRefs,
         *,
@@ -263,7 +331,10 @@ class UploadOrchestrator:
         repo_helper = pulp_helper or PulpHelperCls(client, parent_package=args.parent_package)
         distribution_urls = repo_helper.get_distribution_urls_for_upload_context(args.build_id, args)
 
-        # Process each architecture - now updates results_model internally
+        # Process each architecture - now updates results_model internally.
+        # created_resources is extended in place as each architecture future
+        # completes, so there is no second pass over the per-arch results.
+        created_resources: Deque[str] = deque()
         processed_uploads = self.process_architecture_uploads(
             client,
             args,
@@ -274,34 +345,35 @@ class UploadOrchestrator:
             distribution_urls=distribution_urls,
             pulp_helper=pulp_helper,
             target_arch_repo=args.target_arch_repo,
+            out_created_resources=created_resources,
         )
 
-        # Collect all created resources from add_content operations
-        created_resources: List[str] = []
-        for upload in processed_uploads.values():
-            created_resources.extend(upload.created_resources)
-
         # Always search the base rpm_path for root-level RPMs (e.g. .src.rpm, .noarch.rpm).
         # OCI/oras layouts often put these in the root while logs live in arch subdirs (e.g. aarch64/).
         if args.rpm_path:
-            rpm_glob_path = os.path.join(args.rpm_path, RPM_FILE_PATTERN)
-            root_rpm_files = [p for p in glob.glob(rpm_glob_path) if os.path.isfile(p)]
+            root_rpm_files = find_files_by_suffixes(args.rpm_path, (RPM_FILE_SUFFIX,))[RPM_FILE_SUFFIX]
             if root_rpm_files:
                 logging.warning(
                     "Found %d RPM(s) in base path %s (root-level), uploading by detected architecture",
                     len(root_rpm_files),
                     args.rpm_path,
                 )
-                rpms_by_arch = group_rpm_paths_by_arch(root_rpm_files)
-                for arch, rpm_list in rpms_by_arch.items():
+                # Each arch batch is an independent network-bound upload; fan
+                # them out on the shared pool instead of serializing one
+                # round-trip-plus-task-wait per arch. Futures are gathered in
+                # submission order so created_resources stays deterministic.
+                executor = self._get_executor()
+                root_upload_futures = []
+                for arch, rpm_list in group_rpm_paths_by_arch_iter(root_rpm_files):
                     logging.warning("Uploading %d root-level RPM(s) for architecture %s", len(rpm_list), arch)
                     if args.target_arch_repo:
                         assert pulp_helper is not None  # enforced at start when target_arch_repo is set
                         root_rpm_href = pulp_helper.ensure_rpm_repository_for_arch(args.build_id, arch)
                     else:
                         root_rpm_href = repositories.rpms_href
-                    created_resources.extend(
-                        upload_rpms(
+                    root_upload_futures.append(
+                        executor.submit(
+                            upload_rpms,
                             rpm_list,
                             args,
                             client,
@@ -313,6 +385,8 @@ class UploadOrchestrator:
                             target_arch_repo=args.target_arch_repo,
                         )
                     )
+                for future in root_upload_futures:
+                    created_resources.extend(future.result())
 
         # Upload SBOM and capture its created resources - updates results_model internally
         # Only upload SBOM if sbom_path is provided
@@ -331,11 +405,14 @@ class UploadOrchestrator:
         else:
             logging.debug("Skipping SBOM upload - no sbom_path provided")
 
-        logging.info("Collected %d created resource hrefs from upload operations", len(created_resources))
+        extra_artifacts_count = len(created_resources)
+        logging.info("Collected %d created resource hrefs from upload operations", extra_artifacts_count)
 
-        # Convert created_resources hrefs into artifact format for extra_artifacts
-        extra_artifacts = [ExtraArtifactRef(pulp_href=href) for href in created_resources]
-        logging.info("Total artifacts to include in results: %d", len(extra_artifacts))
+        # Convert created_resources hrefs into artifact format for extra_artifacts.
+        # Hrefs come straight from Pulp task responses, so skip the validation
+        # pass (the before-validator only normalizes legacy dict shapes).
+        extra_artifacts = [ExtraArtifactRef.model_construct(pulp_href=href) for href in created_resources]
+        logging.info("Total artifacts to include in results: %d", extra_artifacts_count)
 
         # Collect and save results, passing the results_model and all artifacts
         results_json_url = collect_results(client, args, date_str, results_model, extra_artifacts)
@@ -349,14 +426,122 @@ class UploadOrchestrator:
 
         return results_json_url
 
+    def _post_generic_file(
+        self,
+        client: PulpClient,
+        context: UploadFilesContext,
+        repositories: RepositoryRefs,
+        file_path: str,
+        labels: Dict[str, str],
+    ) -> str:
+        """
+        Validate and POST a single generic file to the artifacts repository.
+
+        The spawned task is not awaited here; the caller collects hrefs from
+        the whole batch and waits for them with one multiplexed poll.
+
+        Args:
+            labels: Pre-built labels shared by all generic files in the batch
+                (identical arguments per file, so built once by the caller)
+
+        Returns:
+            Href of the Pulp task spawned for this file
+        """
+        logging.warning("Uploading file: %s", os.path.basename(file_path))
+        validate_file_path(file_path, "File")
+
+        response = client.create_file_content(
+            repositories.artifacts_prn,
+            file_path,
+            build_id=context.build_id,
+            pulp_label=labels,
+        )
+        client.check_response(response, f"upload file {file_path}")
+        return str(response.json()["task"])
+
+    def _upload_log_file(
+        self,
+        client: PulpClient,
+        context: UploadFilesContext,
+        repositories: RepositoryRefs,
+        results_model: PulpResultsModel,
+        distribution_urls: Dict[str, str],
+        target_arch_repo: bool,
+        log_path: str,
+        log_arch: str,
+        labels: Dict[str, str],
+    ) -> List[str]:
+        """
+        Upload a single log file to the logs repository.
+
+        The log count is tallied by the caller when the future resolves, so
+        workers do not write shared counters.
+
+        Args:
+            labels: Pre-built labels for this log's architecture, shared by
+                all logs of the same arch (workers only read the dict)
+
+        Returns:
+            List of created resource hrefs from the upload task
+        """
+        logging.warning("Uploading log: %s", os.path.basename(log_path))
+        log_created_resources = upload_log(
+            client,
+            repositories.logs_prn,
+            log_path,
+            build_id=context.build_id,
+            labels=labels,
+            arch=log_arch,
+            results_model=results_model,
+            distribution_urls=distribution_urls,
+            target_arch_repo=target_arch_repo,
+        )
+        return log_created_resources
+
+    def _upload_sbom_file(
+        self,
+        client: PulpClient,
+        context: UploadFilesContext,
+        repositories: RepositoryRefs,
+        results_model: PulpResultsModel,
+        distribution_urls: Dict[str, str],
+        target_arch_repo: bool,
+        sbom_path: str,
+    ) -> List[str]:
+        """
+        Upload a single SBOM file to the SBOM repository.
+
+        Returns:
+            List of created resource hrefs from the upload task
+        """
+        # Import here to avoid circular import
+        from ..services.upload_service import upload_sbom
+
+        logging.warning("Uploading SBOM: %s", os.path.basename(sbom_path))
+        return upload_sbom(
+            client,
+            context,
+            repositories.sbom_prn,
+            context.date_str,
+            results_model,
+            sbom_path,
+            distribution_urls=distribution_urls,
+            target_arch_repo=target_arch_repo,
+        )
+
     def process_file_uploads(
-        self, client: "PulpClient", context: UploadFilesContext, repositories: RepositoryRefs
+        self, client: PulpClient, context: UploadFilesContext, repositories: RepositoryRefs
     ) -> Optional[str]:
         """
         Process upload of individual files to Pulp repositories.
 
         This function handles uploading RPMs, generic files, logs, and SBOMs
-        from individual file paths specified in the context.
+        from individual file paths specified in the context. Generic files,
+        logs, and SBOMs are uploaded concurrently through a bounded thread
+        pool (``context.upload_concurrency`` workers) so wall-clock time
+        approaches the slowest single upload instead of the sum; generic-file
+        tasks are then awaited with a single batched poll, and RPMs keep
+        their own parallel path inside :func:`upload_rpms`.
 
         Args:
             client: PulpClient instance for API interactions
@@ -367,7 +552,7 @@ class UploadOrchestrator:
             URL of the uploaded results JSON, or None if upload failed
         """
         # Import here to avoid circular import
-        from ..services.upload_service import upload_sbom, collect_results
+        from ..services.upload_service import collect_results
         from .pulp_helper import PulpHelper as PulpHelperCls
 
         # Create unified results model
@@ -377,110 +562,151 @@ class UploadOrchestrator:
         target_arch_repo = bool(getattr(context, "target_arch_repo", False))
 
         # Store created resources from add_content operations
-        created_resources = []
-
-        # Upload RPMs
-        if context.rpm_files:
-            logging.warning("Uploading %d RPM file(s)", len(context.rpm_files))
-            rpms_by_arch = group_rpm_paths_by_arch(context.rpm_files, explicit_arch=context.arch)
-
-            # Upload RPMs for each architecture
-            for arch, rpm_list in rpms_by_arch.items():
-                arch_created_resources = upload_rpms(
-                    rpm_list,
-                    context,
-                    client,
-                    arch,
-                    rpm_repository_href=repositories.rpms_href,
-                    date=context.date_str,
-                    results_model=results_model,
-                    distribution_urls=distribution_urls,
-                    target_arch_repo=target_arch_repo,
-                )
-                created_resources.extend(arch_created_resources)
-
-        # Upload generic files
-        if context.file_files:
-            logging.warning("Uploading %d generic file(s)", len(context.file_files))
-            for file_path in context.file_files:
-                logging.warning("Uploading file: %s", os.path.basename(file_path))
-                labels = create_labels(
+        created_resources: Deque[str] = deque()
+
+        max_workers = max(1, getattr(context, "upload_concurrency", 0) or DEFAULT_MAX_WORKERS)
+        with ThreadPoolExecutor(thread_name_prefix=FILE_UPLOAD_THREAD_PREFIX, max_workers=max_workers) as executor:
+            # Futures kept in submission order so created_resources stays deterministic
+            log_futures: List[Future[List[str]]] = []
+            upload_futures: List[Future[List[str]]] = []
+
+            # Generic files: POST in parallel, then wait for the whole batch
+            # of spawned tasks with one multiplexed poll instead of one wait
+            # loop per file
+            generic_post_futures: List[Future[str]] = []
+            file_labels: Dict[str, str] = {}
+
+            def _submit_generic_files(paths: List[str]) -> None:
+                nonlocal file_labels
+                # Labels are identical for every generic file; build once
+                # instead of once per worker (workers only read the dict)
+                file_labels = create_labels(
                     context.build_id, "", context.namespace, context.parent_package, context.date_str
                 )
-                validate_file_path(file_path, "File")
-
-                task_response = create_file_content_and_wait(
-                    client,
-                    repositories.artifacts_prn,
-                    file_path,
-                    build_id=context.build_id,
-                    pulp_label=labels,
-                    operation=f"upload file {file_path}",
-                )
-                if task_response.created_resources:
-                    created_resources.extend(task_response.created_resources)
-                results_model.increment_counts(files=1)
-                rel_path = os.path.basename(file_path)
-                client.add_uploaded_artifact_to_results_model(
-                    results_model,
-                    local_path=file_path,
-                    labels=labels,
-                    is_rpm=False,
-                    distribution_urls=distribution_urls,
-                    target_arch_repo=target_arch_repo,
-                    file_relative_path=rel_path,
-                )
+                for file_path in paths:
+                    generic_post_futures.append(
+                        executor.submit(
+                            self._post_generic_file,
+                            client,
+                            context,
+                            repositories,
+                            file_path,
+                            file_labels,
+                        )
+                    )
 
-        # Upload logs
-        if context.log_files:
-            logging.warning("Uploading %d log file(s)", len(context.log_files))
-            for log_path in context.log_files:
-                logging.warning("Uploading log: %s", os.path.basename(log_path))
-                log_arch = context.arch or detect_arch_from_filepath(log_path)
-                if not log_arch:
+            def _submit_log_files(paths: List[str]) -> None:
+                # Pre-partition by architecture so the submission loop has no
+                # detection branches; undetected paths get one aggregate
+                # warning, and labels are built once per unique arch
+                logs_by_arch, undetected = group_log_paths_by_arch(paths, explicit_arch=context.arch)
+                for log_path in undetected:
                     logging.warning(ARCH_DETECT_WARNING_MSG, os.path.basename(log_path))
-                    continue
-
-                labels = create_labels(
-                    context.build_id, log_arch, context.namespace, context.parent_package, context.date_str
-                )
-
-                log_created_resources = upload_log(
-                    client,
-                    repositories.logs_prn,
-                    log_path,
-                    build_id=context.build_id,
-                    labels=labels,
-                    arch=log_arch,
-                    results_model=results_model,
-                    distribution_urls=distribution_urls,
-                    target_arch_repo=target_arch_repo,
-                )
-                created_resources.extend(log_created_resources)
-                results_model.increment_counts(logs=1)
-
-        # Upload SBOMs
-        if context.sbom_files:
-            logging.warning("Uploading %d SBOM file(s)", len(context.sbom_files))
-            for sbom_path in context.sbom_files:
-                logging.warning("Uploading SBOM: %s", os.path.basename(sbom_path))
-                sbom_created_resources = upload_sbom(
-                    client,
-                    context,
-                    repositories.sbom_prn,
-                    context.date_str,
-                    results_model,
-                    sbom_path,
-                    distribution_urls=distribution_urls,
-                    target_arch_repo=target_arch_repo,
-                )
-                created_resources.extend(sbom_created_resources)
+                for log_arch, log_paths in logs_by_arch.items():
+                    labels = create_labels(
+                        context.build_id, log_arch, context.namespace, context.parent_package, context.date_str
+                    )
+                    for log_path in log_paths:
+                        log_futures.append(
+                            executor.submit(
+                                self._upload_log_file,
+                                client,
+                                context,
+                                repositories,
+                                results_model,
+                                distribution_urls,
+                                target_arch_repo,
+                                log_path,
+                                log_arch,
+                                labels,
+                            )
+                        )
 
-        logging.info("Collected %d created resource hrefs from upload operations", len(created_resources))
+            def _submit_sbom_files(paths: List[str]) -> None:
+                for sbom_path in paths:
+                    upload_futures.append(
+                        executor.submit(
+                            self._upload_sbom_file,
+                            client,
+                            context,
+                            repositories,
+                            results_model,
+                            distribution_urls,
+                            target_arch_repo,
+                            sbom_path,
+                        )
+                    )
 
-        # Convert created_resources hrefs into artifact format for extra_artifacts
-        extra_artifacts = [ExtraArtifactRef(pulp_href=href) for href in created_resources]
-        logging.info("Total artifacts to include in results: %d", len(extra_artifacts))
+            def _upload_rpm_files(paths: List[str]) -> None:
+                # RPMs stay on the caller thread; upload_rpms fans out its own
+                # pool, and its network I/O overlaps the futures queued above
+                for arch, rpm_list in group_rpm_paths_by_arch_iter(paths, explicit_arch=context.arch):
+                    arch_created_resources = upload_rpms(
+                        rpm_list,
+                        context,
+                        client,
+                        arch,
+                        rpm_repository_href=repositories.rpms_href,
+                        date=context.date_str,
+                        results_model=results_model,
+                        distribution_urls=distribution_urls,
+                        target_arch_repo=target_arch_repo,
+                    )
+                    created_resources.extend(arch_created_resources)
+
+            # Category dispatch table: one (paths, label, handler) row per
+            # file kind, replacing four near-identical guard/log/submit blocks
+            category_dispatch = (
+                (context.file_files, "generic file(s)", _submit_generic_files),
+                (context.log_files, "log file(s)", _submit_log_files),
+                (context.sbom_files, "SBOM file(s)", _submit_sbom_files),
+                (context.rpm_files, "RPM file(s)", _upload_rpm_files),
+            )
+            for paths, label, handler in category_dispatch:
+                if paths:
+                    logging.warning("Uploading %d %s", len(paths), label)
+                    handler(paths)
+
+            # Batched wait for generic-file tasks; responses come back in
+            # submission order so created_resources stays deterministic
+            if generic_post_futures:
+                task_hrefs = [future.result() for future in generic_post_futures]
+                task_responses = client.wait_for_finished_tasks(task_hrefs)
+                for file_path, task_response in zip(context.file_files, task_responses):
+                    results_model.increment_counts(files=1)
+                    client.add_uploaded_artifact_to_results_model(
+                        results_model,
+                        local_path=file_path,
+                        labels=file_labels,
+                        is_rpm=False,
+                        distribution_urls=distribution_urls,
+                        target_arch_repo=target_arch_repo,
+                        file_relative_path=os.path.basename(file_path),
+                    )
+                    if task_response.created_resources:
+                        created_resources.extend(task_response.created_resources)
+
+            # Tally log counts on this thread while draining the futures and
+            # apply them in one locked merge, instead of a shared-counter
+            # write from every log worker
+            log_counts = UploadCounts()
+            for future in log_futures:
+                created_resources.extend(future.result())
+                log_counts.logs += 1
+            if log_counts.logs:
+                results_model.increment_counts(logs=log_counts.logs)
+
+            for future in upload_futures:
+                created_resources.extend(future.result())
+
+        extra_artifacts_count = len(created_resources)
+        logging.info("Collected %d created resource hrefs from upload operations", extra_artifacts_count)
+
+        # Convert created_resources hrefs into artifact format for extra_artifacts.
+        # Hrefs come straight from Pulp task responses, so skip the validation
+        # pass (the before-validator only normalizes legacy dict shapes).
+        extra_artifacts = [ExtraArtifactRef.model_construct(pulp_href=href) for href in created_resources]
+        logging.info("Total artifacts to include in results: %d", extra_artifacts_count)
 
         # Collect and save results, passing the results_model and all artifacts
         results_json_url = collect_results(client, context, context.date_str, results_model, extra_artifacts)
@@ -19,7 +19,7 @@ from .validation import validate_file_path
 from .constants import SUPPORTED_ARCHITECTURES
 from .rpm_operations import upload_rpms_parallel
 from .rpm_overwrite import remove_rpms_matching_local_files_from_repository
-from .pulp_tasks import create_file_content_and_wait
+from .pulp_tasks import create_file_content_and_wait, create_file_contents_and_wait
 
 if TYPE_CHECKING:
     from ..api.pulp_client import PulpClient
@@ -27,6 +27,38 @@ if TYPE_CHECKING:
 # Constants used in this module
 RPM_FILE_PATTERN = "*.rpm"
 LOG_FILE_PATTERN = "*.log"
+RPM_FILE_SUFFIX = RPM_FILE_PATTERN[1:]
+LOG_FILE_SUFFIX = LOG_FILE_PATTERN[1:]
+
+
+def find_files_by_suffixes(directory: str, suffixes: Tuple[str, ...]) -> Dict[str, List[str]]:
+    """
+    Find files in a directory matching any of the given suffixes in one pass.
+
+    A single os.scandir replaces glob + per-candidate isfile stats: the
+    directory is read once and entry type comes from the DirEntry cache,
+    which matters on OCI/oras or network-backed layouts where every extra
+    stat is a mount-handler round-trip.
+
+    Args:
+        directory: Directory to scan (not recursive).
+        suffixes: File suffixes to match (e.g. (".rpm", ".log")).
+
+    Returns:
+        Mapping of suffix to list of full paths; missing or non-directory
+        paths yield empty lists.
+    """
+    found: Dict[str, List[str]] = {suffix: [] for suffix in suffixes}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                for suffix in suffixes:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        found[suffix].append(entry.path)
+                        break
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return found
 
 
 def create_labels(build_id: str, arch: str, namespace: str, parent_package: Optional[str], date: str) -> Dict[str, str]:
@@ -118,7 +150,7 @@ def upload_log(
     return task_response.created_resources if task_response.created_resources else []
 
 
-def _upload_logs_sequential(
+def _upload_logs_batched(
     client: "PulpClient",
     logs: List[str],
     *,
@@ -131,10 +163,11 @@ def _upload_logs_sequential(
     target_arch_repo: bool = False,
 ) -> None:
     """
-    Upload logs sequentially.
+    Upload logs as one batch.
 
-    This function uploads log files one by one to avoid overwhelming the server
-    with concurrent file uploads.
+    Log files are small, so uploading them one at a time paid a full round
+    of task polling per file. Every log is posted first, then all resulting
+    Pulp tasks are awaited together with a single batched poll.
 
     Args:
         client: PulpClient instance for API interactions
@@ -145,19 +178,43 @@ def _upload_logs_sequential(
         arch: Architecture for the uploaded logs
     """
     logging.warning("Uploading %d log file(s) for %s", len(logs), arch)
-    for log in logs:
-        logging.warning("Uploading log: %s", os.path.basename(log))
-        upload_log(
-            client,
-            file_repository_prn,
-            log,
-            build_id=build_id,
-            labels=labels,
-            arch=arch,
-            results_model=results_model,
-            distribution_urls=distribution_urls,
-            target_arch_repo=target_arch_repo,
+    if not file_repository_prn or not str(file_repository_prn).strip():
+        raise ValueError(
+            "Log upload requires a logs repository PRN. Create the logs repository or unset skip_logs_repo."
         )
+    # Basenames are needed again for the relative-path fallback below, so
+    # compute them once per log instead of once per use
+    log_names = [os.path.basename(log) for log in logs]
+    for log, log_name in zip(logs, log_names):
+        logging.warning("Uploading log: %s", log_name)
+        validate_file_path(log, "Log")
+
+    task_responses = create_file_contents_and_wait(
+        client,
+        file_repository_prn,
+        logs,
+        build_id=build_id,
+        pulp_label=labels,
+        arch=arch,
+        operation="upload log",
+    )
+
+    if results_model is not None and distribution_urls is not None:
+        for log, log_name, task_response in zip(logs, log_names, task_responses):
+            rel_path: Optional[str] = None
+            if task_response.result and isinstance(task_response.result, dict):
+                rel_path = task_response.result.get("relative_path")
+            if not rel_path:
+                rel_path = f"{arch}/{log_name}" if arch else log_name
+            client.add_uploaded_artifact_to_results_model(
+                results_model,
+                local_path=log,
+                labels=labels,
+                is_rpm=False,
+                distribution_urls=distribution_urls,
+                target_arch_repo=target_arch_repo,
+                file_relative_path=rel_path,
+            )
 
 
 def upload_artifacts_to_repository(
@@ -344,9 +401,10 @@ def upload_rpms_logs(
     Returns:
         RpmUploadResult containing uploaded RPMs, existing artifacts, and created resources
     """
-    # Find RPM and log files
-    rpms = glob.glob(os.path.join(rpm_path, RPM_FILE_PATTERN))
-    logs = glob.glob(os.path.join(rpm_path, LOG_FILE_PATTERN))
+    # Find RPM and log files in a single directory scan
+    found_files = find_files_by_suffixes(rpm_path, (RPM_FILE_SUFFIX, LOG_FILE_SUFFIX))
+    rpms = found_files[RPM_FILE_SUFFIX]
+    logs = found_files[LOG_FILE_SUFFIX]
 
     if not rpms and not logs:
         logging.debug("No RPMs or logs found in %s", rpm_path)
@@ -379,10 +437,10 @@ def upload_rpms_logs(
             target_arch_repo=target_arch_repo,
         )
 
-    # Upload logs sequentially
+    # Upload logs as a batch (one post per log, one combined task wait)
     if logs:
         logging.warning("Uploading %d logs for %s", len(logs), arch)
-        _upload_logs_sequential(
+        _upload_logs_batched(
             client,
             logs,
             file_repository_prn=file_repository_prn,
@@ -420,6 +478,7 @@ def rpm_directory_has_log_files(rpm_path: str) -> bool:
 
 __all__ = [
     "create_labels",
+    "find_files_by_suffixes",
     "upload_log",
     "upload_artifacts_to_repository",
     "upload_rpms",
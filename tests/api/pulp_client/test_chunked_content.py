@@ -135,18 +135,14 @@ class TestPulpClient:
         httpx_mock.post("https://pulp.example.com/pulp/api/v3/repositories/rpm/rpm/12345/modify/").mock(
             return_value=httpx.Response(202, json={"task": "/pulp/api/v3/tasks/67890/"})
         )
-        httpx_mock.get("https://pulp.example.com/pulp/api/v3/tasks/67890/").mock(
-            return_value=httpx.Response(
-                200, json={"pulp_href": "/pulp/api/v3/tasks/67890/", "state": "completed", "created_resources": []}
-            )
-        )
         artifacts = ["/pulp/api/v3/content/12345/", "/pulp/api/v3/content/67890/"]
         result = mock_pulp_client.add_content("/pulp/api/v3/repositories/rpm/rpm/12345/", artifacts)
         from pulp_tool.models.pulp_api import TaskResponse
 
+        # No follow-up GET: add_content returns a minimal pending task
         assert isinstance(result, TaskResponse)
         assert result.pulp_href == "/pulp/api/v3/tasks/67890/"
-        assert result.state == "completed"
+        assert result.state == "waiting"
 
     def test_modify_repository_content_remove_only(self, mock_pulp_client, httpx_mock) -> None:
         """Test modify_repository_content with remove_content_units only."""
@@ -159,11 +155,6 @@ class TestPulpClient:
         httpx_mock.post("https://pulp.example.com/pulp/api/v3/repositories/rpm/rpm/12345/modify/").mock(
             side_effect=capture_modify
         )
-        httpx_mock.get("https://pulp.example.com/pulp/api/v3/tasks/99999/").mock(
-            return_value=httpx.Response(
-                200, json={"pulp_href": "/pulp/api/v3/tasks/99999/", "state": "completed", "created_resources": []}
-            )
-        )
         removes = ["/pulp/api/v3/content/rpm/packages/old/"]
         result = mock_pulp_client.modify_repository_content(
             "/pulp/api/v3/repositories/rpm/rpm/12345/", remove_content_units=removes
@@ -190,11 +181,6 @@ class TestPulpClient:
         httpx_mock.post("https://pulp.example.com/pulp/api/v3/repositories/rpm/rpm/99999/modify/").mock(
             side_effect=capture_modify
         )
-        httpx_mock.get("https://pulp.example.com/pulp/api/v3/tasks/88888/").mock(
-            return_value=httpx.Response(
-                200, json={"pulp_href": "/pulp/api/v3/tasks/88888/", "state": "completed", "created_resources": []}
-            )
-        )
         mock_pulp_client.modify_repository_content(
             "/pulp/api/v3/repositories/rpm/rpm/99999/", add_content_units=["/add/1/"], remove_content_units=["/rm/1/"]
         )
@@ -43,6 +43,22 @@ class TestPulpClient:
         mock_pulp_client.close()
         mock_pulp_client.session.close.assert_called_once()
 
+    def test_warm_connection(self, mock_pulp_client) -> None:
+        """warm_connection issues one GET to the non-domain-scoped status endpoint."""
+        mock_pulp_client.session.get = Mock()
+        mock_pulp_client.warm_connection()
+        mock_pulp_client.session.get.assert_called_once()
+        url = mock_pulp_client.session.get.call_args[0][0]
+        api_root = str(mock_pulp_client.config["api_root"]).rstrip("/")
+        assert url == f"https://pulp.example.com{api_root}/api/v3/status/"
+        # Status is server-wide, not domain-scoped
+        assert "test-domain" not in url
+
+    def test_warm_connection_swallows_errors(self, mock_pulp_client) -> None:
+        """warm_connection is best-effort and never raises."""
+        mock_pulp_client.session.get = Mock(side_effect=httpx.ConnectError("refused"))
+        mock_pulp_client.warm_connection()
+
     def test_context_manager(self, mock_config) -> None:
         """Test context manager functionality."""
         with patch("pulp_tool.api.pulp_client.client.create_session_with_retry") as mock_create_session:
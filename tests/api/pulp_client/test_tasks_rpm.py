@@ -39,8 +39,8 @@ class TestPulpClient:
         httpx_mock.get("https://pulp.example.com/pulp/api/v3/tasks/12345/").mock(
             return_value=httpx.Response(200, json={"pulp_href": "/pulp/api/v3/tasks/12345/", "state": "running"})
         )
-        with patch("time.sleep"), patch("time.time", side_effect=[0, 0.5, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0]):
-            with patch("pulp_tool.api.tasks.operations.logging"):
+        with patch("time.sleep"), patch("time.monotonic", side_effect=[0, 0.5, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0]):
+            with patch("pulp_tool.api.tasks.operations.logger"):
                 result = mock_pulp_client.wait_for_finished_task("/pulp/api/v3/tasks/12345/", timeout=1)
         from pulp_tool.models.pulp_api import TaskResponse
 
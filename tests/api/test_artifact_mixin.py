@@ -131,3 +131,14 @@ class TestArtifactMixin:
         result = test_client.get_file_locations(artifact_hrefs)
         assert len(result) == 2
         assert isinstance(result[0], ArtifactResponse)
+
+    def test_get_artifacts_bulk_delegates_to_get_file_locations(self, mock_pulp_client) -> None:
+        """Test get_artifacts_bulk coalesces hrefs into one filtered lookup."""
+        from pulp_tool.api.artifacts.operations import ArtifactMixin
+
+        mixin = ArtifactMixin()
+        mixin.get_file_locations = Mock(return_value=[])
+        hrefs = ["/api/v3/artifacts/12345/", "/api/v3/artifacts/67890/"]
+        result = ArtifactMixin.get_artifacts_bulk(mixin, hrefs)
+        assert result == []
+        mixin.get_file_locations.assert_called_once_with(hrefs)
@@ -8,62 +8,76 @@ import pytest
 from unittest.mock import Mock, patch
 import httpx
 from pulp_tool.api.base import BaseResourceMixin
-from pulp_tool.models.pulp_api import RepositoryResponse
+from pulp_tool.models.pulp_api import RepositoryRequest, RepositoryResponse
 
+# Canonical parsed responses built once at import; the create/update tests
+# only assert on identity-independent fields, so one instance per shape is
+# enough and per-test model validation is skipped.
+_CREATED_REPO = RepositoryResponse(pulp_href="/test/", name="test-repo")
+_UPDATED_REPO = RepositoryResponse(pulp_href="/test/", name="test-repo-updated")
 
-class TestBaseResourceMixin:
-    """Test BaseResourceMixin error handling."""
 
-    def test_parse_response_validation_error(self, mock_config) -> None:
-        """Test _parse_response with ValidationError."""
+@pytest.fixture
+def mock_base_logging():
+    """Patch the api.base module logger; injecting the fixture replaces the
+    per-test with-patch blocks in the error-path tests."""
+    with patch("pulp_tool.api.base.logger") as mock_logger:
+        yield mock_logger
+
+
+@pytest.fixture
+def make_mixin(mock_config, shared_client):
+    """Factory for a configured BaseResourceMixin, replacing the six-line
+    config/session/timeout/_url/_check_response block each test repeated."""
+
+    def _make(url_return: str = "https://pulp.example.com/api/v3/repositories/?") -> BaseResourceMixin:
         mixin = BaseResourceMixin()
         mixin.config = mock_config
+        mixin.session = shared_client
+        mixin.timeout = 120
+        mixin.request_params = {}
+        mixin._url = Mock(return_value=url_return)
         mixin._check_response = Mock()
-        response = Mock(spec=httpx.Response)
-        response.status_code = 200
-        response.text = '{"invalid": "data"}'
-        response.json = Mock(return_value={"invalid": "data"})
-        with patch("pulp_tool.api.base.logging") as mock_logging:
-            with pytest.raises(ValueError, match="Invalid response format"):
-                mixin._parse_response(response, RepositoryResponse, "test operation")
-            assert mock_logging.error.called
-
-    def test_parse_response_value_error(self, mock_config) -> None:
+        return mixin
+
+    return _make
+
+
+class TestBaseResourceMixin:
+    """Test BaseResourceMixin error handling."""
+
+    def test_parse_response_validation_error(self, make_mixin, mock_base_logging) -> None:
+        """Test _parse_response with ValidationError."""
+        mixin = make_mixin()
+        # Real response object: constructing httpx.Response is cheaper than
+        # spec'ing a Mock against it, and exercises the real .json() path.
+        response = httpx.Response(200, json={"invalid": "data"})
+        with pytest.raises(ValueError, match="Invalid response format"):
+            mixin._parse_response(response, RepositoryResponse, "test operation")
+        assert mock_base_logging.error.called
+
+    def test_parse_response_value_error(self, make_mixin, mock_base_logging) -> None:
         """Test _parse_response with ValueError (invalid JSON)."""
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin._check_response = Mock()
-        response = Mock(spec=httpx.Response)
-        response.status_code = 200
-        response.text = "not json"
-        response.json = Mock(side_effect=ValueError("Invalid JSON"))
-        with patch("pulp_tool.api.base.logging") as mock_logging:
-            with pytest.raises(ValueError, match="Invalid JSON response"):
-                mixin._parse_response(response, RepositoryResponse, "test operation")
-            assert mock_logging.error.called
-
-    def test_parse_response_no_check_success(self, mock_config) -> None:
+        mixin = make_mixin()
+        # .json() on a non-JSON body raises JSONDecodeError (a ValueError
+        # subclass), so no side_effect mock is needed.
+        response = httpx.Response(200, content=b"not json")
+        with pytest.raises(ValueError, match="Invalid JSON response"):
+            mixin._parse_response(response, RepositoryResponse, "test operation")
+        assert mock_base_logging.error.called
+
+    def test_parse_response_no_check_success(self, make_mixin) -> None:
         """Test _parse_response with check_success=False."""
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin._check_response = Mock()
-        response = Mock(spec=httpx.Response)
-        response.status_code = 200
-        response.json = Mock(return_value={"pulp_href": "/test/", "name": "test"})
+        mixin = make_mixin()
+        response = httpx.Response(200, json={"pulp_href": "/test/", "name": "test"})
         result = mixin._parse_response(response, RepositoryResponse, "test operation", check_success=False)
         assert isinstance(result, RepositoryResponse)
         assert result.name == "test"
         mixin._check_response.assert_not_called()
 
-    def test_get_resource_with_name(self, mock_config, httpx_mock) -> None:
+    def test_get_resource_with_name(self, make_mixin, httpx_mock) -> None:
         """Test _get_resource with name parameter."""
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin.session = httpx.Client()
-        mixin.timeout = 120
-        mixin.request_params = {}
-        mixin._url = Mock(return_value="https://pulp.example.com/api/v3/repositories/?")
-        mixin._check_response = Mock()
+        mixin = make_mixin()
         httpx_mock.get("https://pulp.example.com/api/v3/repositories/?name=test-repo&offset=0&limit=1").mock(
             return_value=httpx.Response(200, json={"results": [{"pulp_href": "/test/", "name": "test-repo"}]})
         )
@@ -71,30 +85,18 @@ class TestBaseResourceMixin:
         assert isinstance(result, RepositoryResponse)
         assert result.name == "test-repo"
 
-    def test_get_resource_no_results(self, mock_config, httpx_mock) -> None:
+    def test_get_resource_no_results(self, make_mixin, httpx_mock) -> None:
         """Test _get_resource when no results found."""
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin.session = httpx.Client()
-        mixin.timeout = 120
-        mixin.request_params = {}
-        mixin._url = Mock(return_value="https://pulp.example.com/api/v3/repositories/?")
-        mixin._check_response = Mock()
+        mixin = make_mixin()
         httpx_mock.get("https://pulp.example.com/api/v3/repositories/?name=test-repo&offset=0&limit=1").mock(
             return_value=httpx.Response(200, json={"results": []})
         )
         with pytest.raises(ValueError, match="Resource not found"):
             mixin._get_resource("api/v3/repositories/", RepositoryResponse, name="test-repo")
 
-    def test_get_resource_multiple_results(self, mock_config, httpx_mock) -> None:
+    def test_get_resource_multiple_results(self, make_mixin, httpx_mock, mock_base_logging) -> None:
         """Test _get_resource when multiple results found."""
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin.session = httpx.Client()
-        mixin.timeout = 120
-        mixin.request_params = {}
-        mixin._url = Mock(return_value="https://pulp.example.com/api/v3/repositories/?")
-        mixin._check_response = Mock()
+        mixin = make_mixin()
         httpx_mock.get("https://pulp.example.com/api/v3/repositories/?name=test-repo&offset=0&limit=1").mock(
             return_value=httpx.Response(
                 200,
@@ -106,20 +108,13 @@ class TestBaseResourceMixin:
                 },
             )
         )
-        with patch("pulp_tool.api.base.logging") as mock_logging:
-            result = mixin._get_resource("api/v3/repositories/", RepositoryResponse, name="test-repo")
-            assert isinstance(result, RepositoryResponse)
-            mock_logging.warning.assert_called()
+        result = mixin._get_resource("api/v3/repositories/", RepositoryResponse, name="test-repo")
+        assert isinstance(result, RepositoryResponse)
+        mock_base_logging.warning.assert_called()
 
-    def test_list_resources_with_query_params(self, mock_config, httpx_mock) -> None:
+    def test_list_resources_with_query_params(self, make_mixin, httpx_mock) -> None:
         """Test _list_resources with query parameters."""
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin.session = httpx.Client()
-        mixin.timeout = 120
-        mixin.request_params = {}
-        mixin._url = Mock(return_value="https://pulp.example.com/api/v3/repositories/?")
-        mixin._check_response = Mock()
+        mixin = make_mixin()
         httpx_mock.get("https://pulp.example.com/api/v3/repositories/?offset=0&limit=10").mock(
             return_value=httpx.Response(
                 200,
@@ -139,17 +134,10 @@ class TestBaseResourceMixin:
         assert prev_url is None
         assert count == 1
 
-    def test_create_resource(self, mock_config, httpx_mock) -> None:
+    def test_create_resource(self, make_mixin, httpx_mock) -> None:
         """Test _create_resource."""
-        from pulp_tool.models.pulp_api import RepositoryRequest
-
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin.session = httpx.Client()
-        mixin.timeout = 120
-        mixin.request_params = {}
-        mixin._url = Mock(return_value="https://pulp.example.com/api/v3/repositories/")
-        mixin._parse_response = Mock(return_value=RepositoryResponse(pulp_href="/test/", name="test-repo"))
+        mixin = make_mixin(url_return="https://pulp.example.com/api/v3/repositories/")
+        mixin._parse_response = Mock(return_value=_CREATED_REPO)
         httpx_mock.post("https://pulp.example.com/api/v3/repositories/").mock(
             return_value=httpx.Response(201, json={"pulp_href": "/test/", "name": "test-repo"})
         )
@@ -158,16 +146,10 @@ class TestBaseResourceMixin:
         assert isinstance(result, RepositoryResponse)
         assert result.name == "test-repo"
 
-    def test_update_resource(self, mock_config, httpx_mock) -> None:
+    def test_update_resource(self, make_mixin, httpx_mock) -> None:
         """Test _update_resource."""
-        from pulp_tool.models.pulp_api import RepositoryRequest
-
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin.session = httpx.Client()
-        mixin.timeout = 120
-        mixin.request_params = {}
-        mixin._parse_response = Mock(return_value=RepositoryResponse(pulp_href="/test/", name="test-repo-updated"))
+        mixin = make_mixin()
+        mixin._parse_response = Mock(return_value=_UPDATED_REPO)
         httpx_mock.patch("https://pulp.example.com/api/v3/repositories/test/").mock(
             return_value=httpx.Response(200, json={"pulp_href": "/test/", "name": "test-repo-updated"})
         )
@@ -176,14 +158,33 @@ class TestBaseResourceMixin:
         assert isinstance(result, RepositoryResponse)
         assert result.name == "test-repo-updated"
 
-    def test_delete_resource(self, mock_config, httpx_mock) -> None:
+    def test_delete_resource(self, make_mixin, httpx_mock) -> None:
         """Test _delete_resource."""
-        mixin = BaseResourceMixin()
-        mixin.config = mock_config
-        mixin.session = httpx.Client()
-        mixin.timeout = 120
-        mixin.request_params = {}
-        mixin._check_response = Mock()
+        mixin = make_mixin()
         httpx_mock.delete("https://pulp.example.com/api/v3/repositories/test/").mock(return_value=httpx.Response(204))
         mixin._delete_resource("/api/v3/repositories/test/", "delete repository")
         mixin._check_response.assert_called_once()
+
+    def test_get_resource_memoizes_name_lookup(self, make_mixin, httpx_mock) -> None:
+        """Test _get_resource caches name lookups and skips the second GET."""
+        mixin = make_mixin()
+        route = httpx_mock.get("https://pulp.example.com/api/v3/repositories/?name=test-repo&offset=0&limit=1").mock(
+            return_value=httpx.Response(200, json={"results": [{"pulp_href": "/test/", "name": "test-repo"}]})
+        )
+        first = mixin._get_resource("api/v3/repositories/", RepositoryResponse, name="test-repo")
+        second = mixin._get_resource("api/v3/repositories/", RepositoryResponse, name="test-repo")
+        assert first is second
+        assert route.call_count == 1
+        mixin.invalidate_resource_cache("api/v3/repositories/")
+        mixin._get_resource("api/v3/repositories/", RepositoryResponse, name="test-repo")
+        assert route.call_count == 2
+
+    def test_list_adapter_cached_per_model(self) -> None:
+        """Test the list TypeAdapter is built once per model class and reused."""
+        from pulp_tool.api.base import _list_adapter
+
+        first = _list_adapter(RepositoryResponse)
+        second = _list_adapter(RepositoryResponse)
+        assert first is second
+        validated = first.validate_python([{"pulp_href": "/test/", "name": "test-repo"}])
+        assert isinstance(validated[0], RepositoryResponse)
@@ -7,6 +7,25 @@ This module tests FileContentMixin methods that need coverage.
 import httpx
 from pulp_tool.models.pulp_api import FileResponse
 
+# Shared payloads built once at import instead of per test body; httpx.Response
+# serializes them on send and never mutates the dicts
+_FILE_RESULT_12345 = {
+    "pulp_href": "/api/v3/content/file/files/12345/",
+    "relative_path": "test.txt",
+    "artifact": "/api/v3/artifacts/12345/",
+}
+_FILE_RESULT_67890 = {
+    "pulp_href": "/api/v3/content/file/files/67890/",
+    "relative_path": "test2.txt",
+    "artifact": "/api/v3/artifacts/67890/",
+}
+_TWO_RESULT_PAYLOAD = {
+    "results": [_FILE_RESULT_12345, _FILE_RESULT_67890],
+    "next": None,
+    "previous": None,
+    "count": 2,
+}
+
 
 class TestFileContentMixin:
     """Test FileContentMixin methods."""
@@ -14,14 +33,7 @@ class TestFileContentMixin:
     def test_get_file_content(self, mock_pulp_client, httpx_mock) -> None:
         """Test get_file_content method."""
         httpx_mock.get("https://pulp.example.com/api/v3/content/file/files/12345/").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "pulp_href": "/api/v3/content/file/files/12345/",
-                    "relative_path": "test.txt",
-                    "artifact": "/api/v3/artifacts/12345/",
-                },
-            )
+            return_value=httpx.Response(200, json=_FILE_RESULT_12345)
         )
         result = mock_pulp_client.get_file_content("/api/v3/content/file/files/12345/")
         assert isinstance(result, FileResponse)
@@ -32,18 +44,7 @@ class TestFileContentMixin:
         httpx_mock.get("https://pulp.example.com/pulp/api/v3/test-domain/api/v3/content/file/files/?").mock(
             return_value=httpx.Response(
                 200,
-                json={
-                    "results": [
-                        {
-                            "pulp_href": "/api/v3/content/file/files/12345/",
-                            "relative_path": "test.txt",
-                            "artifact": "/api/v3/artifacts/12345/",
-                        }
-                    ],
-                    "next": None,
-                    "previous": None,
-                    "count": 1,
-                },
+                json={"results": [_FILE_RESULT_12345], "next": None, "previous": None, "count": 1},
             )
         )
         results, next_url, prev_url, count = mock_pulp_client.list_file_content()
@@ -55,28 +56,7 @@ class TestFileContentMixin:
         """Test find_content_by_build_id method."""
         httpx_mock.get(
             "https://pulp.example.com/pulp/api/v3/test-domain/api/v3/content/?pulp_label_select=build_id~test-build-123"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "results": [
-                        {
-                            "pulp_href": "/api/v3/content/file/files/12345/",
-                            "relative_path": "test.txt",
-                            "artifact": "/api/v3/artifacts/12345/",
-                        },
-                        {
-                            "pulp_href": "/api/v3/content/file/files/67890/",
-                            "relative_path": "test2.txt",
-                            "artifact": "/api/v3/artifacts/67890/",
-                        },
-                    ],
-                    "next": None,
-                    "previous": None,
-                    "count": 2,
-                },
-            )
-        )
+        ).mock(return_value=httpx.Response(200, json=_TWO_RESULT_PAYLOAD))
         results = mock_pulp_client.find_content_by_build_id("test-build-123")
         assert len(results) == 2
         assert isinstance(results[0], FileResponse)
@@ -87,34 +67,13 @@ class TestFileContentMixin:
         httpx_mock.get(
             "https://pulp.example.com/pulp/api/v3/test-domain/api/v3/content/"
             "?pulp_href__in=/api/v3/content/file/files/12345/,/api/v3/content/file/files/67890/"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "results": [
-                        {
-                            "pulp_href": "/api/v3/content/file/files/12345/",
-                            "relative_path": "test.txt",
-                            "artifact": "/api/v3/artifacts/12345/",
-                        },
-                        {
-                            "pulp_href": "/api/v3/content/file/files/67890/",
-                            "relative_path": "test2.txt",
-                            "artifact": "/api/v3/artifacts/67890/",
-                        },
-                    ],
-                    "next": None,
-                    "previous": None,
-                    "count": 2,
-                },
-            )
-        )
+        ).mock(return_value=httpx.Response(200, json=_TWO_RESULT_PAYLOAD))
         hrefs = ["/api/v3/content/file/files/12345/", "/api/v3/content/file/files/67890/"]
         results = mock_pulp_client.find_content_by_hrefs(hrefs)
         assert len(results) == 2
         assert isinstance(results[0], FileResponse)
 
-    def test_add_content_fallback(self, mock_pulp_client, httpx_mock) -> None:
+    def test_add_content_fallback(self, mock_pulp_client, mock_transport_client) -> None:
         """Test add_content fallback when get_task not available."""
         from pulp_tool.api.content.file_files import FileContentMixin
 
@@ -132,14 +91,12 @@ class TestFileContentMixin:
             def _check_response(self, response, operation) -> None:
                 pass
 
-        test_client = TestClient(mock_pulp_client.config, mock_pulp_client.session)
-        httpx_mock.post("https://pulp.example.com/api/v3/repositories/test/modify/").mock(
-            return_value=httpx.Response(202, json={"task": "/api/v3/tasks/12345/"})
-        )
-        httpx_mock.get("https://pulp.example.com/api/v3/tasks/12345/").mock(
-            return_value=httpx.Response(
-                200, json={"pulp_href": "/api/v3/tasks/12345/", "state": "completed", "result": {}}
-            )
+        session, register = mock_transport_client
+        test_client = TestClient(mock_pulp_client.config, session)
+        register(
+            "POST",
+            "https://pulp.example.com/api/v3/repositories/test/modify/",
+            httpx.Response(202, json={"task": "/api/v3/tasks/12345/"}),
         )
         artifacts = ["/api/v3/artifacts/12345/"]
         result = test_client.add_content("/api/v3/repositories/test/", artifacts)
@@ -152,3 +109,16 @@ class TestFileContentMixin:
 
         with pytest.raises(ValueError, match="Unsupported architecture"):
             FileContentMixin._build_file_relative_path("build.log", "../../tmp")
+
+    def test_get_file_contents_bulk_delegates_to_find_content_by_hrefs(self) -> None:
+        """Test get_file_contents_bulk coalesces hrefs into one filtered lookup."""
+        from unittest.mock import Mock
+
+        from pulp_tool.api.content.file_files import FileContentMixin
+
+        mixin = FileContentMixin()
+        mixin.find_content_by_hrefs = Mock(return_value=[])
+        hrefs = ["/api/v3/content/file/files/12345/"]
+        result = FileContentMixin.get_file_contents_bulk(mixin, hrefs)
+        assert result == []
+        mixin.find_content_by_hrefs.assert_called_once_with(hrefs)
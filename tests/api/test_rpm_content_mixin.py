@@ -120,3 +120,29 @@ class TestRpmPackageContentMixin:
         assert len(results) == 2
         assert isinstance(results[0], RpmPackageResponse)
         assert results[0].pkgId == "abcd1234"
+
+    def test_get_rpm_packages_bulk_uses_chunked_get(self, mock_pulp_client) -> None:
+        """Test get_rpm_packages_bulk fetches hrefs via chunked GET."""
+        from unittest.mock import Mock
+
+        mock_response = Mock()
+        mock_response.json = Mock(
+            return_value={
+                "results": [
+                    {
+                        "pulp_href": "/api/v3/content/rpm/packages/12345/",
+                        "name": "test-package",
+                        "version": "1.0",
+                        "release": "1",
+                        "arch": "x86_64",
+                        "sha256": "abc123",
+                    }
+                ]
+            }
+        )
+        mock_pulp_client._chunked_get = Mock(return_value=mock_response)
+        result = mock_pulp_client.get_rpm_packages_bulk(["/api/v3/content/rpm/packages/12345/"])
+        assert len(result) == 1
+        assert result[0].pkgId == "abc123"
+        call_args = mock_pulp_client._chunked_get.call_args
+        assert "pulp_href__in" in call_args[1]["params"]
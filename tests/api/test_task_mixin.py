@@ -33,8 +33,8 @@ class TestTaskMixin:
 
         with (
             patch("time.sleep"),
-            patch("time.time", side_effect=mock_time),
-            patch("pulp_tool.api.tasks.operations.logging") as mock_logging,
+            patch("time.monotonic", side_effect=mock_time),
+            patch("pulp_tool.api.tasks.operations.logger") as mock_logging,
         ):
             result = mock_pulp_client.wait_for_finished_task("/api/v3/tasks/12345/", timeout=1)
             assert mock_pulp_client.get_task.call_count >= 1
@@ -94,9 +94,104 @@ class TestTaskMixin:
 
         with (
             patch("time.sleep"),
-            patch("time.time", side_effect=mock_time),
-            patch("pulp_tool.api.tasks.operations.logging") as mock_logging,
+            patch("time.monotonic", side_effect=mock_time),
+            patch("pulp_tool.api.tasks.operations.logger") as mock_logging,
         ):
             with pytest.raises(TimeoutError, match="Timed out waiting for task"):
                 mock_pulp_client.wait_for_finished_task("/api/v3/tasks/12345/", timeout=1)
             mock_logging.error.assert_called()
+
+    def test_get_tasks_bulk(self, mock_pulp_client, httpx_mock) -> None:
+        """Test get_tasks_bulk coalesces task hrefs into one pulp_href__in query."""
+        httpx_mock.get("https://pulp.example.com/pulp/api/v3/test-domain/api/v3/tasks/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"pulp_href": "/api/v3/tasks/12345/", "state": "completed", "result": {}},
+                        {"pulp_href": "/api/v3/tasks/67890/", "state": "completed", "result": {}},
+                    ],
+                    "next": None,
+                    "previous": None,
+                    "count": 2,
+                },
+            )
+        )
+        results = mock_pulp_client.get_tasks_bulk(["/api/v3/tasks/12345/", "/api/v3/tasks/67890/"])
+        assert len(results) == 2
+        assert all(isinstance(task, TaskResponse) for task in results)
+
+    def test_wait_for_finished_tasks_single_poll(self, mock_pulp_client, httpx_mock) -> None:
+        """Test wait_for_finished_tasks resolves all hrefs from one list query per poll."""
+        route = httpx_mock.get("https://pulp.example.com/pulp/api/v3/test-domain/api/v3/tasks/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"pulp_href": "/api/v3/tasks/67890/", "state": "completed", "result": {}},
+                        {"pulp_href": "/api/v3/tasks/12345/", "state": "completed", "result": {}},
+                    ],
+                    "next": None,
+                    "previous": None,
+                    "count": 2,
+                },
+            )
+        )
+        with patch("time.sleep"):
+            results = mock_pulp_client.wait_for_finished_tasks(
+                ["/api/v3/tasks/12345/", "/api/v3/tasks/67890/"], timeout=10
+            )
+        assert route.call_count == 1
+        # Results come back in input order regardless of server ordering
+        assert [task.pulp_href for task in results] == ["/api/v3/tasks/12345/", "/api/v3/tasks/67890/"]
+        assert all(task.state == "completed" for task in results)
+
+    def test_wait_for_tasks_concurrent(self, mock_pulp_client, httpx_mock) -> None:
+        """Test wait_for_tasks resolves multiple hrefs concurrently via the async session."""
+        httpx_mock.get("https://pulp.example.com/api/v3/tasks/12345/").mock(
+            return_value=httpx.Response(
+                200, json={"pulp_href": "/api/v3/tasks/12345/", "state": "completed", "result": {}}
+            )
+        )
+        httpx_mock.get("https://pulp.example.com/api/v3/tasks/67890/").mock(
+            return_value=httpx.Response(
+                200, json={"pulp_href": "/api/v3/tasks/67890/", "state": "completed", "result": {}}
+            )
+        )
+        results = mock_pulp_client.wait_for_tasks(["/api/v3/tasks/12345/", "/api/v3/tasks/67890/"], timeout=10)
+        assert [task.pulp_href for task in results] == ["/api/v3/tasks/12345/", "/api/v3/tasks/67890/"]
+        assert all(task.state == "completed" for task in results)
+
+    def test_wait_for_tasks_empty(self, mock_pulp_client) -> None:
+        """Test wait_for_tasks with no hrefs returns immediately."""
+        assert mock_pulp_client.wait_for_tasks([]) == []
+
+    def test_wait_for_finished_tasks_empty(self, mock_pulp_client) -> None:
+        """Test wait_for_finished_tasks with no hrefs returns immediately."""
+        assert mock_pulp_client.wait_for_finished_tasks([]) == []
+
+    def test_next_poll_interval_adapts_to_progress(self) -> None:
+        """Test _next_poll_interval resets to the fast interval near completion."""
+        from pulp_tool.api.tasks.operations import (
+            TASK_INITIAL_SLEEP_INTERVAL,
+            TASK_MAX_SLEEP_INTERVAL,
+            _next_poll_interval,
+        )
+
+        nearly_done = TaskResponse(
+            pulp_href="/api/v3/tasks/12345/",
+            state="running",
+            progress_reports=[{"done": 95, "total": 100}],
+        )
+        assert _next_poll_interval(nearly_done, 20.0) == TASK_INITIAL_SLEEP_INTERVAL
+
+        early = TaskResponse(
+            pulp_href="/api/v3/tasks/12345/",
+            state="running",
+            progress_reports=[{"done": 5, "total": 100}],
+        )
+        assert _next_poll_interval(early, 20.0) == TASK_MAX_SLEEP_INTERVAL
+        assert _next_poll_interval(early, 100.0) == TASK_MAX_SLEEP_INTERVAL
+
+        no_reports = TaskResponse(pulp_href="/api/v3/tasks/12345/", state="running")
+        assert _next_poll_interval(no_reports, 2.0) == 4.0
@@ -22,6 +22,23 @@ from tests.support.tls_certs import write_self_signed_pem_pair
 _temp_file_registry: set[str] = set()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def prewarm_pydantic_schemas():
+    """
+    Build the hot pydantic core schemas once, before any test runs.
+
+    Pydantic compiles a model's validator/serializer lazily on first use;
+    without this, whichever test happens to validate RepositoryResponse or
+    FileResponse first pays that compile cost and skews timings. One
+    throwaway validation per hot model keeps per-test times uniform.
+    """
+    from pulp_tool.models.pulp_api import FileResponse, RepositoryRequest, RepositoryResponse
+
+    RepositoryRequest(name="prewarm")
+    RepositoryResponse(pulp_href="/prewarm/", name="prewarm")
+    FileResponse(pulp_href="/prewarm/", relative_path="prewarm", artifact="/prewarm/artifact/")
+
+
 @pytest.fixture(autouse=True)
 def production_respx_expects_single_http_transport_attempt(monkeypatch) -> None:
     """
@@ -98,6 +115,47 @@ def mock_config(tmp_path_factory) -> None:
     }
 
 
+@pytest.fixture(scope="class")
+def shared_client():
+    """
+    One httpx.Client shared by every test in a class.
+
+    Client construction builds a connection pool and SSL context per call;
+    tests that mock HTTP traffic (respx) never open real sockets, so the
+    same client can be reused safely instead of rebuilding it per test.
+    """
+    client = httpx.Client()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def mock_transport_client():
+    """
+    httpx.Client backed by a dict-dispatch MockTransport.
+
+    Routes are keyed on (method, exact URL), so each mocked request is one
+    dict lookup instead of respx's scan over registered patterns. Use for
+    tests that hit a few known exact URLs and build their own client;
+    tests exercising PulpClient's real session keep the respx fixture.
+
+    Yields:
+        Tuple of (client, register) where register(method, url, response)
+        installs a route.
+    """
+    routes: dict[tuple[str, str], httpx.Response] = {}
+
+    def register(method: str, url: str, response: httpx.Response) -> None:
+        routes[(method.upper(), url)] = response
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return routes[(request.method, str(request.url))]
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    yield client, register
+    client.close()
+
+
 @pytest.fixture
 def httpx_mock():
     """Provide respx mock for HTTP mocking."""
@@ -2,6 +2,8 @@
 
 from types import SimpleNamespace
 from unittest.mock import patch
+
+import pytest
 from pulp_tool.models.artifacts import ArtifactMetadata
 from pulp_tool.utils.artifact_detection import (
     _embedded_artifact_url,
@@ -12,6 +14,8 @@ from pulp_tool.utils.artifact_detection import (
     detect_artifact_type,
     extract_architecture_from_metadata,
     group_rpm_paths_by_arch,
+    group_rpm_paths_by_arch_iter,
+    group_log_paths_by_arch,
     rpm_packages_letter_and_basename,
 )
 
@@ -268,6 +272,36 @@ class TestCategorizeArtifactsByType:
         assert ("package.rpm", "https://example.com/rpms/Packages/p/package.rpm", "x86_64", "rpm") in result
         assert ("build.log", "https://example.com/logs/build.log", "noarch", "log") in result
 
+    def test_categorize_soa_layout(self) -> None:
+        """SoA layout returns parallel lists keyed by column name."""
+        artifacts = {
+            "package.rpm": ArtifactMetadata(labels={"arch": "x86_64"}),
+            "build.log": ArtifactMetadata(labels={"arch": "noarch"}),
+        }
+        distros = {"rpms": "https://example.com/rpms/", "logs": "https://example.com/logs/"}
+        result = categorize_artifacts_by_type(artifacts, distros, return_layout="soa")
+        assert result == {
+            "names": ["package.rpm", "build.log"],
+            "urls": [
+                "https://example.com/rpms/Packages/p/package.rpm",
+                "https://example.com/logs/build.log",
+            ],
+            "archs": ["x86_64", "noarch"],
+            "types": ["rpm", "log"],
+        }
+
+    def test_categorize_soa_layout_empty(self) -> None:
+        """SoA layout with no matching artifacts yields empty columns."""
+        result = categorize_artifacts_by_type({}, {}, return_layout="soa")
+        assert result == {"names": [], "urls": [], "archs": [], "types": []}
+
+    def test_categorize_invalid_return_layout(self) -> None:
+        """Unknown return_layout values are rejected."""
+        with pytest.raises(ValueError, match="Unsupported return_layout"):
+            # The overloads (rightly) reject this literal; the test passes it
+            # on purpose to exercise the runtime guard
+            categorize_artifacts_by_type({}, {}, return_layout="columnar")  # type: ignore[call-overload]
+
     def test_categorize_embedded_urls_only_skips_without_url(self) -> None:
         """Pull mode: no synthesized URL from distributions when url is missing."""
         artifacts = {"package.rpm": ArtifactMetadata(labels={"arch": "x86_64"})}
@@ -386,3 +420,33 @@ class TestGroupRpmPathsByArch:
         """Test that empty input returns empty dict."""
         assert group_rpm_paths_by_arch([]) == {}
         assert group_rpm_paths_by_arch([], explicit_arch="x86_64") == {}
+
+    def test_iter_yields_same_groups(self) -> None:
+        """Test that the iterator wrapper yields the grouped batches in order."""
+        paths = ["/path/to/x86_64/package.rpm", "/path/to/package-1.0.0-1.aarch64.rpm"]
+        result = list(group_rpm_paths_by_arch_iter(paths))
+        assert result == [
+            ("x86_64", ["/path/to/x86_64/package.rpm"]),
+            ("aarch64", ["/path/to/package-1.0.0-1.aarch64.rpm"]),
+        ]
+
+
+class TestGroupLogPathsByArch:
+    """Tests for group_log_paths_by_arch function."""
+
+    def test_groups_and_returns_undetected(self) -> None:
+        """Detected logs are grouped; undetected paths come back instead of warning."""
+        paths = ["/results/x86_64/build.log", "/results/aarch64/build.log", "/results/build.log"]
+        groups, undetected = group_log_paths_by_arch(paths)
+        assert groups == {
+            "x86_64": ["/results/x86_64/build.log"],
+            "aarch64": ["/results/aarch64/build.log"],
+        }
+        assert undetected == ["/results/build.log"]
+
+    def test_explicit_arch_applies_to_all(self) -> None:
+        """explicit_arch assigns every path, leaving nothing undetected."""
+        paths = ["/results/a.log", "/results/b.log"]
+        groups, undetected = group_log_paths_by_arch(paths, explicit_arch="s390x")
+        assert groups == {"s390x": ["/results/a.log", "/results/b.log"]}
+        assert undetected == []
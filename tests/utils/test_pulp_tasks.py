@@ -2,7 +2,7 @@
 
 import httpx
 import pytest
-from pulp_tool.utils.pulp_tasks import create_file_content_and_wait
+from pulp_tool.utils.pulp_tasks import create_file_content_and_wait, create_file_contents_and_wait
 from pulp_tool.models.pulp_api import TaskResponse
 
 
@@ -29,6 +29,47 @@ def test_create_file_content_and_wait(mock_pulp_client, httpx_mock) -> None:
     assert task.state == "completed"
 
 
+def test_create_file_contents_and_wait_batches_task_wait(mock_pulp_client, httpx_mock, tmp_path) -> None:
+    """POST every file first, then resolve all tasks from one batched wait."""
+    log_a = tmp_path / "a.log"
+    log_b = tmp_path / "b.log"
+    log_a.write_text("a")
+    log_b.write_text("b")
+    post_route = httpx_mock.post("https://pulp.example.com/pulp/api/v3/test-domain/api/v3/content/file/files/").mock(
+        side_effect=[
+            httpx.Response(202, json={"task": "/pulp/api/v3/tasks/abc/"}),
+            httpx.Response(202, json={"task": "/pulp/api/v3/tasks/def/"}),
+        ]
+    )
+    httpx_mock.get("https://pulp.example.com/pulp/api/v3/test-domain/api/v3/tasks/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"pulp_href": "/pulp/api/v3/tasks/abc/", "state": "completed", "result": {}},
+                    {"pulp_href": "/pulp/api/v3/tasks/def/", "state": "completed", "result": {}},
+                ],
+                "next": None,
+                "previous": None,
+                "count": 2,
+            },
+        )
+    )
+    tasks = create_file_contents_and_wait(
+        mock_pulp_client,
+        "logs-prn",
+        [str(log_a), str(log_b)],
+        build_id="b1",
+        pulp_label={"build_id": "b1"},
+        arch="x86_64",
+        operation="upload log",
+    )
+    assert post_route.call_count == 2
+    # Results come back in upload order regardless of server ordering
+    assert [task.pulp_href for task in tasks] == ["/pulp/api/v3/tasks/abc/", "/pulp/api/v3/tasks/def/"]
+    assert all(task.state == "completed" for task in tasks)
+
+
 def test_create_file_content_and_wait_http_error(mock_pulp_client, httpx_mock) -> None:
     httpx_mock.post("https://pulp.example.com/pulp/api/v3/test-domain/api/v3/content/file/files/").mock(
         return_value=httpx.Response(500, text="no")
@@ -165,7 +165,10 @@ class TestRPMUtilities:
         )
         results_model = PulpResultsModel(build_id="test-build", repositories=repositories)
         with (
-            patch("glob.glob", return_value=[temp_rpm_file]),
+            patch(
+                "pulp_tool.utils.uploads.find_files_by_suffixes",
+                return_value={".rpm": [temp_rpm_file], ".log": []},
+            ),
             patch(
                 "pulp_tool.utils.uploads.upload_rpms_parallel",
                 return_value=([(temp_rpm_file, "/pulp/api/v3/content/rpm/packages/12345/")], []),
@@ -179,6 +182,9 @@ class TestRPMUtilities:
             mock_wait.return_value = TaskResponse(
                 pulp_href="/tasks/1/", state="completed", created_resources=["/resource/1"]
             )
+            mock_pulp_client.wait_for_finished_tasks = Mock(
+                return_value=[TaskResponse(pulp_href="/pulp/api/v3/tasks/12345/", state="completed", result={})]
+            )
             result = upload_rpms_logs(
                 os.path.dirname(temp_rpm_file),
                 args,
@@ -210,7 +216,7 @@ class TestRPMUtilities:
             artifacts_prn="artifacts-prn",
         )
         results_model = PulpResultsModel(build_id="test-build", repositories=repositories)
-        with patch("glob.glob", return_value=[]):
+        with patch("pulp_tool.utils.uploads.find_files_by_suffixes", return_value={".rpm": [], ".log": []}):
             result = upload_rpms_logs(
                 temp_dir,
                 args,
@@ -244,7 +250,10 @@ class TestRPMUtilities:
         results_model = PulpResultsModel(build_id="test-build", repositories=repositories)
         rpm_path = os.path.join(temp_dir, "pkg.rpm")
         log_path = os.path.join(temp_dir, "x.log")
-        with patch("glob.glob", side_effect=[[rpm_path], [log_path]]):
+        with patch(
+            "pulp_tool.utils.uploads.find_files_by_suffixes",
+            return_value={".rpm": [rpm_path], ".log": [log_path]},
+        ):
             with pytest.raises(ValueError, match="logs repository PRN"):
                 upload_rpms_logs(
                     temp_dir,
@@ -270,3 +279,29 @@ class TestRPMUtilities:
         assert errors == []
         assert result[0][0] == temp_rpm_file
         assert result[0][1] == "/pulp/api/v3/content/rpm/packages/12345/"
+
+
+class TestFindFilesBySuffixes:
+    """Tests for find_files_by_suffixes helper."""
+
+    def test_find_files_by_suffixes(self, temp_dir) -> None:
+        """One scan returns matches per suffix, skipping non-matches and directories."""
+        from pulp_tool.utils.uploads import find_files_by_suffixes
+
+        rpm_path = os.path.join(temp_dir, "pkg.rpm")
+        log_path = os.path.join(temp_dir, "build.log")
+        other_path = os.path.join(temp_dir, "notes.txt")
+        for path in (rpm_path, log_path, other_path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("x")
+        os.makedirs(os.path.join(temp_dir, "dir.rpm"))
+
+        result = find_files_by_suffixes(temp_dir, (".rpm", ".log"))
+        assert result == {".rpm": [rpm_path], ".log": [log_path]}
+
+    def test_find_files_by_suffixes_missing_directory(self) -> None:
+        """Missing directory yields empty lists instead of raising."""
+        from pulp_tool.utils.uploads import find_files_by_suffixes
+
+        result = find_files_by_suffixes("/nonexistent/path", (".rpm",))
+        assert result == {".rpm": []}
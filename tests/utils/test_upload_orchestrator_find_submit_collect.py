@@ -22,8 +22,8 @@ class TestUploadOrchestratorFindExistingArchitectures:
             os.makedirs(os.path.join(tmpdir, "x86_64"))
             os.makedirs(os.path.join(tmpdir, "aarch64"))
             result = orchestrator._find_existing_architectures(tmpdir)
-            assert "x86_64" in result
-            assert "aarch64" in result
+            assert ("x86_64", os.path.join(tmpdir, "x86_64")) in result
+            assert ("aarch64", os.path.join(tmpdir, "aarch64")) in result
 
     def test_find_existing_architectures_skips_non_existent(self) -> None:
         """Test _find_existing_architectures skips non-existent paths (lines 52-53)."""
@@ -32,7 +32,7 @@ class TestUploadOrchestratorFindExistingArchitectures:
             os.makedirs(os.path.join(tmpdir, "x86_64"))
             with patch("pulp_tool.utils.upload_orchestrator.logging") as mock_logging:
                 result = orchestrator._find_existing_architectures(tmpdir)
-                assert "x86_64" in result
+                assert ("x86_64", os.path.join(tmpdir, "x86_64")) in result
                 debug_calls = [str(call) for call in mock_logging.debug.call_args_list]
                 assert any(("Skipping" in str(call) for call in debug_calls))
 
@@ -54,8 +54,8 @@ class TestUploadOrchestratorSubmitArchitectureTasks:
         mock_future1 = Mock()
         mock_future2 = Mock()
         mock_executor.submit.side_effect = [mock_future1, mock_future2]
-        existing_archs = ["x86_64", "aarch64"]
         rpm_path = "/test/rpms"
+        existing_archs = [(arch, os.path.join(rpm_path, arch)) for arch in ("x86_64", "aarch64")]
         args = UploadRpmContext(
             build_id="test-build",
             date_str="2024-01-01 00:00:00",
@@ -82,10 +82,9 @@ class TestUploadOrchestratorSubmitArchitectureTasks:
             ),
         )
         with patch("pulp_tool.utils.upload_orchestrator.upload_rpms_logs"):
-            future_to_arch = orchestrator._submit_architecture_tasks(
+            submitted = orchestrator._submit_architecture_tasks(
                 mock_executor,
                 existing_archs,
-                rpm_path,
                 args,
                 mock_client,
                 rpm_href,
@@ -94,10 +93,8 @@ class TestUploadOrchestratorSubmitArchitectureTasks:
                 results_model,
                 {},
             )
-            assert len(future_to_arch) == 2
             assert mock_executor.submit.call_count == 2
-            assert mock_future1 in future_to_arch
-            assert mock_future2 in future_to_arch
+            assert submitted == [(mock_future1, "x86_64"), (mock_future2, "aarch64")]
 
 
 class TestUploadOrchestratorCollectArchitectureResults:
@@ -114,9 +111,9 @@ class TestUploadOrchestratorCollectArchitectureResults:
         mock_result2 = RpmUploadResult(uploaded_rpms=["x", "y", "z"], created_resources=["/resource/3"])
         mock_future1.set_result(mock_result1)
         mock_future2.set_result(mock_result2)
-        future_to_arch = {mock_future1: "x86_64", mock_future2: "aarch64"}
+        submitted = [(mock_future1, "x86_64"), (mock_future2, "aarch64")]
         with patch("pulp_tool.utils.upload_orchestrator.logging") as mock_logging:
-            result = orchestrator._collect_architecture_results(future_to_arch)
+            result = orchestrator._collect_architecture_results(submitted)
             assert "x86_64" in result
             assert "aarch64" in result
             assert len(result["x86_64"].uploaded_rpms) == 5
@@ -130,10 +127,10 @@ class TestUploadOrchestratorCollectArchitectureResults:
         orchestrator = UploadOrchestrator()
         mock_future: Future[Any] = Future()
         mock_future.set_exception(ValueError("Upload failed"))
-        future_to_arch = {mock_future: "x86_64"}
+        submitted = [(mock_future, "x86_64")]
         with patch("pulp_tool.utils.upload_orchestrator.handle_generic_error") as mock_handle_error:
             with pytest.raises(ValueError, match="Upload failed"):
-                orchestrator._collect_architecture_results(future_to_arch)
+                orchestrator._collect_architecture_results(submitted)
             mock_handle_error.assert_called_once()
             assert mock_handle_error.call_args[0][1] == "process architecture x86_64"
 
@@ -143,8 +140,8 @@ class TestUploadOrchestratorCollectArchitectureResults:
         mock_future: Future[Any] = Future()
         mock_result = RpmUploadResult(uploaded_rpms=["p"] * 5, created_resources=[])
         mock_future.set_result(mock_result)
-        future_to_arch = {mock_future: "x86_64"}
+        submitted = [(mock_future, "x86_64")]
         with patch("pulp_tool.utils.upload_orchestrator.logging") as mock_logging:
-            orchestrator._collect_architecture_results(future_to_arch)
+            orchestrator._collect_architecture_results(submitted)
             debug_calls = [str(call) for call in mock_logging.debug.call_args_list]
             assert any(("Processed architectures" in str(call) for call in debug_calls))
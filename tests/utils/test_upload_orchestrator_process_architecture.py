@@ -94,10 +94,9 @@ class TestUploadOrchestratorProcessArchitectureUploads:
             done = RpmUploadResult(uploaded_rpms=[], created_resources=[])
             with patch("pulp_tool.utils.upload_orchestrator.upload_rpms_logs", return_value=done) as mock_upload:
                 with ThreadPoolExecutor(max_workers=1) as executor:
-                    future_to_arch = orchestrator._submit_architecture_tasks(
+                    submitted = orchestrator._submit_architecture_tasks(
                         executor,
-                        ["x86_64"],
-                        tmpdir,
+                        [("x86_64", os.path.join(tmpdir, "x86_64"))],
                         args,
                         mock_client,
                         "/bulk-ignored",
@@ -108,7 +107,7 @@ class TestUploadOrchestratorProcessArchitectureUploads:
                         pulp_helper=mock_helper,
                         target_arch_repo=True,
                     )
-                    for fut in future_to_arch:
+                    for fut, _arch in submitted:
                         fut.result()
             mock_helper.ensure_rpm_repository_for_arch.assert_called_once_with("test-build", "x86_64")
             mock_upload.assert_called_once()
@@ -56,9 +56,53 @@ class TestUploadOrchestratorProcessFileUploads:
             mock_task_response = Mock()
             mock_task_response.created_resources = ["/file/resource/1"]
             mock_wait.return_value = mock_task_response
+            mock_client.wait_for_finished_tasks.return_value = [mock_task_response]
             result = orchestrator.process_file_uploads(mock_client, context, repositories)
             assert result == "https://example.com/results.json"
             assert mock_create.called
+            mock_client.wait_for_finished_tasks.assert_called_once_with(["/api/v3/tasks/123/"])
+
+    def test_process_file_uploads_many_files_through_pool(self) -> None:
+        """Test every generic file is POSTed through the pool with one batched task wait."""
+        orchestrator = UploadOrchestrator()
+        context = UploadFilesContext(
+            build_id="test-build",
+            date_str="2024-01-01 00:00:00",
+            namespace="test-ns",
+            parent_package="test-pkg",
+            file_files=[f"/path/to/file{i}.txt" for i in range(6)],
+            upload_concurrency=2,
+        )
+        mock_client = Mock()
+        repositories = RepositoryRefs(
+            rpms_href="",
+            rpms_prn="",
+            logs_href="",
+            logs_prn="",
+            sbom_href="",
+            sbom_prn="",
+            artifacts_href="",
+            artifacts_prn="artifacts-prn",
+        )
+        with (
+            patch("pulp_tool.utils.pulp_helper.PulpHelper") as mock_ph_cls,
+            patch("pulp_tool.services.upload_service.collect_results", return_value="https://example.com/results.json"),
+            patch("pulp_tool.utils.upload_orchestrator.create_labels"),
+            patch("pulp_tool.utils.upload_orchestrator.validate_file_path"),
+        ):
+            mock_ph_cls.return_value.get_distribution_urls_for_upload_context.return_value = (
+                _PROCESS_FILE_UPLOAD_DIST_URLS
+            )
+            mock_response = Mock()
+            mock_response.json.return_value = {"task": "/api/v3/tasks/123/"}
+            mock_client.create_file_content.return_value = mock_response
+            mock_task_response = Mock()
+            mock_task_response.created_resources = ["/file/resource/1"]
+            mock_client.wait_for_finished_tasks.return_value = [mock_task_response] * 6
+            result = orchestrator.process_file_uploads(mock_client, context, repositories)
+            assert result == "https://example.com/results.json"
+            assert mock_client.create_file_content.call_count == 6
+            mock_client.wait_for_finished_tasks.assert_called_once_with(["/api/v3/tasks/123/"] * 6)
 
     def test_process_file_uploads_rpms_with_arch_detection(self) -> None:
         """Test process_file_uploads with RPMs requiring architecture detection."""
@@ -192,10 +192,13 @@ class TestUploadOrchestratorProcessUploads:
         with (
             patch("pulp_tool.utils.pulp_helper.PulpHelper") as mock_ph_cls,
             patch.object(orchestrator, "process_architecture_uploads", return_value=mock_processed_uploads),
-            patch("pulp_tool.utils.upload_orchestrator.glob.glob", return_value=root_rpm_files),
-            patch("pulp_tool.utils.upload_orchestrator.os.path.isfile", return_value=True),
             patch(
-                "pulp_tool.utils.upload_orchestrator.group_rpm_paths_by_arch", return_value={"noarch": root_rpm_files}
+                "pulp_tool.utils.upload_orchestrator.find_files_by_suffixes",
+                return_value={".rpm": root_rpm_files},
+            ),
+            patch(
+                "pulp_tool.utils.upload_orchestrator.group_rpm_paths_by_arch_iter",
+                return_value=iter([("noarch", root_rpm_files)]),
             ),
             patch(
                 "pulp_tool.utils.upload_orchestrator.upload_rpms", return_value=["/rpm/resource/1"]
@@ -251,10 +254,13 @@ class TestUploadOrchestratorProcessUploads:
         root_rpm_files = ["/test/rpms/pkg.noarch.rpm"]
         with (
             patch.object(orchestrator, "process_architecture_uploads", return_value=mock_processed_uploads),
-            patch("pulp_tool.utils.upload_orchestrator.glob.glob", return_value=root_rpm_files),
-            patch("pulp_tool.utils.upload_orchestrator.os.path.isfile", return_value=True),
             patch(
-                "pulp_tool.utils.upload_orchestrator.group_rpm_paths_by_arch", return_value={"noarch": root_rpm_files}
+                "pulp_tool.utils.upload_orchestrator.find_files_by_suffixes",
+                return_value={".rpm": root_rpm_files},
+            ),
+            patch(
+                "pulp_tool.utils.upload_orchestrator.group_rpm_paths_by_arch_iter",
+                return_value=iter([("noarch", root_rpm_files)]),
             ),
             patch(
                 "pulp_tool.utils.upload_orchestrator.upload_rpms", return_value=["/rpm/resource/1"]
@@ -337,3 +343,32 @@ class TestUploadOrchestratorProcessUploads:
             result = orchestrator.process_uploads(mock_client, args, repositories)
         assert result == "https://example.com/results-from-json.json"
         mock_from_json.assert_called_once_with(mock_client, args, repositories, pulp_helper=None)
+
+
+class TestUploadOrchestratorSharedPool:
+    """Tests for the orchestrator's long-lived shared thread pool."""
+
+    def test_shared_executor_reused_across_calls(self) -> None:
+        """_get_executor returns the same pool on every call."""
+        orchestrator = UploadOrchestrator()
+        try:
+            executor = orchestrator._get_executor()
+            assert orchestrator._get_executor() is executor
+        finally:
+            orchestrator.close()
+
+    def test_close_shuts_down_pool_and_is_idempotent(self) -> None:
+        """close() shuts the pool down and can be called repeatedly."""
+        orchestrator = UploadOrchestrator(max_workers=2)
+        executor = orchestrator._get_executor()
+        orchestrator.close()
+        assert orchestrator._executor is None
+        orchestrator.close()
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+    def test_context_manager_closes_pool(self) -> None:
+        """Using the orchestrator as a context manager closes the pool."""
+        with UploadOrchestrator(max_workers=1) as orchestrator:
+            orchestrator._get_executor()
+        assert orchestrator._executor is None